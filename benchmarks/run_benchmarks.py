@@ -0,0 +1,396 @@
+"""Benchmarks the requester, scripts and reports against a local MockOdin.
+
+Results are written as JSON so runs of different versions can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py --sizes small medium
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/2.3.0.json benchmarks/results/2.4.0.json
+
+The requester cases send --requests GETs under different concurrency and rate limiter
+settings and report requests per second. The script and report cases run each against
+a synthetic enterprise of every size given, reporting wall time (best and median of
+--repeat runs) and peak memory traced by tracemalloc in one extra run.
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib import metadata
+
+from odins_spear import API, Reporter, Scripter
+from odins_spear.testing import MockOdin, generate_enterprise
+from odins_spear.utils import MetricsCollector
+
+BASE_URL = "https://odin.test/api/v2"
+
+# name: API kwargs, "server" holds MockOdin kwargs e.g. a server side rate limit
+REQUESTER_CASES = {
+    "concurrency-1": {"max_concurrent_requests": 1},
+    "concurrency-10": {"max_concurrent_requests": 10},
+    "concurrency-100": {"max_concurrent_requests": 100},
+    "concurrency-unlimited": {"max_concurrent_requests": None},
+    "rate-limit-100": {
+        "rate_limit": True,
+        "rate_limit_per_second": 100.0,
+        "rate_limit_burst": 10,
+    },
+    "adaptive-rate-limit": {
+        "rate_limit": True,
+        "adaptive_rate_limit": True,
+        "rate_limit_per_second": 50.0,
+        "rate_limit_max_per_second": 500.0,
+    },
+    "server-rate-limit-200": {
+        "max_concurrent_requests": 100,
+        "server": {"rate_limit": 200.0, "burst": 20},
+    },
+}
+
+
+def script_cases(enterprise) -> dict:
+    """Scripts and reports benchmarked, name: coroutine function taking an API."""
+
+    service_provider_id = enterprise.service_provider_id
+    group_id = enterprise.group_ids()[0]
+    hunt_group = next(
+        hg for hg in enterprise.hunt_groups.values() if hg["groupId"] == group_id
+    )
+    # a user alias is searched for last, the slowest lookup
+    alias = next(
+        user["aliases"][0].split("@")[0]
+        for user in reversed(list(enterprise.users.values()))
+        if user["groupId"] == group_id and user["aliases"]
+    )
+
+    async def group_audit(api):
+        return await Scripter(api).group_audit(
+            service_provider_id=service_provider_id, group_id=group_id
+        )
+
+    async def find_alias(api):
+        return await Scripter(api).find_alias(
+            service_provider_id=service_provider_id, group_id=group_id, alias=alias
+        )
+
+    async def service_provider_trunking_capacity(api):
+        return await Scripter(api).service_provider_trunking_capacity(
+            service_provider_id=service_provider_id
+        )
+
+    async def call_flow(api):
+        return await _resolve(
+            Reporter(api).call_flow(
+                service_provider_id=service_provider_id,
+                group_id=group_id,
+                number=hunt_group["serviceInstanceProfile"]["phoneNumber"],
+                number_type="dn",
+                broadworks_entity_type="hunt_group",
+            )
+        )
+
+    async def group_users_call_statistics(api):
+        return await _resolve(
+            Reporter(api).group_users_call_statistics(
+                service_provider_id=service_provider_id,
+                group_id=group_id,
+                start_date="2024-01-01",
+            )
+        )
+
+    return {
+        "group_audit": group_audit,
+        "find_alias": find_alias,
+        "call_flow": call_flow,
+        "service_provider_trunking_capacity": service_provider_trunking_capacity,
+        "group_users_call_statistics": group_users_call_statistics,
+    }
+
+
+async def _resolve(result):
+    # reports are run synchronously or awaited depending on the version benchmarked
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+def _logger() -> logging.Logger:
+    logger = logging.getLogger("odins_spear.benchmarks")
+    logger.setLevel(logging.CRITICAL)
+    logger.propagate = False
+    return logger
+
+
+def _api(server: MockOdin, **kwargs) -> API:
+    return API(
+        BASE_URL,
+        "benchmark",
+        "password",
+        logger=_logger(),
+        transport=server.transport(),
+        **kwargs,
+    )
+
+
+async def bench_requester(name: str, settings: dict, enterprise, args) -> dict:
+    """Sends args.requests GETs at once and times them."""
+
+    settings = dict(settings)
+    server = MockOdin(
+        enterprise,
+        latency=args.latency,
+        jitter=args.jitter,
+        **settings.pop("server", {}),
+    )
+    metrics = MetricsCollector()
+    group_ids = enterprise.group_ids()
+    failures = 0
+
+    async with _api(
+        server, metrics=metrics, coalesce_requests=False, **settings
+    ) as api:
+        await api._authenticate()
+        metrics.reset()
+
+        async def one(index):
+            nonlocal failures
+            try:
+                await api.groups.get_group(
+                    enterprise.service_provider_id, group_ids[index % len(group_ids)]
+                )
+            except Exception:
+                failures += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(index) for index in range(args.requests)))
+        seconds = time.perf_counter() - start
+
+    collected = metrics.to_dict()
+    return {
+        "name": name,
+        "settings": settings,
+        "requests": args.requests,
+        "failures": failures,
+        "seconds": round(seconds, 4),
+        "requests_per_second": round(args.requests / seconds, 1),
+        "sent": collected["requests"],
+        "throttled": server.throttled,
+        "latency": next(iter(collected["endpoints"].values()), {}).get("latency"),
+        "waits": collected["waits"],
+    }
+
+
+async def bench_script(name: str, size: str, run, enterprise, args) -> dict:
+    """Times args.repeat runs of a script or report, then traces one for peak memory."""
+
+    result = {"name": name, "size": size}
+
+    async def once(traced: bool):
+        server = MockOdin(enterprise, latency=args.latency, jitter=args.jitter)
+        async with _api(server, max_concurrent_requests=args.concurrency) as api:
+            await api._authenticate()
+            if traced:
+                tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                await run(api)
+            finally:
+                seconds = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1] if traced else None
+                if traced:
+                    tracemalloc.stop()
+        return seconds, peak, server.metrics()["requests"]
+
+    try:
+        timings = [(await once(traced=False))[0] for _ in range(args.repeat)]
+        _, peak, requests = await once(traced=True)
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+        return result
+
+    result.update(
+        seconds=round(min(timings), 4),
+        median_seconds=round(statistics.median(timings), 4),
+        peak_memory_bytes=peak,
+        requests=requests,
+    )
+    return result
+
+
+async def run(args) -> dict:
+    results = {
+        "version": metadata.version("odins-spear"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "settings": {
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "repeat": args.repeat,
+        },
+        "enterprises": {},
+        "requester": [],
+        "scripts": [],
+    }
+
+    if not args.skip_requester:
+        enterprise = generate_enterprise("small")
+        for name, settings in REQUESTER_CASES.items():
+            result = await bench_requester(name, settings, enterprise, args)
+            print(
+                f"requester {name}: {result['requests_per_second']} req/s, "
+                f"{result['seconds']}s, {result['failures']} failed",
+                file=sys.stderr,
+            )
+            results["requester"].append(result)
+
+    for size in args.sizes:
+        start = time.perf_counter()
+        enterprise = generate_enterprise(size)
+        results["enterprises"][size] = {
+            "counts": enterprise.counts(),
+            "generate_seconds": round(time.perf_counter() - start, 4),
+        }
+        for name, case in script_cases(enterprise).items():
+            if args.only and name not in args.only:
+                continue
+            result = await bench_script(name, size, case, enterprise, args)
+            print(
+                f"{name} [{size}]: "
+                + (
+                    result["error"]
+                    if "error" in result
+                    else f"{result['seconds']}s, peak {result['peak_memory_bytes'] / 2**20:.1f} MiB"
+                ),
+                file=sys.stderr,
+            )
+            results["scripts"].append(result)
+
+    return results
+
+
+def compare(baseline_path: str, current_path: str, threshold: float) -> int:
+    """Prints the change of every case between two result files.
+
+    Returns:
+        int: 1 if a case regressed by more than threshold (a fraction) or errors where
+            the baseline ran it, otherwise 0.
+    """
+
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+    with open(current_path) as file:
+        current = json.load(file)
+    print(f"{baseline['version']} -> {current['version']}")
+
+    def keyed(results, kind):
+        if kind == "requester":
+            return {r["name"]: r for r in results["requester"]}
+        return {f"{r['name']} [{r['size']}]": r for r in results["scripts"]}
+
+    regressions = 0
+    # a case that ran in the baseline and now fails has no timings to compare
+    before = keyed(baseline, "scripts")
+    for name, result in keyed(current, "scripts").items():
+        if "error" in result and "seconds" in before.get(name, {}):
+            regressions += 1
+            print(f"REGRESSED {name}: {result['error']}")
+
+    # (section, field, True if higher is better)
+    for kind, field, higher_is_better in (
+        ("requester", "requests_per_second", True),
+        ("scripts", "seconds", False),
+        ("scripts", "peak_memory_bytes", False),
+    ):
+        before, after = keyed(baseline, kind), keyed(current, kind)
+        for name in after:
+            old, new = before.get(name, {}).get(field), after[name].get(field)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            regressed = -change > threshold if higher_is_better else change > threshold
+            regressions += regressed
+            print(
+                f"{'REGRESSED ' if regressed else ''}{name} {field}: "
+                f"{old} -> {new} ({change:+.1%})"
+            )
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", nargs="+", default=["small", "medium"], help="Enterprise sizes."
+    )
+    parser.add_argument("--only", nargs="+", help="Script/ report cases to run.")
+    parser.add_argument(
+        "--latency", type=float, default=0.002, help="Server seconds per response."
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Random extra server seconds."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=500, help="GETs per requester case."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=100,
+        help="max_concurrent_requests of script runs.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case.")
+    parser.add_argument("--skip-requester", action="store_true")
+    parser.add_argument(
+        "--output", help="Result file, defaults to results/<version>.json."
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="Compare two result files instead of running.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Change treated as a regression when comparing. Defaults to 0.1 (10%%).",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        return compare(*args.compare, args.threshold)
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "results",
+        f"{metadata.version('odins-spear')}.json",
+    )
+    # reports write their files to .os_reports/ in the working directory
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            results = asyncio.run(run(args))
+        finally:
+            os.chdir(cwd)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Results written to {output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
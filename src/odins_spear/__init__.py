@@ -1,3 +1,4 @@
 from .api import API as API
 from .scripter import Scripter as Scripter
 from .reporter import Reporter as Reporter
+from .sync_api import SyncAPI as SyncAPI
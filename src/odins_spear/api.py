@@ -1,8 +1,20 @@
 import logging
 from typing import Optional
 
+import httpx
+
 from .requester import Requester
-from .endpoints import *  # noqa: F403
+from .utils.connection import ConnectionConfig
+from .utils.cache import ResponseCache
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.codec import get_codec
+from .utils.compression import CompressionPolicy
+from .utils.hedge import HedgePolicy
+from .utils.log_queue import LogQueue
+from .utils.metrics import MetricsCollector
+from .utils.retry import RetryPolicy
+from .utils.tracing import Tracer
+from .endpoints.registry import ENDPOINTS, RouteTable, load_endpoint
 
 from .exceptions import (
     OSApiAuthenticationFail,
@@ -19,6 +31,38 @@ class API:
         password: str,
         rate_limit: bool = False,
         logger: Optional[logging.Logger] = None,
+        rate_limit_per_second: float = 5.0,
+        rate_limit_burst: int = 5,
+        adaptive_rate_limit: bool = False,
+        rate_limit_min_per_second: float = 1.0,
+        rate_limit_max_per_second: float = 50.0,
+        max_concurrent_requests: Optional[int] = 100,
+        endpoint_concurrency_limits: Optional[dict] = None,
+        priority_weights: Optional[dict] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 30.0,
+        http2: bool = False,
+        connect_timeout: Optional[float] = 5.0,
+        read_timeout: Optional[float] = 30.0,
+        write_timeout: Optional[float] = 30.0,
+        pool_timeout: Optional[float] = 30.0,
+        tcp_keepalive: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalesce_requests: bool = True,
+        response_cache: Optional[ResponseCache] = None,
+        json_backend: str = "auto",
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        queue_logging: bool = False,
+        auto_reauthenticate: bool = True,
+        token_refresh_margin: float = 300.0,
+        hooks: Optional[dict] = None,
+        metrics: Optional[MetricsCollector] = None,
+        tracer: Optional[Tracer] = None,
+        compression: Optional[CompressionPolicy] = None,
+        endpoint_policies: Optional[dict] = None,
     ) -> None:
         """ Connection to Odin API, all interactions with the api are here.
 
@@ -28,6 +72,65 @@ class API:
             password (str): Password used when logging into odin account stored as virtual environment.
             rate_limit (bool): Enables (True) or Disables (False) rate limiting to 5 calls per second. Defaults to True.
             logger (logger, optional): Pass in external logger, if not default logger will be assigned. 
+            rate_limit_per_second (float, optional): Requests per second allowed when rate limiting. Defaults to 5.0.
+            rate_limit_burst (int, optional): Requests allowed back to back before rate limiting applies. Defaults to 5.
+            adaptive_rate_limit (bool, optional): When rate limiting, start at rate_limit_per_second and raise the rate while
+                Odin is healthy, cutting it on 429/ 503s or latency spikes. Defaults to False.
+            rate_limit_min_per_second (float, optional): Lowest rate adaptive rate limiting can drop to. Defaults to 1.0.
+            rate_limit_max_per_second (float, optional): Highest rate adaptive rate limiting can raise to. Defaults to 50.0.
+            max_concurrent_requests (int, optional): Max requests in flight at once, extra requests queue. None is unlimited. Defaults to 100.
+            endpoint_concurrency_limits (dict, optional): Max requests in flight per endpoint prefix e.g. {"/groups/call-centers": 5}. Defaults to None.
+            priority_weights (dict, optional): Share of request slots per priority lane while lanes are queued, set the
+                lane with 'with request_priority("bulk"):'. Lanes not given keep their default weight,
+                weights must be positive integers. Defaults to {"interactive": 8, "normal": 4, "bulk": 1}.
+            max_connections (int, optional): Max open connections in the pool. Defaults to 100.
+            max_keepalive_connections (int, optional): Max idle connections kept open for reuse. Defaults to 20.
+            keepalive_expiry (float, optional): Seconds an idle connection is kept open. Defaults to 30.0.
+            http2 (bool, optional): Negotiate HTTP/2, needs odins-spear[http2] installed. Defaults to False.
+            connect_timeout (float, optional): Seconds to establish a connection. Defaults to 5.0.
+            read_timeout (float, optional): Seconds to wait for response data. Defaults to 30.0.
+            write_timeout (float, optional): Seconds to wait sending request data. Defaults to 30.0.
+            pool_timeout (float, optional): Seconds to wait for a free pooled connection. Defaults to 30.0.
+            tcp_keepalive (bool, optional): Enable TCP keep-alive probes on sockets. Defaults to True.
+            transport (httpx.AsyncBaseTransport, optional): Sends requests in place of the connection pool e.g.
+                RecordingTransport("run.jsonl.gz") to record a cassette or ReplayTransport("run.jsonl.gz") to replay
+                it offline. Defaults to None.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy()
+                which retries GET, PUT and DELETE 3 times on transport errors, 429 and 5xx.
+            coalesce_requests (bool, optional): Identical GETs in flight at the same time share one request and
+                response object. Defaults to True.
+            response_cache (ResponseCache, optional): Caches GET responses of the endpoints given a TTL, writes to the
+                same resource path invalidate it e.g. ResponseCache(ttls={"/groups": 300}). Use SQLiteResponseCache to
+                persist responses on disk and share them between processes. Defaults to None (no cache).
+            json_backend (str, optional): Encodes and decodes request/ response bodies, one of orjson, msgspec or json.
+                Defaults to "auto", the fastest installed. Install orjson with: pip install odins-spear[orjson]
+            hedge_policy (HedgePolicy, optional): Sends a duplicate of GETs slower than a percentile of recent
+                latency and uses whichever answers first, within a budget e.g.
+                HedgePolicy(endpoints=["/users/registration/bulk"]). Defaults to None (no hedging).
+            circuit_breaker (CircuitBreaker, optional): Fails requests to an endpoint fast with OSCircuitOpenError
+                after repeated 5xx/ timeouts, trial requests are let through once it may have recovered e.g.
+                CircuitBreaker(failure_threshold=5, recovery_timeout=30). Defaults to None.
+            queue_logging (bool, optional): Write log records from a background thread so log I/O never blocks the
+                event loop, records are flushed on aclose() or exit. Defaults to False.
+            auto_reauthenticate (bool, optional): Refresh the token shortly before it expires and when Odin rejects it,
+                falling back to logging in again. Concurrent requests share one re-authentication and rejected
+                requests are replayed. Defaults to True.
+            token_refresh_margin (float, optional): Seconds before expiry the token is refreshed. Defaults to 300.0.
+            hooks (dict, optional): Callbacks run for every request sent keyed by event, before_request, after_response
+                or on_error e.g. {"after_response": [log_slow]}, more can be added with add_hook(). Defaults to None.
+            metrics (MetricsCollector, optional): Collects per endpoint counts, status codes, bytes, latency percentiles
+                and scheduler/ rate limit waits, export with api.metrics.to_dict() or to_prometheus(). Defaults to None.
+            tracer (Tracer, optional): Records a root span per script or report run with a child span per endpoint
+                call, passed to its exporter e.g. Tracer(LoggingSpanExporter(logger)). Defaults to None.
+            compression (CompressionPolicy, optional): Response encodings accepted and request bodies gzipped e.g.
+                CompressionPolicy(compress_requests=True, endpoints=["/users/bulk"]). Defaults to accepting gzip and
+                deflate, plus brotli and zstd with odins-spear[compression] installed, and sending bodies as is.
+            endpoint_policies (dict, optional): Cache TTL, idempotency and scheduler lane of single routes keyed
+                "METHOD /path" e.g. {"POST /groups/dns/unassign/bulk": {"idempotent": True}}, applied over the
+                defaults in endpoints/registry.py. Defaults to None.
+
+        NOTE: Connections stay open for reuse, close them with 'await api.aclose()' or use
+        the API as an async context manager 'async with API(...) as api:'.
             
         Vars: 
             authorised (bool): Boolean value to indicate if api is authorised.\
@@ -41,49 +144,108 @@ class API:
         self.authorised = False
 
         self.logger = logger if logger else self._setup_logger()
+        self._log_queue = LogQueue(self.logger) if queue_logging else None
+        if self._log_queue:
+            self._log_queue.start()
         self.logger.info(
             f"API initialised, user: {self.username}, base_url: {self.base_url}, rate_limit: {self.rate_limit}"
         )
 
-        self._requester = Requester.get_instance(
-            self.base_url, self.rate_limit, self.logger
+        self._requester = Requester(
+            self.base_url,
+            self.rate_limit,
+            self.logger,
+            account=self.username,
+            rate_limit_per_second=rate_limit_per_second,
+            rate_limit_burst=rate_limit_burst,
+            adaptive_rate_limit=adaptive_rate_limit,
+            rate_limit_min_per_second=rate_limit_min_per_second,
+            rate_limit_max_per_second=rate_limit_max_per_second,
+            max_concurrent_requests=max_concurrent_requests,
+            endpoint_concurrency_limits=endpoint_concurrency_limits,
+            priority_weights=priority_weights,
+            connection=ConnectionConfig(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                pool_timeout=pool_timeout,
+                tcp_keepalive=tcp_keepalive,
+                transport=transport,
+            ),
+            retry_policy=retry_policy,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            json_codec=get_codec(json_backend),
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            authenticator=self._reauthenticate if auto_reauthenticate else None,
+            token_refresh_margin=token_refresh_margin,
+            hooks=hooks,
+            metrics=metrics,
+            tracer=tracer,
+            compression=compression,
+            routes=RouteTable(policies=endpoint_policies),
         )
 
-        # endpoints
-        self.administrators = Administrators()  # noqa: F405
-        self.alternate_numbers = AlternateNumbers()  # noqa: F405
-        self.announcements = Announcements()  # noqa: F405
-        self.authentication = Authentication()  # noqa: F405
-        self.auto_attendants = AutoAttendants()  # noqa: F405
-        self.call_centers = CallCenters()  # noqa: F405
-        self.call_forwarding_always = CallForwardingAlways()  # noqa: F405
-        self.call_forwarding_busy = CallForwardingBusy()  # noqa: F405
-        self.call_forwarding_no_answer = CallForwardingNoAnswer()  # noqa: F405
-        self.call_forwarding_not_reachable = CallForwardingNotReachable()  # noqa: F405
-        self.call_forwarding_selective = CallForwardingSelective()  # noqa: F405
-        self.call_pickup = CallPickup()  # noqa: F405
-        self.call_processing_policies = CallProcessingPolicies()  # noqa: F405
-        self.call_records = CallRecords()  # noqa: F405
-        self.devices = Devices()  # noqa: F405
-        self.dns = DNs()  # noqa: F405
-        self.groups = Groups()  # noqa: F405
-        self.emergency_zones = EmergencyZones()  # noqa: F405
-        self.extensions = Extensions()  # noqa: F405
-        self.do_not_disturb = DoNotDisturb()  # noqa: F405
-        self.hunt_groups = HuntGroups()  # noqa: F405
-        self.service_providers = ServiceProviders()  # noqa: F405
-        self.services = Services()  # noqa: F405
-        self.session = Session()  # noqa: F405
-        self.shared_call_appearance = SharedCallAppearance()  # noqa: F405
-        self.schedules = Schedules()  # noqa: F405
-        self.reports = Reports()  # noqa: F405
-        self.regsitration = Registration()  # noqa: F405
-        self.password_generate = PasswordGenerate()  # noqa: F405
-        self.trunk_groups = TrunkGroups()  # noqa: F405
-        self.users = Users()  # noqa: F405
-
         # authenticate newly instantiated object
 
+    def __getattr__(self, name: str):
+        # only reached for attributes not set yet, endpoints are imported and created
+        # the first time they are used then kept on the instance
+        if name not in ENDPOINTS or "_requester" not in self.__dict__:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        endpoint = load_endpoint(name)(self._requester)
+        setattr(self, name, endpoint)
+        return endpoint
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(ENDPOINTS))
+
+    @property
+    def current_rate_limit(self) -> float:
+        """Requests per second the rate limiter currently allows."""
+        return self._requester.rate_limiter.rate
+
+    @property
+    def metrics(self) -> Optional[MetricsCollector]:
+        """Metrics collected for requests sent, None unless a collector was passed in."""
+        return self._requester.metrics
+
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        """Tracer recording script, report and endpoint call spans, None if not tracing."""
+        return self._requester.tracer
+
+    def add_hook(self, event: str, callback) -> None:
+        """Registers a callback run for every request sent, see Requester.add_hook().
+
+        Args:
+            event (str): before_request, after_response or on_error
+            callback (Callable): Function or coroutine function called with the request
+                (and the response and seconds taken, or the error).
+        """
+        self._requester.add_hook(event, callback)
+
+    async def __aenter__(self) -> "API":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections to Odin and flushes queued log records. Safe to
+        call more than once.
+        """
+        await self._requester.aclose()
+        if self._log_queue:
+            self._log_queue.stop()
+
     async def refresh_authorisation(self) -> bool:
         """Re-authenticates the session with the API. Can used if API key is due to expire.
 
@@ -101,7 +263,7 @@ class API:
         except Exception:
             raise OSSessionRefreshFail()
 
-    def get_auth_details(self):
+    async def get_auth_details(self):
         """Gets current session details.
 
         Raises:
@@ -113,7 +275,7 @@ class API:
         """
 
         try:
-            return self.session.get_session()
+            return await self.session.get_session()
         except Exception:
             raise OSFailedToLocateSession()
 
@@ -124,6 +286,8 @@ class API:
         password: str = None,
         rate_limit: bool = None,
         logger: object = None,
+        rate_limit_per_second: float = None,
+        rate_limit_burst: int = None,
     ):
         """Updates the API with new details.
 
@@ -132,6 +296,8 @@ class API:
             username (str, optional): Username used when logging into odin account. Defaults to None.
             password (str, optional): Password used when logging into odin account stored as virtual environment. Defaults to None.
             rate_limit (bool, optional): Enables (True) or Disables (False) rate limiting to 5 calls per second. Defaults to None.
+            rate_limit_per_second (float, optional): Requests per second allowed when rate limiting. Defaults to None.
+            rate_limit_burst (int, optional): Requests allowed back to back before rate limiting applies. Defaults to None.
         """
 
         if base_url:
@@ -145,6 +311,7 @@ class API:
                 f"API username updated, old: {self.username}, new: {username}"
             )
             self.username = username
+            self._requester.account = username
         if password:
             self.logger.info("API password updated")
             self._password = password
@@ -154,7 +321,16 @@ class API:
             )
             self.rate_limit = rate_limit
             self._requester.rate_limit = rate_limit
+        if rate_limit_per_second or rate_limit_burst:
+            self._requester.rate_limiter.update(rate_limit_per_second, rate_limit_burst)
+            self.logger.info(
+                f"API rate limiter updated, new: {self._requester.rate_limiter}"
+            )
         if logger:
+            if self._log_queue:
+                self._log_queue.stop()
+                self._log_queue = LogQueue(logger)
+                self._log_queue.start()
             self.logger = logger
             self._requester.logger = logger
             self.logger.info("Logger updated")
@@ -176,6 +352,22 @@ class API:
         except Exception:
             raise OSApiAuthenticationFail
 
+    async def _reauthenticate(self) -> None:
+        """Called by the requester when the token is about to expire or was rejected.
+        Refreshes the token, logging in again if it can no longer be refreshed.
+
+        Raises:
+            OSApiAuthenticationFail: Raised if logging in again fails.
+        """
+
+        try:
+            response = await self.session.put_session()
+        except Exception:
+            self.logger.warning("Session refresh failed, logging in again")
+            await self._authenticate()
+        else:
+            self._update_requester(response)
+
     def _update_requester(self, session_response: dict):
         """When authenticating or re-auth update requester with token so it can make
         api calls
@@ -184,13 +376,16 @@ class API:
             session_response (dict): Resposne from call.
         """
 
-        self._requester.headers["Authorization"] = f"Bearer {session_response['token']}"
+        self._requester.set_token(session_response["token"])
         self.authorised = True
         self.logger.info("API session updated with new token")
 
     def _setup_logger(self):
         logger = logging.getLogger("OS")
         logger.setLevel(logging.ERROR)
+        # shared by every API, only the first adds a handler so lines aren't repeated
+        if logger.handlers:
+            return logger
         handler = logging.StreamHandler()
         formatter = logging.Formatter(
             "timestamp: %(asctime)s, level: %(levelname)s, module: %(module)s, function: %(funcName)s,  message: %(message)s"
@@ -1,34 +1,4 @@
-from .administrators import Administrators
-from .alternate_numbers import AlternateNumbers
-from .announcements import Announcements
-from .authentication import Authentication
-from .auto_attendant import AutoAttendants
-from .call_centers import CallCenters
-from .call_forwarding_always import CallForwardingAlways
-from .call_processing_policies import CallProcessingPolicies
-from .call_pickup import CallPickup
-from .call_fowarding_selective import CallForwardingSelective
-from .call_forwarding_not_reachable import CallForwardingNotReachable
-from .call_forwarding_no_answer import CallForwardingNoAnswer
-from .call_forwarding_busy import CallForwardingBusy
-from .call_records import CallRecords
-from .devices import Devices
-from .dns import DNs
-from .groups import Groups
-from .emergency_zones import EmergencyZones
-from .extensions import Extensions
-from .do_not_disturb import DoNotDisturb
-from .hunt_groups import HuntGroups
-from .service_providers import ServiceProviders
-from .services import Services
-from .session import Session
-from .shared_call_appearance import SharedCallAppearance
-from .schedules import Schedules
-from .reports import Reports
-from .registration import Registration
-from .password_generate import PasswordGenerate
-from .trunk_groups import TrunkGroups
-from .users import Users
+from .registry import ENDPOINTS, load_endpoint
 
 __all__ = [
     "Administrators",
@@ -64,14 +34,17 @@ __all__ = [
     "Users",
 ]
 
+# class name: API attribute, classes are only imported when first used
+_CLASSES = {class_name: attribute for attribute, (_, class_name) in ENDPOINTS.items()}
 
-# import importlib
-# import pkgutil
 
-# # Get the package name dynamically
-# package_name = __name__
+def __getattr__(name):
+    if name not in _CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    endpoint_class = load_endpoint(_CLASSES[name])
+    globals()[name] = endpoint_class
+    return endpoint_class
 
-# # Iterate over all modules in the `endpoints` directory
-# for _, module_name, _ in pkgutil.iter_modules(__path__):
-#     if module_name != "base_endpoint":  # Exclude base_endpoint.py
-#         importlib.import_module(f"{package_name}.{module_name}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
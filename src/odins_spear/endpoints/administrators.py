@@ -9,7 +9,7 @@ class Administrators(BaseEndpoint):
 
     # POST
 
-    def post_service_provider_admin(
+    async def post_service_provider_admin(
         self,
         service_provider_id: str,
         user_id: str,
@@ -43,9 +43,9 @@ class Administrators(BaseEndpoint):
         payload["firstName"] = first_name
         payload["lastName"] = last_name
 
-        return self._requester.post(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
-    def post_group_admin(
+    async def post_group_admin(
         self,
         service_provider_id: str,
         group_id: str,
@@ -73,9 +73,9 @@ class Administrators(BaseEndpoint):
         payload["userId"] = user_id
         payload["password"] = password
 
-        return self._requester.post(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
-    def post_group_admin_policies_bulk(self, user_ids: list, policy_config: dict):
+    async def post_group_admin_policies_bulk(self, user_ids: list, policy_config: dict):
         """Applies policy settings to multiple group administrators.
 
         Note: See docs for formatting of parameters.
@@ -91,11 +91,13 @@ class Administrators(BaseEndpoint):
 
         data = {"users": [{"userId": user} for user in user_ids], "data": policy_config}
 
-        self._requester.post(endpoint, data=data)
+        return await self._requester.post(endpoint, data=data)
 
     # PUT
 
-    def put_service_provider_admin_policies(self, user_id: str, policy_config: dict):
+    async def put_service_provider_admin_policies(
+        self, user_id: str, policy_config: dict
+    ):
         """AI is creating summary for put_service_provider_admin_policies
 
         Args:
@@ -107,6 +109,6 @@ class Administrators(BaseEndpoint):
 
         policy_config["userId"] = user_id
 
-        return self._requester.put(endpoint, data=policy_config)
+        return await self._requester.put(endpoint, data=policy_config)
 
     # DELETE
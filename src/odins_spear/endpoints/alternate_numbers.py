@@ -7,7 +7,7 @@ class AlternateNumbers(BaseEndpoint):
 
     # GET
 
-    def get_user_alternate_numbers(self, user_id: str):
+    async def get_user_alternate_numbers(self, user_id: str):
         """Fetches a list of a user/ service such as Auto Attendant, Hunt Group, or Call Centres
         alternate numebrs.
 
@@ -22,7 +22,7 @@ class AlternateNumbers(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
@@ -4,11 +4,11 @@ import base64
 
 
 class Announcements(BaseEndpoint):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
     # GET
-    def get_user_announcements(self, user_id: str):
+    async def get_user_announcements(self, user_id: str):
         """Retrieves announcements from the given user, including Anouncement Type and file size limits.
 
         Args:
@@ -22,9 +22,9 @@ class Announcements(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_announcements(self, group_id: str, service_provider_id: str):
+    async def get_group_announcements(self, group_id: str, service_provider_id: str):
         """Retrieves announcements from the given Group, including Anouncement Type and file size limits.
 
         Args:
@@ -39,11 +39,11 @@ class Announcements(BaseEndpoint):
 
         params = {"groupId": group_id, "serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
-    def post_user_announcement(
+    async def post_user_announcement(
         self,
         user_id: str,
         name: str,
@@ -80,9 +80,9 @@ class Announcements(BaseEndpoint):
             "content": content,
         }
 
-        return self._requester.post(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
-    def post_group_announcement(
+    async def post_group_announcement(
         self,
         group_id: str,
         service_provider_id: str,
@@ -123,11 +123,11 @@ class Announcements(BaseEndpoint):
             "content": content,
         }
 
-        return self._requester.post(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
     # PUT
 
-    def put_user_announcement(self, user_id: str, name: str, new_name: str):
+    async def put_user_announcement(self, user_id: str, name: str, new_name: str):
         """Updates the name of the given user Announcement
 
         Args:
@@ -150,9 +150,9 @@ class Announcements(BaseEndpoint):
             "newName": new_name,
         }
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_group_announcement(
+    async def put_group_announcement(
         self,
         group_id: str,
         service_provider_id: str,
@@ -183,11 +183,11 @@ class Announcements(BaseEndpoint):
             "newName": new_name,
         }
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
     # DELETE
 
-    def delete_user_announcement(self, user_id: str, name: str):
+    async def delete_user_announcement(self, user_id: str, name: str):
         """Removes the given user Announcement
 
         Args:
@@ -208,9 +208,9 @@ class Announcements(BaseEndpoint):
             "mediaType": "WAV",
         }
 
-        return self._requester.delete(endpoint, params=params)
+        return await self._requester.delete(endpoint, params=params)
 
-    def delete_group_announcement(
+    async def delete_group_announcement(
         self,
         group_id: str,
         service_provider_id: str,
@@ -237,4 +237,4 @@ class Announcements(BaseEndpoint):
             "mediaType": "WAV",
         }
 
-        return self._requester.delete(endpoint, params=params)
+        return await self._requester.delete(endpoint, params=params)
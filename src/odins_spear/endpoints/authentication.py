@@ -7,7 +7,7 @@ class Authentication(BaseEndpoint):
 
     # GET
 
-    def get_authentication_service(self, user_id: str):
+    async def get_authentication_service(self, user_id: str):
         """Returns authentication details of authorised users.
 
         Args:
@@ -21,13 +21,13 @@ class Authentication(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
     # PUT
 
-    def put_user_authentication_service(self, user_id: str, new_password: str):
+    async def put_user_authentication_service(self, user_id: str, new_password: str):
         """Set new SIP Authentication password for a single user.
 
         Args:
@@ -42,9 +42,9 @@ class Authentication(BaseEndpoint):
 
         data = {"userId": user_id, "newPassword": new_password}
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
-    def put_user_authentication_user(
+    async def put_user_authentication_user(
         self, username: str, user_id: str, old_password: str, new_password: str
     ):
         """Changes the authentication password of a single user
@@ -67,6 +67,6 @@ class Authentication(BaseEndpoint):
             "password": {"old": old_password, "new": new_password},
         }
 
-        return self._requester.put(endpoint, params=params)
+        return await self._requester.put(endpoint, params=params)
 
     # DELETE
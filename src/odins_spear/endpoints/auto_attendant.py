@@ -281,7 +281,7 @@ class AutoAttendants(BaseEndpoint):
         updates["serviceUserId"] = (auto_attendant_user_id,)
         updates["submenuId"] = submenu_id
 
-        return self.request.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
     # DELETE
 
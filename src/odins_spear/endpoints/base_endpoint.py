@@ -2,5 +2,5 @@ from ..requester import Requester
 
 
 class BaseEndpoint:
-    def __init__(self):
-        self._requester = Requester.get_instance()
+    def __init__(self, requester: Requester):
+        self._requester = requester
@@ -7,7 +7,7 @@ class CallForwardingAlways(BaseEndpoint):
 
     # GET
 
-    def get_user_call_forwarding_always(self, user_id: str):
+    async def get_user_call_forwarding_always(self, user_id: str):
         """Retrieves the Forwarding Always status for the specified User.
 
         Args:
@@ -21,9 +21,11 @@ class CallForwardingAlways(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_bulk_call_forwarding_always(self, service_provider_id: str, group_id: str):
+    async def get_bulk_call_forwarding_always(
+        self, service_provider_id: str, group_id: str
+    ):
         """Retrieves the Forwarding Always status for all users within a specified group.
 
         Args:
@@ -38,7 +40,7 @@ class CallForwardingAlways(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
 
 # POST
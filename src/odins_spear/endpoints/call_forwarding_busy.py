@@ -7,7 +7,7 @@ class CallForwardingBusy(BaseEndpoint):
 
     # GET
 
-    def get_user_call_forwarding_busy(self, user_id: str):
+    async def get_user_call_forwarding_busy(self, user_id: str):
         """Retrieves the Forwarding Not Reachable status for the specified user.
 
         Args:
@@ -21,9 +21,11 @@ class CallForwardingBusy(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_bulk_call_forwarding_busy(self, service_provider_id: str, group_id: str):
+    async def get_bulk_call_forwarding_busy(
+        self, service_provider_id: str, group_id: str
+    ):
         """Retrieves the Forwarding Busy status for all users within a specified group.
 
         Args:
@@ -39,7 +41,7 @@ class CallForwardingBusy(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
 
 # POST
@@ -7,7 +7,7 @@ class CallForwardingNoAnswer(BaseEndpoint):
 
     # GET
 
-    def get_user_call_forwarding_no_answer(self, user_id: str):
+    async def get_user_call_forwarding_no_answer(self, user_id: str):
         """Retrieves the Forwarding No Answer status for the specified user
 
         Args:
@@ -21,9 +21,9 @@ class CallForwardingNoAnswer(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_bulk_call_forwarding_no_answer(
+    async def get_bulk_call_forwarding_no_answer(
         self, service_provider_id: str, group_id: str
     ):
         """Retrieves the Forwarding No Answer status for all users within a specified group.
@@ -41,7 +41,7 @@ class CallForwardingNoAnswer(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
 
 # POST
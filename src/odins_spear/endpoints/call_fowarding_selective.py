@@ -7,7 +7,7 @@ class CallForwardingSelective(BaseEndpoint):
 
     # GET
 
-    def get_user_call_forwarding_selective(self, user_id: str):
+    async def get_user_call_forwarding_selective(self, user_id: str):
         """Retrieves the Forwarding Selective status for a specified User, alongside the criteria.
 
         Args:
@@ -21,9 +21,9 @@ class CallForwardingSelective(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_user_call_forwarding_selective_criterias(self, user_id: str):
+    async def get_user_call_forwarding_selective_criterias(self, user_id: str):
         """Retrieves the Forwarding Selective status for a specified User, alongside the criteria's assigned.
 
         Args:
@@ -37,9 +37,9 @@ class CallForwardingSelective(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_user_call_forwarding_selective_criteria(
+    async def get_user_call_forwarding_selective_criteria(
         self, user_id: str, criteria_name: str
     ):
         """Retrieves the Forwarding Selective status for a specified User, alongside the specified Criteria
@@ -56,7 +56,7 @@ class CallForwardingSelective(BaseEndpoint):
 
         params = {"criteriaName": criteria_name, "userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
 
 # POST
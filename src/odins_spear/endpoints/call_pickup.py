@@ -7,7 +7,7 @@ class CallPickup(BaseEndpoint):
 
     # GET
 
-    def get_call_pickup_groups(self, service_provider_id: str, group_id: str):
+    async def get_call_pickup_groups(self, service_provider_id: str, group_id: str):
         """Retrieves Pickup Group information for the specified group.
 
         Args:
@@ -25,9 +25,9 @@ class CallPickup(BaseEndpoint):
             "groupId": group_id,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_call_pickup_group(
+    async def get_call_pickup_group(
         self, service_provider_id: str, group_id: str, pickup_group_name: str
     ):
         """Retrieves Pickup Group information for the specified group.
@@ -49,9 +49,9 @@ class CallPickup(BaseEndpoint):
             "name": pickup_group_name,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_call_pickup_group_user(
+    async def get_call_pickup_group_user(
         self, service_provider_id: str, group_id: str, user_id: str
     ):
         """Retrieves Pickup Group information for the specified user.
@@ -73,9 +73,11 @@ class CallPickup(BaseEndpoint):
             "userId": user_id,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_call_pickup_available_users(self, service_provider_id: str, group_id: str):
+    async def get_call_pickup_available_users(
+        self, service_provider_id: str, group_id: str
+    ):
         """Retrieves available users to assign to a pick up group for the specified group.
 
         Args:
@@ -90,11 +92,11 @@ class CallPickup(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
-    def post_call_pickup_group(
+    async def post_call_pickup_group(
         self, service_provider_id: str, group_id: str, pickup_group_name: str
     ):
         """Creates a new pickup group for the specified group
@@ -116,11 +118,11 @@ class CallPickup(BaseEndpoint):
             "name": pickup_group_name,
         }
 
-        return self._requester.post(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
     # PUT
 
-    def put_call_pickup_group(
+    async def put_call_pickup_group(
         self,
         service_provider_id: str,
         group_id: str,
@@ -161,11 +163,11 @@ class CallPickup(BaseEndpoint):
         if pickup_group_name:
             updates["name"] = new_group_name
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
     # DELETE
 
-    def delete_call_pickup_group(
+    async def delete_call_pickup_group(
         self, service_provider_id: str, group_id: str, pickup_group_name: str
     ):
         """Deletes a pickup group for the specified group
@@ -184,4 +186,4 @@ class CallPickup(BaseEndpoint):
             "name": pickup_group_name,
         }
 
-        return self._requester.delete(endpoint, params=params)
+        return await self._requester.delete(endpoint, params=params)
@@ -11,7 +11,7 @@ class CallProcessingPolicies(BaseEndpoint):
 
     # PUT
 
-    def put_user_call_processing_policy(self, user_id: str, updates: dict):
+    async def put_user_call_processing_policy(self, user_id: str, updates: dict):
         """
         Update the Call Processing Policies for a specified user.
 
@@ -27,7 +27,7 @@ class CallProcessingPolicies(BaseEndpoint):
 
         updates["userId"] = user_id
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
 
 # DELETE
@@ -6,7 +6,7 @@ class CallRecords(BaseEndpoint):
         super().__init__(*args, **kwargs)
 
     # GET
-    def get_users_stats(
+    async def get_users_stats(
         self,
         user_id: str,
         start_date: str,
@@ -45,7 +45,7 @@ class CallRecords(BaseEndpoint):
             "endTime": f"{end_date}T{end_time}{time_zone}",
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
     # PUT
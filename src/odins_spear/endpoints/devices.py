@@ -8,7 +8,7 @@ class Devices(BaseEndpoint):
     # GET
 
     # POST
-    def post_group_device(
+    async def post_group_device(
         self,
         service_provider_id: str,
         group_id: str,
@@ -36,10 +36,10 @@ class Devices(BaseEndpoint):
         payload["deviceName"] = device_name
         payload["deviceType"] = device_type
 
-        return self._requester.post(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
     # PUT
-    def put_group_devices(
+    async def put_group_devices(
         self, service_provider_id: str, group_id: str, device_name: str, updates: dict
     ):
         """Update a single device in a group.
@@ -60,9 +60,9 @@ class Devices(BaseEndpoint):
         updates["groupId"] = group_id
         updates["deviceName"] = device_name
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_service_provider_device(
+    async def put_service_provider_device(
         self, service_provider_id: str, device_name: str, updates: dict
     ):
         """Update a single device in a Service Provider or Enterprise.
@@ -81,9 +81,9 @@ class Devices(BaseEndpoint):
         updates["serviceProviderId"] = service_provider_id
         updates["deviceName"] = device_name
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_system_devices(self, device_name: str, updates: dict):
+    async def put_system_devices(self, device_name: str, updates: dict):
         """Update a single device in the Broadworks system.
 
         Args:
@@ -98,9 +98,9 @@ class Devices(BaseEndpoint):
 
         updates["deviceName"] = device_name
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_system_device_file(self, device_name: str, updates: dict):
+    async def put_system_device_file(self, device_name: str, updates: dict):
         """Update a config file for a single device at the system level.
 
         Args:
@@ -115,9 +115,9 @@ class Devices(BaseEndpoint):
 
         updates["deviceName"] = device_name
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_service_provider_device_file(self, device_name: str, updates: dict):
+    async def put_service_provider_device_file(self, device_name: str, updates: dict):
         """Update a config file for a single device at Service Provider or
         Enterprise level.
 
@@ -133,9 +133,9 @@ class Devices(BaseEndpoint):
 
         updates["deviceName"] = device_name
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_group_device_file(self, device_name: str, updates: dict):
+    async def put_group_device_file(self, device_name: str, updates: dict):
         """Update a config file for a single device at Group level.
 
         Args:
@@ -150,9 +150,9 @@ class Devices(BaseEndpoint):
 
         updates["deviceName"] = device_name
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_group_device_tags_profile(
+    async def put_group_device_tags_profile(
         self, service_provider_id: str, group_id: str, device_name: str, tags: list
     ):
         """Update tags assigned to single device at group level.
@@ -176,9 +176,9 @@ class Devices(BaseEndpoint):
             "tags": [{"elements": tags}],
         }
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
-    def put_group_device_tag(
+    async def put_group_device_tag(
         self,
         service_provider_id: str,
         group_id: str,
@@ -209,9 +209,9 @@ class Devices(BaseEndpoint):
             "deviceName": device_name,
         }
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
-    def put_service_provider_device_tag(
+    async def put_service_provider_device_tag(
         self, service_provider_id: str, device_name: str, tag_name: str, tag_value: str
     ):
         """Update a single tag assigned to a device at the Service Provider or Enterprise level.
@@ -235,9 +235,11 @@ class Devices(BaseEndpoint):
             "deviceName": device_name,
         }
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
-    def put_system_device_tag(self, device_name: str, tag_name: str, tag_value: str):
+    async def put_system_device_tag(
+        self, device_name: str, tag_name: str, tag_value: str
+    ):
         """Update a single tag assigned to a device at the System level.
 
         Args:
@@ -257,9 +259,9 @@ class Devices(BaseEndpoint):
             "deviceName": device_name,
         }
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
-    def put_group_device_type_file(
+    async def put_group_device_type_file(
         self, service_provider_id: str, group_id: str, device_type: str, updates: dict
     ):
         """Set config file for all devices of a specific type at the group level.
@@ -280,9 +282,9 @@ class Devices(BaseEndpoint):
         updates["groupId"] = group_id
         updates["deviceType"] = device_type
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_group_device_type_tag(
+    async def put_group_device_type_tag(
         self,
         service_provider_id: str,
         group_id: str,
@@ -313,9 +315,9 @@ class Devices(BaseEndpoint):
             "deviceType": device_type,
         }
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
-    def put_service_provider_device_type_tag(
+    async def put_service_provider_device_type_tag(
         self, service_provider_id: str, device_type: str, tag_name: str, tag_value: str
     ):
         """Update tags applied to device types at the Service Provider or Enterprise level.
@@ -339,7 +341,7 @@ class Devices(BaseEndpoint):
             "deviceType": device_type,
         }
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
 
 # DELETE
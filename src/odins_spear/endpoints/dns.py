@@ -7,7 +7,7 @@ class DNs(BaseEndpoint):
 
     # GET
 
-    def get_group_dns(self, service_provider_id: str, group_id: str):
+    async def get_group_dns(self, service_provider_id: str, group_id: str):
         """Gets all numbers assigned to group.
 
         Args:
@@ -22,9 +22,9 @@ class DNs(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_dn_search(
+    async def get_group_dn_search(
         self,
         service_provider_id: str,
         group_id: str,
@@ -55,9 +55,9 @@ class DNs(BaseEndpoint):
         if limit:
             params["limit"] = limit
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_dn_details(self, service_provider_id: str, group_id: str):
+    async def get_group_dn_details(self, service_provider_id: str, group_id: str):
         """Gets all numbers assigned to Group in detail. This will show where the number is assigned
         in a group such as which user or hunt group.
 
@@ -73,9 +73,9 @@ class DNs(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_system_dn_search(self, dn: int):
+    async def get_system_dn_search(self, dn: int):
         """Searches for number from System level. This will return where the number is located on the system.
         It will show the Service Provider/ Enterprise, Group ID, and User ID the number is assigned to.
 
@@ -90,9 +90,9 @@ class DNs(BaseEndpoint):
 
         params = {"dn": f"+{dn}"}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_system_dn(self, dn: int):
+    async def get_system_dn(self, dn: int):
         """Searches for number from System level. This will return where the number is located on the system.
         It will show the Service Provider/ Enterprise, Group ID, and User ID the number is assigned to.
 
@@ -107,20 +107,24 @@ class DNs(BaseEndpoint):
 
         params = {"phoneNumber": f"+{dn}"}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_system_dn_summary(self):
+    async def get_system_dn_summary(self, stream: bool = False):
         """Returns all numbers assigned to system.
 
+        Args:
+            stream (bool, optional): Return an async iterator yielding each entry as it
+                downloads rather than the whole list. Defaults to False.
+
         Returns:
             List: List of all Service Providers/ Enterprises and numbers assigned in ranges.
         """
 
         endpoint = "/system/dns/summary"
 
-        return self._requester.get(endpoint)
+        return await self._requester.get(endpoint, stream=stream)
 
-    def get_system_dn_utilization(self):
+    async def get_system_dn_utilization(self):
         """Returns DN statistics for each Service Provider/ Enterprise such as total DNs assigned.
 
         Returns:
@@ -129,9 +133,9 @@ class DNs(BaseEndpoint):
 
         endpoint = "/system/dns/utilization"
 
-        return self._requester.get(endpoint)
+        return await self._requester.get(endpoint)
 
-    def get_service_provider_dn_search(
+    async def get_service_provider_dn_search(
         self,
         service_provider_id: str,
         dn: int,
@@ -160,9 +164,9 @@ class DNs(BaseEndpoint):
         if limit:
             params["limit"] = limit
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_service_provider_dns(self, service_provider_id: str):
+    async def get_service_provider_dns(self, service_provider_id: str):
         """Returns all numbers assigned to Service Provider/ Enterprise with the group its assigned to
         and if the numbers can be deleted.
 
@@ -177,11 +181,11 @@ class DNs(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
-    def post_group_dns(
+    async def post_group_dns(
         self,
         service_provider_id: str,
         group_id: str,
@@ -211,9 +215,9 @@ class DNs(BaseEndpoint):
             "dns": [{"min": start_of_range_number, "max": end_of_range_number}],
         }
 
-        return self._requester.post(endpoint, data=data)
+        return await self._requester.post(endpoint, data=data)
 
-    def post_group_dns_assign_bulk(
+    async def post_group_dns_assign_bulk(
         self,
         service_provider_id: str,
         group_id: str,
@@ -243,9 +247,9 @@ class DNs(BaseEndpoint):
             "dns": [{"min": start_of_range_number, "max": end_of_range_number}],
         }
 
-        return self._requester.post(endpoint, data=data)
+        return await self._requester.post(endpoint, data=data)
 
-    def post_group_dns_unassign_bulk(
+    async def post_group_dns_unassign_bulk(
         self,
         service_provider_id: str,
         group_id: str,
@@ -275,9 +279,9 @@ class DNs(BaseEndpoint):
             "dns": [{"min": start_of_range_number, "max": end_of_range_number}],
         }
 
-        return self._requester.post(endpoint, data=data)
+        return await self._requester.post(endpoint, data=data)
 
-    def post_service_provider_dns(
+    async def post_service_provider_dns(
         self,
         service_provider_id: str,
         start_of_range_number: int,
@@ -304,11 +308,11 @@ class DNs(BaseEndpoint):
             "dns": [{"min": start_of_range_number, "max": end_of_range_number}],
         }
 
-        return self._requester.post(endpoint, data=data)
+        return await self._requester.post(endpoint, data=data)
 
     # PUT
 
-    def put_group_dns_activate(
+    async def put_group_dns_activate(
         self, service_provider_id: str, group_id: str, activated: bool, numbers: list
     ):
         """Update activation state of a list of numbers assigned to a group.
@@ -333,11 +337,11 @@ class DNs(BaseEndpoint):
             ],
         }
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
     # DELETE
 
-    def delete_group_dns(
+    async def delete_group_dns(
         self,
         service_provider_id: str,
         group_id: str,
@@ -369,9 +373,9 @@ class DNs(BaseEndpoint):
             ],
         }
 
-        return self._requester.delete(endpoint, data=data)
+        return await self._requester.delete(endpoint, data=data)
 
-    def service_provider_dns(
+    async def service_provider_dns(
         self,
         service_provider_id: str,
         start_of_range_number: str,
@@ -394,4 +398,4 @@ class DNs(BaseEndpoint):
             "dns": [{"min": start_of_range_number, "max": end_of_range_number}],
         }
 
-        return self._requester.delete(endpoint, data=data)
+        return await self._requester.delete(endpoint, data=data)
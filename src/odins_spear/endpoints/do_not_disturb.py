@@ -7,7 +7,7 @@ class DoNotDisturb(BaseEndpoint):
 
     # GET
 
-    def get_user_do_not_disturb(self, user_id: str):
+    async def get_user_do_not_disturb(self, user_id: str):
         """Returns the specificied users DND and Ring Splash state.
 
         Args:
@@ -21,13 +21,13 @@ class DoNotDisturb(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
     # PUT
 
-    def put_user_do_not_disturb(
+    async def put_user_do_not_disturb(
         self, user_id: str, dnd_active: bool = False, ring_splash_active: bool = False
     ):
         """Updates a user's DND and Ring Splash status.
@@ -49,6 +49,6 @@ class DoNotDisturb(BaseEndpoint):
 
         endpoint = "/users/do-not-disturb"
 
-        return self._requester.put(endpoint, data)
+        return await self._requester.put(endpoint, data)
 
     # DELETE
@@ -8,7 +8,7 @@ class EmergencyZones(BaseEndpoint):
     # GET
 
     # POST
-    def post_group_emergency_zones(
+    async def post_group_emergency_zones(
         self, service_provider_id: str, group_id: str, ip_addresses: list
     ):
         """Updates the IP address(es) for the Emergency Zone configured in the group.
@@ -30,10 +30,10 @@ class EmergencyZones(BaseEndpoint):
             "ipAddresses": ip_addresses,
         }
 
-        return self._requester.post(endpoint, data=data)
+        return await self._requester.post(endpoint, data=data)
 
     # PUT
-    def put_group_emergency_zones(
+    async def put_group_emergency_zones(
         self,
         service_provider_id: str,
         group_id: str,
@@ -70,6 +70,6 @@ class EmergencyZones(BaseEndpoint):
         if ip_addresses:
             data["ipAddresses"] = ip_addresses
 
-        return self._requester.put(endpoint, data)
+        return await self._requester.put(endpoint, data)
 
     # DELETE
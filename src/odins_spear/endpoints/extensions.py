@@ -7,7 +7,7 @@ class Extensions(BaseEndpoint):
 
     # GET
 
-    def get_group_extensions(self, service_provider_id: str, group_id: str):
+    async def get_group_extensions(self, service_provider_id: str, group_id: str):
         """
         Gets extension settings for a group.
 
@@ -19,13 +19,13 @@ class Extensions(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
     # PUT
 
-    def put_group_extensions(
+    async def put_group_extensions(
         self,
         service_provider_id: str,
         group_id: str,
@@ -54,6 +54,6 @@ class Extensions(BaseEndpoint):
         if default_ext_length:
             params["defaultExtensionLength"] = default_ext_length
 
-        return self._requester.put(endpoint, params=params)
+        return await self._requester.put(endpoint, params=params)
 
     # DELETE
@@ -7,7 +7,7 @@ class Groups(BaseEndpoint):
 
     # GET
 
-    def get_groups(self, service_provider_id: str) -> list:
+    async def get_groups(self, service_provider_id: str) -> list:
         """Returns the specificied Service Provider's Groups.
 
         Args:
@@ -21,9 +21,9 @@ class Groups(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group(self, service_provider_id: str, group_id: str) -> dict:
+    async def get_group(self, service_provider_id: str, group_id: str) -> dict:
         """Returns the specificied Group's settings and information.
 
         Args:
@@ -38,10 +38,10 @@ class Groups(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
-    def post_group(
+    async def post_group(
         self,
         default_domain: str,
         user_limit: int,
@@ -72,11 +72,11 @@ class Groups(BaseEndpoint):
             "defaultDomain": default_domain,
         }
 
-        return self._requester.post(endpoint, data=data)
+        return await self._requester.post(endpoint, data=data)
 
     # PUT
 
-    def put_group(
+    async def put_group(
         self,
         service_provider_id: str,
         group_id: str,
@@ -107,11 +107,11 @@ class Groups(BaseEndpoint):
             **updates,
         }
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
     # DELETE
 
-    def delete_group(self, service_provider_id: str, group_id: str) -> dict:
+    async def delete_group(self, service_provider_id: str, group_id: str) -> dict:
         """Deletes a Group and all associated users, settings, services and numbers.
 
         Please use with caution! This action is irreversible unless you have a backup of the group.
@@ -128,4 +128,4 @@ class Groups(BaseEndpoint):
 
         data = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.delete(endpoint, data=data)
+        return await self._requester.delete(endpoint, data=data)
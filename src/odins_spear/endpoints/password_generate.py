@@ -7,7 +7,9 @@ class PasswordGenerate(BaseEndpoint):
 
     # GET
 
-    def get_password_generate(self, service_provider_id: str, group_id: str) -> dict:
+    async def get_password_generate(
+        self, service_provider_id: str, group_id: str
+    ) -> dict:
         """Generates a single passwords following the groups rules.
 
         Args:
@@ -22,9 +24,9 @@ class PasswordGenerate(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_passwords_generate(
+    async def get_passwords_generate(
         self, service_provider_id: str, group_id: str, limit: int = 10
     ) -> dict:
         """Generates a multiple passwords to the limit set in pararmeters.
@@ -46,9 +48,11 @@ class PasswordGenerate(BaseEndpoint):
             "limit": limit,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_passcode_generate(self, service_provider_id: str, group_id: str) -> dict:
+    async def get_passcode_generate(
+        self, service_provider_id: str, group_id: str
+    ) -> dict:
         """Generates a single passcode following group rules.
 
         Args:
@@ -63,9 +67,9 @@ class PasswordGenerate(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_passcodes_generate(
+    async def get_passcodes_generate(
         self, service_provider_id: str, group_id: str, limit: int = 10
     ) -> dict:
         """Generates a multiple passcodes to the limit set in pararmeters.
@@ -87,9 +91,9 @@ class PasswordGenerate(BaseEndpoint):
             "limit": limit,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_sip_password_generate(self) -> dict:
+    async def get_sip_password_generate(self) -> dict:
         """Generates a single SIP password.
 
         Args:
@@ -102,9 +106,9 @@ class PasswordGenerate(BaseEndpoint):
 
         endpoint = "/sip-password/generate"
 
-        return self._requester.get(endpoint)
+        return await self._requester.get(endpoint)
 
-    def get_sip_passwords_generate(self, limit: int = 10) -> dict:
+    async def get_sip_passwords_generate(self, limit: int = 10) -> dict:
         """Generates multiple SIP passwords to the limit set in parameters. Defaults to 10.
 
         Args:
@@ -118,7 +122,7 @@ class PasswordGenerate(BaseEndpoint):
 
         params = {"limit": limit}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
 
 # POST
@@ -7,7 +7,7 @@ class Registration(BaseEndpoint):
 
     # GET
 
-    def get_user_registration(self, user_id: str):
+    async def get_user_registration(self, user_id: str):
         """Gets a users devices and if those devices are registered. This includes soft phones.
 
         Args:
@@ -21,14 +21,18 @@ class Registration(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_bulk_user_registration(self, service_provider_id: str, group_id: str):
+    async def get_bulk_user_registration(
+        self, service_provider_id: str, group_id: str, stream: bool = False
+    ):
         """Gets all users in a group and their device registrations. This includes soft phones.
 
         Args:
             service_provider_id (str): Service Provider/ Enterprise ID where Group is hosted.
             group_id (str): Target Group ID where users are located.
+            stream (bool, optional): Return an async iterator yielding each user as it
+                downloads rather than the whole list. Defaults to False.
 
         Returns:
             dict: All users devices and details on device such as registration.
@@ -38,7 +42,7 @@ class Registration(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params, stream=stream)
 
 
 # POST
@@ -0,0 +1,182 @@
+import importlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# API attribute: (module in endpoints/, class), imported the first time it is used
+ENDPOINTS = {
+    "administrators": ("administrators", "Administrators"),
+    "alternate_numbers": ("alternate_numbers", "AlternateNumbers"),
+    "announcements": ("announcements", "Announcements"),
+    "authentication": ("authentication", "Authentication"),
+    "auto_attendants": ("auto_attendant", "AutoAttendants"),
+    "call_centers": ("call_centers", "CallCenters"),
+    "call_forwarding_always": ("call_forwarding_always", "CallForwardingAlways"),
+    "call_forwarding_busy": ("call_forwarding_busy", "CallForwardingBusy"),
+    "call_forwarding_no_answer": (
+        "call_forwarding_no_answer",
+        "CallForwardingNoAnswer",
+    ),
+    "call_forwarding_not_reachable": (
+        "call_forwarding_not_reachable",
+        "CallForwardingNotReachable",
+    ),
+    "call_forwarding_selective": (
+        "call_fowarding_selective",
+        "CallForwardingSelective",
+    ),
+    "call_pickup": ("call_pickup", "CallPickup"),
+    "call_processing_policies": ("call_processing_policies", "CallProcessingPolicies"),
+    "call_records": ("call_records", "CallRecords"),
+    "devices": ("devices", "Devices"),
+    "dns": ("dns", "DNs"),
+    "groups": ("groups", "Groups"),
+    "emergency_zones": ("emergency_zones", "EmergencyZones"),
+    "extensions": ("extensions", "Extensions"),
+    "do_not_disturb": ("do_not_disturb", "DoNotDisturb"),
+    "hunt_groups": ("hunt_groups", "HuntGroups"),
+    "service_providers": ("service_providers", "ServiceProviders"),
+    "services": ("services", "Services"),
+    "session": ("session", "Session"),
+    "shared_call_appearance": ("shared_call_appearance", "SharedCallAppearance"),
+    "schedules": ("schedules", "Schedules"),
+    "reports": ("reports", "Reports"),
+    "regsitration": ("registration", "Registration"),
+    "password_generate": ("password_generate", "PasswordGenerate"),
+    "trunk_groups": ("trunk_groups", "TrunkGroups"),
+    "users": ("users", "Users"),
+}
+
+
+def load_endpoint(attribute: str) -> type:
+    """Imports the endpoint class behind an API attribute.
+
+    Args:
+        attribute (str): API attribute e.g. call_centers
+
+    Raises:
+        KeyError: If attribute is not in ENDPOINTS.
+
+    Returns:
+        type: Endpoint class e.g. CallCenters
+    """
+    module_name, class_name = ENDPOINTS[attribute]
+    module = importlib.import_module(f".{module_name}", package=__package__)
+    return getattr(module, class_name)
+
+
+@dataclass(frozen=True)
+class Route:
+    """One endpoint method and the Odin request it sends, generated from the spec by
+    utils/generate_endpoint.py into endpoints/routes.py.
+
+    Args:
+        endpoint (str): API attribute of the endpoint class e.g. users
+        name (str): Method on the endpoint class e.g. get_users
+        method (str): HTTP method e.g. GET
+        path (str): Path appended to base_url e.g. /users
+        params (tuple, optional): Query parameters the method may send. Defaults to ().
+        body (tuple, optional): Top level keys of the JSON body the method may send.
+            Defaults to ().
+    """
+
+    endpoint: str
+    name: str
+    method: str
+    path: str
+    params: Tuple[str, ...] = ()
+    body: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True)
+class EndpointPolicy:
+    """Overrides Requester applies to every request sent to one method and path.
+
+    Args:
+        cache_ttl (float, optional): Seconds GET responses are cached for when a response
+            cache is configured, 0 never caches them. Defaults to the cache's TTLs.
+        idempotent (bool, optional): True retries the request like a GET even if it is a
+            POST, False never retries it once it may have reached Odin, nor coalesces or
+            hedges a GET. Defaults to the retry policy's retry_methods.
+        priority (str, optional): Scheduler lane used when the caller has not picked one
+            with priority= or request_priority(). Defaults to None.
+    """
+
+    cache_ttl: Optional[float] = None
+    idempotent: Optional[bool] = None
+    priority: Optional[str] = None
+
+
+# hand kept, routes.py is regenerated, keyed "METHOD /path"
+POLICIES = {
+    # group wide sweeps, interactive calls overtake them
+    "GET /users/call-forwarding-always/bulk": EndpointPolicy(priority="bulk"),
+    "GET /users/call-forwarding-busy/bulk": EndpointPolicy(priority="bulk"),
+    "GET /users/call-forwarding-no-answer/bulk": EndpointPolicy(priority="bulk"),
+    "GET /users/call-forwarding-not-reachable/bulk": EndpointPolicy(priority="bulk"),
+    "GET /users/registration/bulk": EndpointPolicy(priority="bulk"),
+    # answer a new value or the caller's session each call, never cached, coalesced,
+    # hedged or retried
+    "GET /auth/session": EndpointPolicy(cache_ttl=0, idempotent=False),
+    "GET /password/generate": EndpointPolicy(cache_ttl=0, idempotent=False),
+    "GET /passcode/generate": EndpointPolicy(cache_ttl=0, idempotent=False),
+    "GET /sip-password/generate": EndpointPolicy(cache_ttl=0, idempotent=False),
+}
+
+
+class RouteTable:
+    """Every route Odin's Spear sends and the EndpointPolicy of each.
+
+    Example:
+        RouteTable(policies={
+            "GET /service-providers": {"cache_ttl": 300},
+            "POST /groups/dns/unassign/bulk": {"idempotent": True},
+        })
+
+    Args:
+        routes (list, optional): Routes known. Defaults to the generated routes.
+        policies (dict, optional): EndpointPolicy or dict of its arguments keyed
+            "METHOD /path", applied over the defaults in POLICIES. Defaults to None.
+
+    Raises:
+        ValueError: If a policy is given for a method and path no route sends.
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Iterable[Route]] = None,
+        policies: Optional[Dict[str, object]] = None,
+    ) -> None:
+        if routes is None:
+            from .routes import ROUTES as routes
+
+        self.routes = tuple(routes)
+        self._paths = {(route.method, route.path) for route in self.routes}
+
+        self.policies = {}
+        for key, policy in {**POLICIES, **(policies or {})}.items():
+            if not isinstance(policy, EndpointPolicy):
+                policy = EndpointPolicy(**policy)
+            self.policies[self._key(key)] = policy
+
+    def _key(self, key: str) -> Tuple[str, str]:
+        method, _, path = key.partition(" ")
+        route = (method.upper(), path.rstrip("?"))
+        if route not in self._paths:
+            raise ValueError(
+                f"Unknown route '{key}', expected 'METHOD /path' of a route in the registry."
+            )
+        return route
+
+    def policy_for(self, method: str, endpoint: str) -> Optional[EndpointPolicy]:
+        """EndpointPolicy of a request, None if it has none."""
+        return self.policies.get((method, endpoint.rstrip("?")))
+
+    def routes_for(self, endpoint: str) -> List[Route]:
+        """Routes of one endpoint class by its API attribute e.g. users"""
+        return [route for route in self.routes if route.endpoint == endpoint]
+
+    def __len__(self) -> int:
+        return len(self.routes)
+
+    def __repr__(self) -> str:
+        return f"RouteTable(routes={len(self.routes)}, policies={len(self.policies)})"
@@ -7,7 +7,7 @@ class Reports(BaseEndpoint):
 
     # GET
 
-    def get_user_report(self, user_id: str):
+    async def get_user_report(self, user_id: str):
         """Detailed report of user including services and service packs assigned.
 
         Args:
@@ -21,9 +21,9 @@ class Reports(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_report(self, service_provider_id: str, group_id: str):
+    async def get_group_report(self, service_provider_id: str, group_id: str):
         """Detailed report of users within a group including services and service packs assigned.
 
         Args:
@@ -38,7 +38,7 @@ class Reports(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
 
 # POST
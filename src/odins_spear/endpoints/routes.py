@@ -0,0 +1,196 @@
+# Generated by utils/generate_endpoint.py, do not edit. Per route policies are
+# kept in registry.POLICIES.
+from .registry import Route
+
+# fmt: off
+ROUTES = (
+    Route("administrators", "post_service_provider_admin", "POST", "/service-providers/admins", (), ("serviceProviderId", "language", "administratorType", "userId", "password", "firstName", "lastName",)),
+    Route("administrators", "post_group_admin", "POST", "/groups/admins", (), ("serviceProviderId", "groupId", "userId", "password",)),
+    Route("administrators", "post_group_admin_policies_bulk", "POST", "/groups/admins/policies/bulk", (), ("users", "data",)),
+    Route("administrators", "put_service_provider_admin_policies", "PUT", "/service-providers/admins/policies", (), ("userId",)),
+    Route("alternate_numbers", "get_user_alternate_numbers", "GET", "/users/alternate-numbers", ("userId",), ()),
+    Route("announcements", "get_user_announcements", "GET", "/users/announcements", ("userId",), ()),
+    Route("announcements", "get_group_announcements", "GET", "/groups/announcements", ("groupId", "serviceProviderId",), ()),
+    Route("announcements", "post_user_announcement", "POST", "/users/announcements", (), ("userId", "name", "mediaType", "description", "content",)),
+    Route("announcements", "post_group_announcement", "POST", "/groups/announcements", (), ("groupId", "serviceProviderId", "name", "mediaType", "description", "content",)),
+    Route("announcements", "put_user_announcement", "PUT", "/users/announcements", (), ("userId", "name", "mediaType", "newName",)),
+    Route("announcements", "put_group_announcement", "PUT", "/groups/announcements", (), ("groupId", "serviceProviderId", "name", "mediaType", "newName",)),
+    Route("announcements", "delete_user_announcement", "DELETE", "/users/announcements", ("userId", "name", "mediaType",), ()),
+    Route("announcements", "delete_group_announcement", "DELETE", "/groups/announcements", ("groupId", "serviceProviderId", "name", "mediaType",), ()),
+    Route("authentication", "get_authentication_service", "GET", "/users/authentication", ("userId",), ()),
+    Route("authentication", "put_user_authentication_service", "PUT", "/users/authentication", (), ("userId", "newPassword",)),
+    Route("authentication", "put_user_authentication_user", "PUT", "/users/authentication", ("userName", "userId", "password",), ()),
+    Route("auto_attendants", "get_auto_attendants", "GET", "/groups/auto-attendants", ("serviceProviderId", "groupId",), ()),
+    Route("auto_attendants", "get_auto_attendant", "GET", "/groups/auto-attendants", ("serviceUserId",), ()),
+    Route("auto_attendants", "get_auto_attendant_user", "GET", "/groups/auto-attendants/user", ("userId", "serviceProviderId", "groupId",), ()),
+    Route("auto_attendants", "get_auto_attendant_submenus", "GET", "/groups/auto-attendants/submenus", ("serviceUserId",), ()),
+    Route("auto_attendants", "get_auto_attendant_submenu_usage", "GET", "/groups/auto-attendants/submenus/usage", ("serviceUserId", "submenuId",), ()),
+    Route("auto_attendants", "post_auto_attendant", "POST", "/groups/auto-attendants", (), ("serviceProviderId", "groupId", "serviceUserId", "type",)),
+    Route("auto_attendants", "post_auto_attendant_remove_user", "POST", "/groups/auto-attendants/removeUser", (), ("serviceProviderId", "groupId", "userId",)),
+    Route("auto_attendants", "post_auto_attendant_submenu", "POST", "/groups/auto-attendants/submenus", (), ("serviceUserId", "submenuId", "announcementSelection", "enableLevelExtensionDialing",)),
+    Route("auto_attendants", "put_auto_attendants_status", "PUT", "/groups/auto-attendants/status", (), ("instances",)),
+    Route("auto_attendants", "put_auto_attendant", "PUT", "/groups/auto-attendants", (), ("serviceProviderId", "groupId", "serviceUserId",)),
+    Route("auto_attendants", "put_auto_attendant_submenu", "PUT", "/groups/auto-attendants/submenus", (), ("serviceUserId", "submenuId",)),
+    Route("auto_attendants", "delete_auto_attendant", "DELETE", "/groups/auto-attendants", ("serviceUserId",), ()),
+    Route("auto_attendants", "delete_auto_attendant_submenu", "DELETE", "/groups/auto-attendants/submenus", ("serviceUserId", "submenuId",), ()),
+    Route("call_centers", "get_group_call_centers", "GET", "/groups/call-centers", ("serviceProviderId", "groupId",), ()),
+    Route("call_centers", "get_group_call_center", "GET", "/groups/call-centers", ("serviceUserId",), ()),
+    Route("call_centers", "get_user_call_center", "GET", "/users/call-center", ("userId",), ()),
+    Route("call_centers", "get_group_call_center_agents", "GET", "/groups/call-centers/agents", ("serviceUserId",), ()),
+    Route("call_centers", "get_group_call_center_bounced_calls", "GET", "/groups/call-centers/bounced-calls", ("serviceUserId",), ()),
+    Route("call_centers", "get_group_call_center_forced_forwarding", "GET", "/groups/call-centers/forced-forwarding", ("serviceUserId",), ()),
+    Route("call_centers", "get_group_call_center_overflow", "GET", "/groups/call-centers/overflow", ("serviceUserId",), ()),
+    Route("call_centers", "get_group_call_center_stranded_calls", "GET", "/groups/call-centers/stranded-calls", ("serviceUserId",), ()),
+    Route("call_centers", "get_group_call_center_stranded_calls_unavailable", "GET", "/groups/call-centers/stranded-calls-unavailable", ("serviceUserId",), ()),
+    Route("call_centers", "put_group_call_centers_status", "PUT", "/groups/call-centers/status", (), ("instances",)),
+    Route("call_centers", "put_group_call_center", "PUT", "/groups/call-centers", (), ("serviceUserId",)),
+    Route("call_centers", "put_group_call_center_agents", "PUT", "/groups/call-centers/agents", (), ("serviceUserId", "agents",)),
+    Route("call_centers", "put_group_call_center_agents_levels", "PUT", "/groups/call-centers/agents", (), ("serviceUserId", "agents",)),
+    Route("call_centers", "put_group_call_center_bounced_calls", "PUT", "/groups/call-centers/bounced-calls", (), ("serviceUserId",)),
+    Route("call_centers", "put_group_call_center_dnis_instance", "PUT", "/groups/call-centers/dnis/instances", (), ("serviceUserID",)),
+    Route("call_centers", "put_group_call_center_forced_forwarding", "PUT", "/groups/call-centers/forced-forwarding", (), ("serviceUserID",)),
+    Route("call_centers", "put_group_call_center_overflow", "PUT", "/groups/call-centers/overflow", (), ("serviceUserID",)),
+    Route("call_centers", "put_group_call_center_stranded_calls", "PUT", "/groups/call-centers/stranded-calls", (), ("serviceUserID",)),
+    Route("call_centers", "put_group_call_center_stranded_calls_unavailable", "PUT", "/groups/call-centers/stranded-calls-unavailable", (), ("serviceUserID",)),
+    Route("call_centers", "put_user_call_center_supervised_agents", "PUT", "/groups/call-centers/supervisors", (), ("serviceUserId", "supervisorUserId", "supervisors",)),
+    Route("call_centers", "put_user_call_center", "PUT", "/users/call-center", (), ("userId",)),
+    Route("call_centers", "put_user_call_center_agents_update", "PUT", "/user/call-centers/agents", (), ("agentUserId", "callCenters",)),
+    Route("call_centers", "put_user_call_center_agent_sign_out", "PUT", "/user/call-centers/agents/sign-out", (), ("agentUserId",)),
+    Route("call_forwarding_always", "get_user_call_forwarding_always", "GET", "/users/call-forwarding-always", ("userId",), ()),
+    Route("call_forwarding_always", "get_bulk_call_forwarding_always", "GET", "/users/call-forwarding-always/bulk", ("serviceProviderId", "groupId",), ()),
+    Route("call_forwarding_busy", "get_user_call_forwarding_busy", "GET", "/users/call-forwarding-busy", ("userId",), ()),
+    Route("call_forwarding_busy", "get_bulk_call_forwarding_busy", "GET", "/users/call-forwarding-busy/bulk", ("serviceProviderId", "groupId",), ()),
+    Route("call_forwarding_no_answer", "get_user_call_forwarding_no_answer", "GET", "/users/call-forwarding-no-answer", ("userId",), ()),
+    Route("call_forwarding_no_answer", "get_bulk_call_forwarding_no_answer", "GET", "/users/call-forwarding-no-answer/bulk", ("serviceProviderId", "groupId",), ()),
+    Route("call_forwarding_not_reachable", "get_user_call_forwarding_not_reachable", "GET", "/users/call-forwarding-not-reachable", ("userId",), ()),
+    Route("call_forwarding_not_reachable", "get_bulk_call_forwarding_not_reachable", "GET", "/users/call-forwarding-not-reachable/bulk", ("serviceProviderId", "groupId",), ()),
+    Route("call_forwarding_selective", "get_user_call_forwarding_selective", "GET", "/users/call-forwarding-selective", ("userId",), ()),
+    Route("call_forwarding_selective", "get_user_call_forwarding_selective_criterias", "GET", "/users/call-forwarding-selective/criteria", ("userId",), ()),
+    Route("call_forwarding_selective", "get_user_call_forwarding_selective_criteria", "GET", "/users/call-forwarding-selective/criteria", ("criteriaName", "userId",), ()),
+    Route("call_pickup", "get_call_pickup_groups", "GET", "/groups/call-pickup/groups", ("serviceProviderId", "groupId",), ()),
+    Route("call_pickup", "get_call_pickup_group", "GET", "/groups/call-pickup/groups", ("serviceProviderId", "groupId", "name",), ()),
+    Route("call_pickup", "get_call_pickup_group_user", "GET", "/groups/call-pickup/user", ("serviceProviderId", "groupId", "userId",), ()),
+    Route("call_pickup", "get_call_pickup_available_users", "GET", "groups/call-pickup/users", ("serviceProviderId", "groupId",), ()),
+    Route("call_pickup", "post_call_pickup_group", "POST", "/groups/call-pickup/groups", (), ("serviceProviderId", "groupId", "name",)),
+    Route("call_pickup", "put_call_pickup_group", "PUT", "/groups/call-pickup/groups", (), ("serviceProviderId", "groupId", "name", "users",)),
+    Route("call_pickup", "delete_call_pickup_group", "DELETE", "/groups/call-pickup/groups", ("serviceProviderId", "groupId", "name",), ()),
+    Route("call_processing_policies", "put_user_call_processing_policy", "PUT", "/users/call-processing-policy", (), ("userId",)),
+    Route("call_records", "get_users_stats", "GET", "/users/call-records/stats", ("userIds", "startTime", "endTime",), ()),
+    Route("devices", "post_group_device", "POST", "/groups/devices", (), ("serviceProviderId", "groupId", "deviceName", "deviceType",)),
+    Route("devices", "put_group_devices", "PUT", "/groups/devices", (), ("serviceProviderId", "groupId", "deviceName",)),
+    Route("devices", "put_service_provider_device", "PUT", "/service-providers/devices", (), ("serviceProviderId", "deviceName",)),
+    Route("devices", "put_system_devices", "PUT", "/service-providers/devices", (), ("deviceName",)),
+    Route("devices", "put_system_device_file", "PUT", "/system/devices/files", (), ("deviceName",)),
+    Route("devices", "put_service_provider_device_file", "PUT", "/service_provider/devices/files", (), ("deviceName",)),
+    Route("devices", "put_group_device_file", "PUT", "/groups/devices/files", (), ("deviceName",)),
+    Route("devices", "put_group_device_tags_profile", "PUT", "/groups/devices/profile", (), ("serviceProviderId", "groupId", "deviceName", "tags",)),
+    Route("devices", "put_group_device_tag", "PUT", "/groups/devices/tags", (), ("tagName", "tagValue", "serviceProviderId", "groupId", "deviceName",)),
+    Route("devices", "put_service_provider_device_tag", "PUT", "/service-providers/devices/tags", (), ("tagName", "tagValue", "serviceProviderId", "deviceName",)),
+    Route("devices", "put_system_device_tag", "PUT", "/system/devices/tags", (), ("tagName", "tagValue", "deviceName",)),
+    Route("devices", "put_group_device_type_file", "PUT", "/groups/device-types/files", (), ("serviceProviderId", "groupId", "deviceType",)),
+    Route("devices", "put_group_device_type_tag", "PUT", "/groups/system/device-types/tags", (), ("tagName", "tagValue", "serviceProviderId", "groupId", "deviceType",)),
+    Route("devices", "put_service_provider_device_type_tag", "PUT", "/service-providers/device-types/tags", (), ("tagName", "tagValue", "serviceProviderId", "deviceType",)),
+    Route("dns", "get_group_dns", "GET", "/groups/dns", ("serviceProviderId", "groupId",), ()),
+    Route("dns", "get_group_dn_search", "GET", "/groups/dns/search", ("serviceProviderId", "groupId", "dn", "limit",), ()),
+    Route("dns", "get_group_dn_details", "GET", "/groups/dns/details", ("serviceProviderId", "groupId",), ()),
+    Route("dns", "get_system_dn_search", "GET", "/system/dns/search", ("dn",), ()),
+    Route("dns", "get_system_dn", "GET", "/system/dns", ("phoneNumber",), ()),
+    Route("dns", "get_system_dn_summary", "GET", "/system/dns/summary", (), ()),
+    Route("dns", "get_system_dn_utilization", "GET", "/system/dns/utilization", (), ()),
+    Route("dns", "get_service_provider_dn_search", "GET", "/service-providers/dns/search", ("serviceProviderId", "dn", "limit",), ()),
+    Route("dns", "get_service_provider_dns", "GET", "/service-providers/dns", ("serviceProviderId",), ()),
+    Route("dns", "post_group_dns", "POST", "/groups/dns", (), ("serviceProviderId", "groupId", "dns",)),
+    Route("dns", "post_group_dns_assign_bulk", "POST", "/groups/dns/assign/bulk", (), ("serviceProviderId", "groupId", "dns",)),
+    Route("dns", "post_group_dns_unassign_bulk", "POST", "/groups/dns/unassign/bulk", (), ("serviceProviderId", "groupId", "dns",)),
+    Route("dns", "post_service_provider_dns", "POST", "/groups/dns", (), ("serviceProviderId", "dns",)),
+    Route("dns", "put_group_dns_activate", "PUT", "/groups/dns", (), ("serviceProviderId", "groupId", "dns",)),
+    Route("dns", "delete_group_dns", "DELETE", "/groups/dns", (), ("serviceProviderId", "groupId", "dns",)),
+    Route("dns", "service_provider_dns", "DELETE", "/service-providers/dns", (), ("serviceProviderId", "dns",)),
+    Route("groups", "get_groups", "GET", "/groups", ("serviceProviderId",), ()),
+    Route("groups", "get_group", "GET", "/groups", ("serviceProviderId", "groupId",), ()),
+    Route("groups", "post_group", "POST", "/groups", (), ("serviceProviderId", "groupId", "groupName", "userLimit", "defaultDomain",)),
+    Route("groups", "put_group", "PUT", "/groups", (), ("serviceProviderId", "groupId", "defaultDomain", "timeZone",)),
+    Route("groups", "delete_group", "DELETE", "/groups", (), ("serviceProviderId", "groupId",)),
+    Route("emergency_zones", "post_group_emergency_zones", "POST", "/groups/emergency-zones", (), ("serviceProviderId", "groupId", "ipAddresses",)),
+    Route("emergency_zones", "put_group_emergency_zones", "PUT", "/groups/emergency-zones", (), ("groupId", "serviceProviderId", "isActive", "emergencyZonesProhibition", "sendEmergencyCallNotifyEmail", "emergencyCallNotifyEmailAddress", "ipAddresses",)),
+    Route("extensions", "get_group_extensions", "GET", "/groups/extensions", ("serviceProviderId", "groupId",), ()),
+    Route("extensions", "put_group_extensions", "PUT", "/groups/extensions", ("serviceProviderId", "groupId", "minExtensionLength", "maxExtensionLength", "defaultExtensionLength",), ()),
+    Route("do_not_disturb", "get_user_do_not_disturb", "GET", "/users/do-not-disturb", ("userId",), ()),
+    Route("do_not_disturb", "put_user_do_not_disturb", "PUT", "/users/do-not-disturb", (), ("isActive", "ringSplash", "userId",)),
+    Route("hunt_groups", "get_group_hunt_groups", "GET", "/groups/hunt-groups", ("serviceProviderId", "groupId",), ()),
+    Route("hunt_groups", "get_group_hunt_group", "GET", "/groups/hunt-groups", ("serviceUserId",), ()),
+    Route("hunt_groups", "get_group_hunt_group_user", "GET", "/groups/hunt-groups/user", ("serviceProviderId", "groupId", "userId",), ()),
+    Route("hunt_groups", "get_group_hunt_groups_available_users", "GET", "/groups/hunt-groups/users", ("serviceProviderId", "groupId",), ()),
+    Route("hunt_groups", "post_group_hunt_group", "POST", "/groups/hunt-groups", (), ("serviceProviderId", "groupId", "serviceUserId", "policy", "noAnswerNumberOfRings", "forwardTimeoutSeconds", "agents",)),
+    Route("hunt_groups", "post_group_hunt_groups_remove_user", "POST", "/groups/hunt-groups/removeUser", (), ("serviceProviderId", "groupId", "userId",)),
+    Route("hunt_groups", "put_group_hunt_groups_status", "PUT", "/groups/hunt-groups/status", (), ("instances",)),
+    Route("hunt_groups", "put_group_hunt_group", "PUT", "/groups/hunt-groups", (), ("serviceProviderId", "groupId", "serviceUserId",)),
+    Route("hunt_groups", "put_group_hunt_group_weighted_call_distribution", "PUT", "/groups/hunt-groups/weighted-call-distribution", (), ("serviceProviderId", "groupId", "serviceUserId", "agents",)),
+    Route("hunt_groups", "delete_group_hunt_group", "DELETE", "/groups/hunt-groups", ("serviceUserId",), ()),
+    Route("service_providers", "get_service_providers", "GET", "/service-providers", ("resellerId",), ()),
+    Route("service_providers", "get_service_provider", "GET", "/service-providers", ("serviceProviderId",), ()),
+    Route("services", "get_user_services_assigned", "GET", "/users/services/assigned", ("userId",), ()),
+    Route("services", "get_user_services", "GET", "/users/services", ("userId",), ()),
+    Route("services", "get_user_service_settings", "GET", "/users/services/settings", ("userId",), ()),
+    Route("services", "get_group_services", "GET", "/groups/services", ("groupId", "serviceProviderId",), ()),
+    Route("services", "get_group_services_user_assigned", "GET", "/groups/services/assigned", ("groupId", "serviceProviderId", "serviceType", "serviceName",), ()),
+    Route("services", "put_user_services", "PUT", "/users/services", (), ("userId", "userServices", "servicePackServices",)),
+    Route("services", "put_user_service_settings", "PUT", "/users/services/settings", (), ("userId",)),
+    Route("session", "get_session", "GET", "/auth/session", (), ()),
+    Route("session", "post_session", "POST", "/auth/token", (), ("username", "password",)),
+    Route("session", "post_session_switch", "POST", "/auth/switch-user", (), ("username",)),
+    Route("session", "post_session_logout", "POST", "/auth/token/logout", (), ("token",)),
+    Route("session", "put_session", "PUT", "/auth/token", (), ()),
+    Route("session", "put_change_password", "PUT", "/users/passwords", (), ("userId", "password",)),
+    Route("session", "put_password", "PUT", "/auth/passwords", (), ("userId", "oldPassword", "newPassword",)),
+    Route("session", "put_my_password", "PUT", "/auth/password", (), ("oldPassword", "newPassword",)),
+    Route("shared_call_appearance", "get_user_shared_call_appearance", "GET", "/users/shared-call-appearance", ("userId",), ()),
+    Route("shared_call_appearance", "get_user_shared_call_appearance_bulk", "GET", "/users/shared-call-appearance/bulk", ("serviceProviderId", "groupId",), ()),
+    Route("shared_call_appearance", "get_user_shared_call_appearance_endpoint", "GET", "/users/shared-call-appearance/endpoints", ("deviceLevel", "deviceName", "userId", "linePort",), ()),
+    Route("shared_call_appearance", "post_user_shared_call_appearance_endpoint", "POST", "/users/shared-call-appearance/endpoints", (), ("userId", "linePort", "isActive", "allowOrigination", "allowTermination", "deviceName", "deviceLevel",)),
+    Route("shared_call_appearance", "put_user_shared_call_appearance", "PUT", "/users/shared-call-appearance", (), ("userId",)),
+    Route("shared_call_appearance", "put_user_shared_call_appearance_endpoint", "PUT", "/users/shared-call-appearance/endpoints", (), ("userId", "linePort", "deviceName", "deviceLevel", "isActive", "allowOrigination", "allowTermination",)),
+    Route("shared_call_appearance", "delete_user_shared_call_appearance_endpoint", "DELETE", "/users/shared-call-appearance/endpoints", ("deviceLevel", "deviceName", "userId", "linePort",), ()),
+    Route("schedules", "get_group_schedules", "GET", "/groups/schedules", ("serviceProviderId", "groupId",), ()),
+    Route("schedules", "get_group_events", "GET", "/groups/events", ("serviceProviderId", "groupId", "name", "type",), ()),
+    Route("reports", "get_user_report", "GET", "/users/reports/users", ("userId",), ()),
+    Route("reports", "get_group_report", "GET", "/groups/reports/users", ("serviceProviderId", "groupId",), ()),
+    Route("regsitration", "get_user_registration", "GET", "/users/registration", ("userId",), ()),
+    Route("regsitration", "get_bulk_user_registration", "GET", "/users/registration/bulk", ("serviceProviderId", "groupId",), ()),
+    Route("password_generate", "get_password_generate", "GET", "/password/generate", ("serviceProviderId", "groupId",), ()),
+    Route("password_generate", "get_passwords_generate", "GET", "/password/generate", ("serviceProviderId", "groupId", "limit",), ()),
+    Route("password_generate", "get_passcode_generate", "GET", "/passcode/generate", ("serviceProviderId", "groupId",), ()),
+    Route("password_generate", "get_passcodes_generate", "GET", "/passcode/generate", ("serviceProviderId", "groupId", "limit",), ()),
+    Route("password_generate", "get_sip_password_generate", "GET", "/sip-password/generate", (), ()),
+    Route("password_generate", "get_sip_passwords_generate", "GET", "/password/generate", ("limit",), ()),
+    Route("trunk_groups", "get_group_trunk_groups_call_capacity", "GET", "/groups/trunk-groups/call-capacity", ("groupId", "serviceProviderId",), ()),
+    Route("trunk_groups", "get_group_trunk_group", "GET", "/groups/trunk-groups", ("groupId", "serviceProviderId", "name",), ()),
+    Route("trunk_groups", "get_group_trunk_groups", "GET", "/groups/trunk-groups", ("groupId", "serviceProviderId",), ()),
+    Route("trunk_groups", "get_service_provider_trunk_group_call_capacity", "GET", "/service-providers/trunk-groups/call-capacity", ("serviceProviderId",), ()),
+    Route("trunk_groups", "get_service_provider_trunk_call_capacity_report", "GET", "/service-providers/trunk-groups/call-capacity/reports", ("serviceProviderId",), ()),
+    Route("trunk_groups", "get_group_trunk_group_users", "GET", "/groups/trunk-groups/users", ("serviceProviderId", "groupId", "name",), ()),
+    Route("trunk_groups", "get_group_trunk_available_hosted_users", "GET", "/groups/trunk-groups/users/hosted", ("serviceProviderId", "groupId", "name",), ()),
+    Route("trunk_groups", "get_service_providers_trunk_call_capacity_report_show", "GET", "/service-providers/trunk-groups/call-capacity/reports", ("serviceProviderId",), ()),
+    Route("trunk_groups", "post_group_trunk_group", "POST", "/groups/trunk-groups", (), ("name", "maxActiveCalls", "serviceProviderId", "groupId", "sipAuthenticationUserName", "sipAuthenticationPassword",)),
+    Route("trunk_groups", "put_group_trunk_groups_call_capacity", "PUT", "/groups/trunk-groups/call-capacity", (), ("serviceProviderId", "groupId", "maxActiveCalls", "burstingMaxActiveCalls",)),
+    Route("trunk_groups", "put_group_trunk_group", "PUT", "/groups/trunk-groups", (), ("serviceProviderId", "groupId", "name",)),
+    Route("trunk_groups", "put_service_providers_trunk_group_call_capacity", "PUT", "/service-providers/trunk-groups/call-capacity", (), ("serviceProviderId", "maxActiveCalls", "burstingMaxActiveCalls",)),
+    Route("trunk_groups", "delete_trunk_group", "DELETE", "/groups/trunk-groups", ("serviceProviderId", "groupId", "name",), ()),
+    Route("users", "get_users", "GET", "/users", ("serviceProviderId", "limit", "extended", "groupId",), ()),
+    Route("users", "get_user_password", "GET", "/users/password", ("userId",), ()),
+    Route("users", "get_user_by_id", "GET", "/users", ("userId",), ()),
+    Route("users", "get_user_audit", "GET", "/users/audit", ("userId",), ()),
+    Route("users", "get_user_login_info", "GET", "/users/login-info", ("userId",), ()),
+    Route("users", "get_user_portal_passcode", "GET", "/users/portal-passcode", ("userId",), ()),
+    Route("users", "get_group_user_audit", "GET", "/groups/users/audit", ("serviceProviderId", "groupId",), ()),
+    Route("users", "post_user", "POST", "/users", (), ("callingLineIdFirstName", "callingLineIdLastName", "serviceProviderId", "groupId", "userId", "firstName", "lastName", "extension", "password",)),
+    Route("users", "post_user_reset", "POST", "/users/reset", (), ("userId", "removeFromGroupServices", "removeCallRecords", "removeAlternateUserIds", "removeWebexPerson", "cycleServicePacks", "resetPasswordPasscode",)),
+    Route("users", "put_users_bulk", "PUT", "/users/bulk", (), ("users", "data",)),
+    Route("users", "put_user", "PUT", "/users", (), ("serviceProviderId", "groupId", "userId",)),
+    Route("users", "put_user_portal_passcode", "PUT", "/users/portal-passcode", (), ("userId", "newPasscode",)),
+    Route("users", "put_user_sip_contacts", "PUT", "/users", (), ("serviceProviderId", "groupId", "userId", "contacts",)),
+    Route("users", "put_user_id", "PUT", "/users/user-id", (), ("userId", "newUserId",)),
+    Route("users", "put_group_id_update", "PUT", "/users/group-id", (), ("userId", "newGroupId", "evaluateOnly",)),
+    Route("users", "delete_user", "DELETE", "/users", ("userId",), ()),
+)
+# fmt: on
@@ -7,7 +7,7 @@ class Schedules(BaseEndpoint):
 
     # GET
 
-    def get_group_schedules(self, service_provider_id: str, group_id: str):
+    async def get_group_schedules(self, service_provider_id: str, group_id: str):
         """Retrieves the Business Schedules for the specified group.
 
         Args:
@@ -22,9 +22,9 @@ class Schedules(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id, "groupId": group_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_events(
+    async def get_group_events(
         self, service_provider_id: str, group_id: str, name: str, type: str
     ):
         """Retrieves the Business Schedule's Events for the specified group.
@@ -48,7 +48,7 @@ class Schedules(BaseEndpoint):
             "type": type,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
 
 # POST
@@ -7,7 +7,7 @@ class ServiceProviders(BaseEndpoint):
 
     # GET
 
-    def get_service_providers(self, reseller_id: str = None):
+    async def get_service_providers(self, reseller_id: str = None):
         """
         Fetches list of service providers.
 
@@ -21,9 +21,9 @@ class ServiceProviders(BaseEndpoint):
         endpoint = "/service-providers"
         params = {"resellerId": reseller_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_service_provider(self, service_provider_id: str):
+    async def get_service_provider(self, service_provider_id: str):
         """
         Fetches a service provider by ID with further details.
 
@@ -38,7 +38,7 @@ class ServiceProviders(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
 
 # POST
@@ -7,7 +7,7 @@ class Services(BaseEndpoint):
 
     # GET
 
-    def get_user_services_assigned(self, user_id: str):
+    async def get_user_services_assigned(self, user_id: str):
         """
 
         Args:
@@ -17,9 +17,9 @@ class Services(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_user_services(self, user_id: str):
+    async def get_user_services(self, user_id: str):
         """Fetch all services assigned to a broadwrok entity, this can be
         a user, AA, CC, or HG.
 
@@ -34,9 +34,9 @@ class Services(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_user_service_settings(self, user_id: str):
+    async def get_user_service_settings(self, user_id: str):
         """Retrieves all service settings for a specific user.
 
         Args:
@@ -50,9 +50,9 @@ class Services(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_services(self, group_id: str, service_provider_id: str):
+    async def get_group_services(self, group_id: str, service_provider_id: str):
         """
         Fetch all userServices, groupServices and servicePackServices assigned to a group.
 
@@ -68,9 +68,9 @@ class Services(BaseEndpoint):
 
         params = {"groupId": group_id, "serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_services_user_assigned(
+    async def get_group_services_user_assigned(
         self,
         group_id: str,
         service_provider_id: str,
@@ -99,13 +99,13 @@ class Services(BaseEndpoint):
             "serviceName": service_name,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
     # PUT
 
-    def put_user_services(
+    async def put_user_services(
         self,
         user_id: str,
         services: list = None,
@@ -137,9 +137,9 @@ class Services(BaseEndpoint):
                 {"serviceName": service_pack, "assigned": assigned}
                 for service_pack in service_packs
             ]
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
-    def put_user_service_settings(self, user_id: str, settings: dict):
+    async def put_user_service_settings(self, user_id: str, settings: dict):
         """Updates specific service settings for a given user.
         This function allows you to modify one or more service settings associated with a particular user.
 
@@ -155,7 +155,7 @@ class Services(BaseEndpoint):
 
         data = {"userId": user_id, **settings}
 
-        return self._requester.put(endpoint, data=data)
+        return await self._requester.put(endpoint, data=data)
 
 
 # DELETE
@@ -2,17 +2,17 @@ from .base_endpoint import BaseEndpoint
 
 
 class Session(BaseEndpoint):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
     # GET
 
-    def get_session(self):
+    async def get_session(self):
         """Fetches session information for currently logged in user"""
 
         endpoint = "/auth/session"
 
-        return self._requester.get(endpoint)
+        return await self._requester.get(endpoint)
 
     # POST
 
@@ -30,7 +30,7 @@ class Session(BaseEndpoint):
 
         return await self._requester.post(endpoint, data=payload)
 
-    def post_session_switch(self, username: str):
+    async def post_session_switch(self, username: str):
         """Switch users
 
         Args:
@@ -41,27 +41,27 @@ class Session(BaseEndpoint):
 
         payload = {"username": username}
 
-        return self._requester.post(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
-    def post_session_logout(self):
+    async def post_session_logout(self):
         """Logs out of session"""
 
         endpoint = "/auth/token/logout"
 
         payload = {"token": self._requester.token}
 
-        return self._requester(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
     # PUT
 
-    def put_session(self):
+    async def put_session(self):
         """Refreshes access token fetching a new one which will expire in 24hr"""
 
         endpoint = "/auth/token"
 
-        return self._requester.put(endpoint)
+        return await self._requester.put(endpoint)
 
-    def put_change_password(self, user_id: str, new_password: str):
+    async def put_change_password(self, user_id: str, new_password: str):
         """Set new Web Authentication password for a single user.
 
         Args:
@@ -76,9 +76,9 @@ class Session(BaseEndpoint):
 
         updates = {"userId": user_id, "password": new_password}
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_password(self, user_id: str, old_password: str, new_password: str):
+    async def put_password(self, user_id: str, old_password: str, new_password: str):
         """Change password of a specific user.
 
         Args:
@@ -95,9 +95,9 @@ class Session(BaseEndpoint):
             "newPassword": new_password,
         }
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_my_password(self, old_password: str, new_password: str):
+    async def put_my_password(self, old_password: str, new_password: str):
         """Change the password of the current user
 
         Args:
@@ -109,6 +109,6 @@ class Session(BaseEndpoint):
 
         updates = {"oldPassword": old_password, "newPassword": new_password}
 
-        self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
     # DELETE
@@ -7,7 +7,7 @@ class SharedCallAppearance(BaseEndpoint):
 
     # GET
 
-    def get_user_shared_call_appearance(self, user_id: str):
+    async def get_user_shared_call_appearance(self, user_id: str):
         """Gets all Shared Call Appearances (SCAs) for a specified user.
 
         Args:
@@ -21,9 +21,9 @@ class SharedCallAppearance(BaseEndpoint):
 
         params = {"userId": user_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_user_shared_call_appearance_bulk(
+    async def get_user_shared_call_appearance_bulk(
         self, service_provider_id: str, group_id: str
     ):
         """Gets all Shared Call Appearances (SCAs) within a specified group.
@@ -43,9 +43,9 @@ class SharedCallAppearance(BaseEndpoint):
             "groupId": group_id,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_user_shared_call_appearance_endpoint(
+    async def get_user_shared_call_appearance_endpoint(
         self, device_level: str, device_name: str, user_id: str, line_port: str
     ):
         """Gets a specific Shared Call Appearance (SCA) endpoint for a specified user.
@@ -69,11 +69,11 @@ class SharedCallAppearance(BaseEndpoint):
             "linePort": line_port,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
 
-    def post_user_shared_call_appearance_endpoint(
+    async def post_user_shared_call_appearance_endpoint(
         self, user_id: str, line_port: str, device_name: str
     ):
         """Creates a new Shared Call Apprance (SCA) on a single user.
@@ -99,11 +99,11 @@ class SharedCallAppearance(BaseEndpoint):
             "deviceLevel": "Group",
         }
 
-        return self._requester.post(endpoint, data=data)
+        return await self._requester.post(endpoint, data=data)
 
     # PUT
 
-    def put_user_shared_call_appearance(self, user_id: str, settings: dict):
+    async def put_user_shared_call_appearance(self, user_id: str, settings: dict):
         """Updates the Shared Call Appearance (SCA) settings for a specified user.
 
         Args:
@@ -121,9 +121,9 @@ class SharedCallAppearance(BaseEndpoint):
             **settings,
         }
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_user_shared_call_appearance_endpoint(
+    async def put_user_shared_call_appearance_endpoint(
         self,
         user_id: str,
         line_port: str,
@@ -160,11 +160,11 @@ class SharedCallAppearance(BaseEndpoint):
             "allowTermination": allow_termination,
         }
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
     # DELETE
 
-    def delete_user_shared_call_appearance_endpoint(
+    async def delete_user_shared_call_appearance_endpoint(
         self, device_level: str, device_name: str, user_id: str, line_port: str
     ):
         """Deletes a Shared Call Appearance (SCA) endpoint for a specified user.
@@ -190,4 +190,4 @@ class SharedCallAppearance(BaseEndpoint):
             "linePort": line_port,
         }
 
-        return self._requester.delete(endpoint, params=params)
+        return await self._requester.delete(endpoint, params=params)
@@ -6,7 +6,7 @@ class TrunkGroups(BaseEndpoint):
         super().__init__(*args, **kwargs)
 
     # GET
-    def get_group_trunk_groups_call_capacity(
+    async def get_group_trunk_groups_call_capacity(
         self, service_provider_id: str, group_id: str
     ):
         """Fetches Trunk Call Capacity data for a single Group.
@@ -23,9 +23,9 @@ class TrunkGroups(BaseEndpoint):
 
         params = {"groupId": group_id, "serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_trunk_group(
+    async def get_group_trunk_group(
         self, service_provider_id: str, group_id: str, trunk_group_name: str
     ):
         """Fetches all Trunk Group details of a single Trunk Group in a Group.
@@ -47,9 +47,9 @@ class TrunkGroups(BaseEndpoint):
             "name": trunk_group_name,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_trunk_groups(self, service_provider_id: str, group_id: str):
+    async def get_group_trunk_groups(self, service_provider_id: str, group_id: str):
         """Fetches list of all trunk groups in a single group.
 
         Args:
@@ -64,9 +64,11 @@ class TrunkGroups(BaseEndpoint):
 
         params = {"groupId": group_id, "serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_service_provider_trunk_group_call_capacity(self, service_provider_id: str):
+    async def get_service_provider_trunk_group_call_capacity(
+        self, service_provider_id: str
+    ):
         """Fetches trunk call capacity details of a single Service Provider.
 
         Args:
@@ -80,9 +82,11 @@ class TrunkGroups(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_service_provider_trunk_call_capacity_report(self, service_provider_id: str):
+    async def get_service_provider_trunk_call_capacity_report(
+        self, service_provider_id: str
+    ):
         """Fetches trunk call capacity details of Service Provider/ Enterprise and all Groups in the SP/ ENT.
 
             Args:
@@ -97,9 +101,9 @@ class TrunkGroups(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_trunk_group_users(
+    async def get_group_trunk_group_users(
         self, service_provider_id: str, group_id: str, trunk_name: str
     ):
         """Fetches a list of users assigned to a specific trunk.
@@ -120,9 +124,9 @@ class TrunkGroups(BaseEndpoint):
             "name": trunk_name,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_group_trunk_available_hosted_users(
+    async def get_group_trunk_available_hosted_users(
         self, service_provider_id: str, group_id: str, trunk_name: str
     ):
         """Fetches a list of users available to assign to the trunk group
@@ -143,9 +147,9 @@ class TrunkGroups(BaseEndpoint):
             "name": trunk_name,
         }
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
-    def get_service_providers_trunk_call_capacity_report_show(
+    async def get_service_providers_trunk_call_capacity_report_show(
         self, service_provider_id: str
     ):
         """Returns a report of each group in a Servcice Provider showing their call capacity values etc.
@@ -160,10 +164,10 @@ class TrunkGroups(BaseEndpoint):
 
         params = {"serviceProviderId": service_provider_id}
 
-        return self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params)
 
     # POST
-    def post_group_trunk_group(
+    async def post_group_trunk_group(
         self,
         service_provider_id: str,
         group_id: str,
@@ -226,11 +230,11 @@ class TrunkGroups(BaseEndpoint):
             payload["sipAuthenticationUserName"] = sip_authentication_username
             payload["sipAuthenticationPassword"] = sip_authentication_password
 
-        return self._requester.post(endpoint, data=payload)
+        return await self._requester.post(endpoint, data=payload)
 
     # PUT
 
-    def put_group_trunk_groups_call_capacity(
+    async def put_group_trunk_groups_call_capacity(
         self,
         service_provider_id: str,
         group_id: str,
@@ -259,9 +263,9 @@ class TrunkGroups(BaseEndpoint):
         if bursting_max_active_calls is not None:
             updates["burstingMaxActiveCalls"] = bursting_max_active_calls
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_group_trunk_group(
+    async def put_group_trunk_group(
         self,
         service_provider_id: str,
         group_id: str,
@@ -283,9 +287,9 @@ class TrunkGroups(BaseEndpoint):
         updates["groupId"] = group_id
         updates["name"] = trunk_group_name
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
-    def put_service_providers_trunk_group_call_capacity(
+    async def put_service_providers_trunk_group_call_capacity(
         self,
         service_provider_id: str,
         max_active_calls: int,
@@ -309,11 +313,11 @@ class TrunkGroups(BaseEndpoint):
         if bursting_max_active_calls is not None:
             updates["burstingMaxActiveCalls"] = bursting_max_active_calls
 
-        return self._requester.put(endpoint, data=updates)
+        return await self._requester.put(endpoint, data=updates)
 
     # DELETE
 
-    def delete_trunk_group(
+    async def delete_trunk_group(
         self, service_provider_id: str, group_id: str, trunk_name: str
     ):
         """Deletes a trunk group.
@@ -334,4 +338,4 @@ class TrunkGroups(BaseEndpoint):
             "name": trunk_name,
         }
 
-        return self._requester.delete(endpoint, params=params)
+        return await self._requester.delete(endpoint, params=params)
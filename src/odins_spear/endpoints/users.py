@@ -16,6 +16,7 @@ class Users(BaseEndpoint):
         filter_value: str = None,
         limit: int = None,
         extended=False,
+        stream: bool = False,
     ):
         """
         Returns list of users depending on filter criteria.
@@ -28,6 +29,8 @@ class Users(BaseEndpoint):
             filter_type (str, optional): Options: equals, startsWith, endsWith, contains or endsWith. async Defaults to None.
             filter_value (str, optional): Value filtering on e.g. firstName. async Defaults to None.
             limit (int, optional): Limits the amount of values API returns. async Defaults to None.
+            stream (bool, optional): Return an async iterator yielding users as they download
+                rather than the whole list, for extended listings of large enterprises. Defaults to False.
 
         Returns:
             dict: List of users.
@@ -74,7 +77,7 @@ class Users(BaseEndpoint):
         if extended:
             params["extended"] = True
 
-        return await self._requester.get(endpoint, params=params)
+        return await self._requester.get(endpoint, params=params, stream=stream)
 
     async def get_user_password(self, user_id: str):
         """Returns login and password expiry details of target user.
@@ -15,15 +15,43 @@ class OSApiResponseError(OSError):
     """Raised when Odin Api returns an error code."""
 
     def __init__(self, response):
-        response = response.json()
-        self.response = (
-            f"{response['details']} {response['status']}: {response['error']}"
-        )
+        self.status_code = response.status_code
+        try:
+            body = response.json()
+            self.response = f"{body['details']} {body['status']}: {body['error']}"
+        except (ValueError, KeyError, TypeError):
+            # gateways in front of Odin can answer 5xx/ 429 with non-JSON bodies
+            self.response = f"{response.status_code}: {response.text}"
 
     def __str__(self) -> str:
         return self.response
 
 
+class OSCircuitOpenError(OSError):
+    """Raised when requests to an endpoint are failing fast after repeated failures."""
+
+    def __init__(self, circuit, retry_in):
+        self.circuit = circuit
+        self.retry_in = retry_in
+
+    def __str__(self) -> str:
+        return (
+            f"Circuit open for {self.circuit} after repeated failures, "
+            f"trial requests allowed in {self.retry_in:.1f}s."
+        )
+
+
+class OSCassetteMissError(OSError):
+    """Raised when a replayed request was never recorded in the cassette."""
+
+    def __init__(self, method, url):
+        self.method = method
+        self.url = url
+
+    def __str__(self) -> str:
+        return f"No recording of {self.method} {self.url} in the cassette."
+
+
 class OSRequestTypeError(OSError):
     """Raised when unsupport request type is given."""
 
@@ -1,29 +1,18 @@
+from contextlib import nullcontext
 from typing import Optional
 
 from . import reports
 from .api import API
+from .utils.scheduler import current_priority, request_priority
 
 
 class Reporter:
     """generates human friendly reports."""
 
-    __instance = None
-
-    @staticmethod
-    def get_instance(api: API):
-        """Static method to fetch the current instance."""
-        if Reporter.__instance is None:
-            Reporter(api)
-        return Reporter.__instance
-
     def __init__(self, api: API) -> None:
-        if Reporter.__instance is not None:
-            raise Exception("This class is a singleton!")
-        else:
-            self.api = api
-            Reporter.__instance = self
+        self.api = api
 
-    def _run_report(self, report_name: str, *args, **kwargs):
+    async def _run_report(self, report_name: str, *args, **kwargs):
         """Run a report function from the reports module."""
         self.api.logger.debug(
             f"Report {report_name} executed, args: {[args]}, kwargs: {kwargs}"
@@ -38,9 +27,20 @@ class Reporter:
             raise AttributeError(
                 f"Report '{report_name}' not found in 'reports' module."
             )
-        return report_function(self.api, *args, **kwargs)
+        # reports sweep whole groups, let interactive calls overtake them
+        lane = current_priority()
+        if lane == "normal":
+            lane = "bulk"
+        tracer = self.api.tracer
+        span = (
+            tracer.span(f"report {report_name}", report=report_name, priority=lane)
+            if tracer is not None
+            else nullcontext()
+        )
+        with request_priority(lane), span:
+            return await report_function(self.api, *args, **kwargs)
 
-    def call_flow(
+    async def call_flow(
         self,
         *,
         service_provider_id: str,
@@ -65,7 +65,7 @@ class Reporter:
         Returns: Boolean True if report was generated successfully.
         """
 
-        return self._run_report(
+        return await self._run_report(
             "call_flow",
             service_provider_id,
             group_id,
@@ -74,7 +74,7 @@ class Reporter:
             broadworks_entity_type,
         )
 
-    def group_users_call_statistics(
+    async def group_users_call_statistics(
         self,
         *,
         service_provider_id: str,
@@ -105,7 +105,7 @@ class Reporter:
                 
         Returns: Boolean True if report was generated successfully.
         """
-        return self._run_report(
+        return await self._run_report(
             "group_users_call_statistics",
             service_provider_id,
             group_id,
@@ -116,7 +116,7 @@ class Reporter:
             time_zone,
         )
 
-    def user_registration_report(
+    async def user_registration_report(
         self, *, service_provider_id: str, group_id: str
     ) -> bool:
         """Generates an Excel Worksheet detailing each Users ID, device name and registration status within a group.
@@ -129,6 +129,6 @@ class Reporter:
 
         Returns: Boolean True if report was generated successfully.
         """
-        return self._run_report(
+        return await self._run_report(
             "user_registration_report", service_provider_id, group_id
         )
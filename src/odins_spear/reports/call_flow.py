@@ -7,7 +7,7 @@ from ..store import DataStore
 from ..store import broadwork_entities as bre
 
 
-def main(
+async def main(
     api,
     service_provider_id: str,
     group_id: str,
@@ -22,34 +22,34 @@ def main(
     logger.info("Fetching Service Provider & Group details")
     # Gather entities
     service_provider = bre.ServiceProvider.from_dict(
-        data=api.service_providers.get_service_provider(service_provider_id)
+        data=await api.service_providers.get_service_provider(service_provider_id)
     )
     group = bre.Group.from_dict(
         service_provider=service_provider,
-        data=api.groups.get_group(service_provider_id, group_id),
+        data=await api.groups.get_group(service_provider_id, group_id),
     )
 
     data_store.store_objects(service_provider, group)
 
     logger.info("Fetching group auto attendants")
-    auto_attendants = api.auto_attendants.get_auto_attendants(
+    auto_attendants = await api.auto_attendants.get_auto_attendants(
         service_provider_id, group_id
     )
     for aa in auto_attendants:
         auto_attendant = bre.AutoAttendant.from_dict(
             group=group,
-            data=api.auto_attendants.get_auto_attendant(aa["serviceUserId"]),
+            data=await api.auto_attendants.get_auto_attendant(aa["serviceUserId"]),
         )
         data_store.auto_attendants.append(auto_attendant)
 
     logger.info("Fetching all users this may take a couple of minutes")
-    users = api.users.get_users(service_provider_id, group_id, extended=True)
+    users = await api.users.get_users(service_provider_id, group_id, extended=True)
 
     # Captures users with the forward fucntionality
     logger.info("Fetching call forward always users")
     call_forward_always_users = [
         item["user"]["userId"]
-        for item in api.call_forwarding_always.get_bulk_call_forwarding_always(
+        for item in await api.call_forwarding_always.get_bulk_call_forwarding_always(
             service_provider_id, group_id
         )
         if item["service"]["assigned"] and item["data"]["isActive"]
@@ -58,7 +58,7 @@ def main(
     logger.info("Fetching call forward busy users")
     call_forward_busy_users = [
         item["user"]["userId"]
-        for item in api.call_forwarding_busy.get_bulk_call_forwarding_busy(
+        for item in await api.call_forwarding_busy.get_bulk_call_forwarding_busy(
             service_provider_id, group_id
         )
         if item["service"]["assigned"] and item["data"]["isActive"]
@@ -67,7 +67,7 @@ def main(
     logger.info("Fetching call forward no answer users")
     call_forward_no_answer_users = [
         item["user"]["userId"]
-        for item in api.call_forwarding_no_answer.get_bulk_call_forwarding_no_answer(
+        for item in await api.call_forwarding_no_answer.get_bulk_call_forwarding_no_answer(
             service_provider_id, group_id
         )
         if item["service"]["assigned"] and item["data"]["isActive"]
@@ -76,7 +76,7 @@ def main(
     logger.info("Fetching call forward not reachable users")
     call_forward_not_reachable = [
         item["user"]["userId"]
-        for item in api.call_forwarding_not_reachable.get_bulk_call_forwarding_not_reachable(
+        for item in await api.call_forwarding_not_reachable.get_bulk_call_forwarding_not_reachable(
             service_provider_id, group_id
         )
         if item["service"]["assigned"] and item["data"]["isActive"]
@@ -88,47 +88,53 @@ def main(
 
         if user.id in call_forward_always_users:
             user.call_forwarding_always = str(
-                api.call_forwarding_always.get_user_call_forwarding_always(user.id)[
-                    "forwardToPhoneNumber"
-                ]
+                (
+                    await api.call_forwarding_always.get_user_call_forwarding_always(
+                        user.id
+                    )
+                )["forwardToPhoneNumber"]
             )
         if user.id in call_forward_busy_users:
             user.call_forwarding_busy = str(
-                api.call_forwarding_busy.get_user_call_forwarding_busy(user.id)[
+                (await api.call_forwarding_busy.get_user_call_forwarding_busy(user.id))[
                     "forwardToPhoneNumber"
                 ]
             )
         if user.id in call_forward_no_answer_users:
             user.call_forwarding_no_answer = str(
-                api.call_forwarding_no_answer.get_user_call_forwarding_no_answer(
-                    user.id
+                (
+                    await api.call_forwarding_no_answer.get_user_call_forwarding_no_answer(
+                        user.id
+                    )
                 )["forwardToPhoneNumber"]
             )
         if user.id in call_forward_not_reachable:
             user.call_forwarding_not_reachable = str(
-                api.call_forwarding_not_reachable.get_user_call_forwarding_not_reachable(
-                    user.id
+                (
+                    await api.call_forwarding_not_reachable.get_user_call_forwarding_not_reachable(
+                        user.id
+                    )
                 )["forwardToPhoneNumber"]
             )
 
         data_store.users.append(user)
 
     logger.info("Fetching call centers")
-    call_centers = api.call_centers.get_group_call_centers(
+    call_centers = await api.call_centers.get_group_call_centers(
         service_provider_id, group_id
     )
 
     logger.info("Analysing call centers")
     for cc in call_centers:
-        call_center = api.call_centers.get_group_call_center(cc["serviceUserId"])
-        call_center["agents"] = api.call_centers.get_group_call_center_agents(
-            cc["serviceUserId"]
+        call_center = await api.call_centers.get_group_call_center(cc["serviceUserId"])
+        call_center["agents"] = (
+            await api.call_centers.get_group_call_center_agents(cc["serviceUserId"])
         )["agents"]
 
         call_center = bre.CallCenter.from_dict(group=group, data=call_center)
 
         try:
-            overflow_settings = api.call_centers.get_group_call_center_overflow(
+            overflow_settings = await api.call_centers.get_group_call_center_overflow(
                 call_center.service_user_id
             )
             call_center.overflow_calls_action = overflow_settings["action"]
@@ -145,7 +151,7 @@ def main(
 
         try:
             stranded_calls_settings = (
-                api.call_centers.get_group_call_center_stranded_calls(
+                await api.call_centers.get_group_call_center_stranded_calls(
                     call_center.service_user_id
                 )
             )
@@ -167,7 +173,7 @@ def main(
 
         try:
             stranded_calls_unavailable_settings = (
-                api.call_centers.get_group_call_center_stranded_calls_unavailable(
+                await api.call_centers.get_group_call_center_stranded_calls_unavailable(
                     call_center.service_user_id
                 )
             )
@@ -192,7 +198,7 @@ def main(
 
         try:
             forced_forwarding_settings = (
-                api.call_centers.get_group_call_center_forced_forwarding(
+                await api.call_centers.get_group_call_center_forced_forwarding(
                     call_center.service_user_id
                 )
             )
@@ -217,10 +223,13 @@ def main(
         data_store.call_centers.append(call_center)
 
     logger.info("Fetching hunt groups")
-    hunt_groups = api.hunt_groups.get_group_hunt_groups(service_provider_id, group_id)
+    hunt_groups = await api.hunt_groups.get_group_hunt_groups(
+        service_provider_id, group_id
+    )
     for hg in hunt_groups:
         hunt_group = bre.HuntGroup.from_dict(
-            group=group, data=api.hunt_groups.get_group_hunt_group(hg["serviceUserId"])
+            group=group,
+            data=await api.hunt_groups.get_group_hunt_group(hg["serviceUserId"]),
         )
         data_store.hunt_groups.append(hunt_group)
 
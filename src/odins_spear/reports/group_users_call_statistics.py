@@ -6,7 +6,7 @@ from ..utils.filers import copy_single_file_to_target_directory
 from .report_utils.report_entities import call_records_statistics
 
 
-def main(
+async def main(
     api: object,
     service_provider_id: str,
     group_id: str,
@@ -41,38 +41,24 @@ def main(
 
     # Fetches complete list of users in group
     logger.info("fetching groups users")
-    users = api.users.get_users(service_provider_id, group_id)
+    users = await api.users.get_users(service_provider_id, group_id)
     failed_users = []
 
     # Pulls stats for each user, instantiates call_records_statistics, and append to group_users_statistics
     logger.info("Fetching users call statistics")
     for user in users:
         try:
-            user_statistics = api.call_records.get_users_stats(
+            user_statistics = await api.call_records.get_users_stats(
                 user["userId"], start_date, end_date, start_time, end_time, time_zone
             )
 
-            user_services = api.services.get_user_services(user_id=user["userId"])
+            user_services = await api.services.get_user_services(user_id=user["userId"])
 
         except Exception:
-            logger.error(f"Failed to fetch {user} statistics - attempt 1/2")
-            # attempt 2 in case of connection time out
-            try:
-                user_statistics = api.call_records.get_users_stats(
-                    user["userId"],
-                    start_date,
-                    end_date,
-                    start_time,
-                    end_time,
-                    time_zone,
-                )
-
-                user_services = api.services.get_user_services(user_id=user["userId"])
-
-            except Exception:
-                logger.error(f"Failed to fetch {user} statistics - attempt 2/2")
-                failed_users.append(user)
-                continue
+            # transient failures have already been retried by the requester
+            logger.error(f"Failed to fetch {user} statistics")
+            failed_users.append(user)
+            continue
 
         # Correction for API removing userId if no calls made by user
         if not user_statistics:
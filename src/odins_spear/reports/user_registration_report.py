@@ -30,7 +30,7 @@ def export_to_xlsx(data: dict, group_id: str):
     )
 
 
-def main(api, service_provider_id: str, group_id: str):
+async def main(api, service_provider_id: str, group_id: str):
     """Generates an Excel Worksheet detailing each Users ID, device name and registration status within a group.
 
     Args:
@@ -44,8 +44,8 @@ def main(api, service_provider_id: str, group_id: str):
     logger = api.logger
 
     logger.info("Calling scripter.user_registration to fetch data")
-    scripter = Scripter.get_instance(api)
-    data = scripter.user_registration(
+    scripter = Scripter(api)
+    data = await scripter.user_registration(
         service_provider_id=service_provider_id, group_id=group_id
     )
     logger.info("Scripter successfully fetched data")
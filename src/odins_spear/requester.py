@@ -1,110 +1,791 @@
-import requests
 import json
-from httpx import AsyncClient
-from ratelimit import limits, sleep_and_retry
+import asyncio
+import contextlib
+import contextvars
+import inspect
+import logging
+import time
 
+import httpx
+
+from .endpoints.registry import RouteTable
 from .exceptions import OSApiResponseError
+from .utils.cache import never_cached
+from .utils.circuit_breaker import OPEN
+from .utils.codec import get_codec
+from .utils.compression import CompressionPolicy
+from .utils.connection import ConnectionConfig
 from .utils.formatters import sanitise_data
+from .utils.helpers import token_expiry, token_subject
+from .utils.json_stream import JSONArrayStream
+from .utils.rate_limiter import AdaptiveRateLimiter, TokenBucket
+from .utils.retry import RetryPolicy
+from .utils.scheduler import RequestScheduler, current_priority, request_priority
 
+# set while re-authenticating so the auth requests themselves are not paused or replayed
+_authenticating = contextvars.ContextVar("authenticating", default=False)
 
-class Requester:
-    __instance = None  # Class variable to hold the singleton instance
+HOOK_EVENTS = ("before_request", "after_response", "on_error")
 
-    @staticmethod
-    def get_instance(base_url=None, rate_limit=None, logger=None):
-        if Requester.__instance is None:
-            Requester(base_url, rate_limit, logger)
-        return Requester.__instance
 
-    def __init__(self, base_url, rate_limit, logger):
+class Requester:
+    def __init__(
+        self,
+        base_url,
+        rate_limit,
+        logger,
+        rate_limit_per_second=5.0,
+        rate_limit_burst=5,
+        adaptive_rate_limit=False,
+        rate_limit_min_per_second=1.0,
+        rate_limit_max_per_second=50.0,
+        max_concurrent_requests=100,
+        endpoint_concurrency_limits=None,
+        priority_weights=None,
+        connection=None,
+        retry_policy=None,
+        coalesce_requests=True,
+        response_cache=None,
+        json_codec=None,
+        hedge_policy=None,
+        circuit_breaker=None,
+        authenticator=None,
+        token_refresh_margin=300.0,
+        token_lifetime=24 * 60 * 60,
+        hooks=None,
+        metrics=None,
+        tracer=None,
+        compression=None,
+        routes=None,
+        account=None,
+    ):
         """
         Initialize the Requester with default values.
 
-        NOTE: This object is a singleton and can't be instantiated more than once.
+        Every endpoint of the owning API uses this requester so they all share:
+        - scheduler: caps requests in flight globally and per endpoint prefix, waiting
+          requests are queued in interactive/ normal/ bulk lanes weighted by
+          priority_weights. Pass priority= per call or wrap calls in request_priority().
+        - rate_limiter: token bucket consulted while rate_limit is True, with
+          adaptive_rate_limit its rate is tuned from Odin's 429/ 503s and latency.
+        - client: pools and keeps connections alive as set in connection
+          (ConnectionConfig), call aclose() to shut them down.
+        - retry_policy: how failed requests are retried (RetryPolicy).
+        - coalesce_requests: identical GETs in flight at the same time share one request.
+        - cache: optional ResponseCache of GET responses, writes invalidate it, a
+          SQLiteResponseCache is shared with other processes using the same file.
+        - codec: JSONCodec encoding request and decoding response bodies, the fastest
+          installed of orjson, msgspec and json by default.
+        - hedge_policy: optional HedgePolicy, slow GETs are raced against a duplicate.
+        - circuit_breaker: optional CircuitBreaker, requests to an endpoint that keeps
+          failing raise OSCircuitOpenError straight away until it recovers.
+        - authenticator: async callable fetching a new token and passing it to
+          set_token(). It is called once for every waiter when the token is within
+          token_refresh_margin seconds of expiring or Odin rejects it with a 401. New
+          requests pause meanwhile and rejected requests are replayed. The expiry is
+          read from the token if it is a JWT, otherwise token_lifetime is assumed.
+        - hooks: callbacks run for every request sent to Odin, retries and hedges
+          included, see add_hook().
+        - metrics: optional MetricsCollector of per endpoint counts, status codes, bytes,
+          latency and time spent waiting on the scheduler and rate limiter.
+        - tracer: optional Tracer, each call gets a span with its endpoint, status code
+          and duration, a child of the script or report span it was made from.
+        - compression: CompressionPolicy, the Accept-Encoding negotiated for responses
+          and which request bodies are gzipped.
+        - routes: RouteTable whose EndpointPolicy per method and path overrides the
+          cache TTL, whether a request is retried and its scheduler lane, the registry's
+          routes and policies by default.
+        - account: username the requester is authenticated as. It and the token's 'sub'
+          claim are part of every response cache key, so accounts sharing a
+          SQLiteResponseCache never read each other's responses.
+
+        Each API owns its own requester, so several APIs can talk to different Odin
+        servers concurrently from one event loop.
         """
-        if Requester.__instance is not None:
-            raise Exception("Singleton cannot be instantiated more than once!")
+        self.logger = logger
+        self.connection = connection or ConnectionConfig()
+        self.client = self.connection.build_client(self.logger)
+        self.base_url = base_url
+        self.account = account
+        self.rate_limit = rate_limit
+        if adaptive_rate_limit:
+            self.rate_limiter = AdaptiveRateLimiter(
+                rate_limit_per_second,
+                rate_limit_burst,
+                min_rate=rate_limit_min_per_second,
+                max_rate=rate_limit_max_per_second,
+                logger=self.logger,
+            )
         else:
-            self.client = AsyncClient()
-            self.base_url = base_url
-            self.rate_limit = rate_limit
-            self.headers = {
-                "Authorization": "",
-                "Content-Type": "application/json",
-            }
-            self.logger = logger
+            self.rate_limiter = TokenBucket(rate_limit_per_second, rate_limit_burst)
+        self.scheduler = RequestScheduler(
+            max_concurrent_requests, endpoint_concurrency_limits, priority_weights
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.coalesce_requests = coalesce_requests
+        self.coalesced_requests = 0
+        self._in_flight_gets = {}
+        self.cache = response_cache
+        self.codec = json_codec or get_codec()
+        self.hedge_policy = hedge_policy
+        self.circuit_breaker = circuit_breaker
+        self.authenticator = authenticator
+        self.token_refresh_margin = token_refresh_margin
+        self.token_lifetime = token_lifetime
+        self.token = None
+        self.token_expires = None
+        self.reauthentications = 0
+        self._auth_task = None
+        self.hooks = {event: [] for event in HOOK_EVENTS}
+        for event, callbacks in (hooks or {}).items():
+            for callback in callbacks:
+                self.add_hook(event, callback)
+        self.metrics = metrics
+        self.tracer = tracer
+        self.compression = compression or CompressionPolicy()
+        self.routes = routes if routes is not None else RouteTable()
+        self.headers = {
+            "Authorization": "",
+            "Content-Type": "application/json",
+            "Accept-Encoding": self.compression.accept_encoding,
+        }
 
-            self.logger.info(
-                f"Requester initialized with base_url: {self.base_url}, rate_limit: {self.rate_limit}"
+        self.logger.info(
+            f"Requester initialized with base_url: {self.base_url}, rate_limit: {self.rate_limit}, rate_limiter: {self.rate_limiter}, scheduler: {self.scheduler}, connection: {self.connection}, retry_policy: {self.retry_policy}, cache: {self.cache}, codec: {self.codec.name}, compression: {self.compression}"
+        )
+
+    async def aclose(self):
+        """Closes all pooled connections. A fresh client is put in place so the requester
+        can still be used afterwards, it only opens connections once a request is sent.
+        """
+
+        await self.client.aclose()
+        self.client = self.connection.build_client(self.logger)
+        self.logger.info("Requester connections closed")
+
+    def add_hook(self, event, callback):
+        """Registers a callback run for every request sent to Odin. Callbacks may be
+        plain functions or coroutine functions and run in the order added, an exception
+        raised by one is logged and does not fail the request.
+
+        - before_request(request): the httpx.Request about to be sent, its headers may
+          be changed e.g. to add a correlation id.
+        - after_response(request, response, elapsed): every response, 4xx/ 5xx
+          included, with the seconds it took.
+        - on_error(request, error): the request failed without a response e.g. a timeout.
+
+        Args:
+            event (str): before_request, after_response or on_error
+            callback (Callable): Called with the arguments above.
+        """
+
+        if event not in self.hooks:
+            raise ValueError(f"Unknown hook '{event}', expected one of {HOOK_EVENTS}")
+        self.hooks[event].append(callback)
+
+    def remove_hook(self, event, callback):
+        """Removes a callback added with add_hook()."""
+        self.hooks[event].remove(callback)
+
+    async def _run_hooks(self, event, *args):
+        for callback in self.hooks[event]:
+            try:
+                result = callback(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                self.logger.exception("Hook %r failed, event: %s", callback, event)
+
+    def set_token(self, token):
+        """Sets the bearer token sent with every request and when it expires."""
+        self.token = token
+        self.headers["Authorization"] = f"Bearer {token}"
+        expires = token_expiry(token)
+        if expires is None and self.token_lifetime:
+            expires = time.time() + self.token_lifetime
+        self.token_expires = expires
+
+    async def reauthenticate(self, stale_token=None):
+        """Fetches a new token through the authenticator. Concurrent callers share one
+        re-authentication instead of each logging in.
+
+        Args:
+            stale_token (str, optional): Token the caller found expired or rejected, if it
+                was already replaced nothing is done. Defaults to None.
+        """
+
+        if self._auth_task is None:
+            if stale_token is not None and stale_token != self.token:
+                return
+            self._auth_task = asyncio.ensure_future(self._run_authenticator())
+        await asyncio.shield(self._auth_task)
+
+    async def _run_authenticator(self):
+        _authenticating.set(True)
+        self.logger.info("Re-authenticating with Odin")
+        try:
+            # every other request is waiting on this one
+            with request_priority("interactive"):
+                await self.authenticator()
+            self.reauthentications += 1
+        finally:
+            self._auth_task = None
+
+    async def _wait_for_token(self):
+        """Pauses while a re-authentication is in progress and refreshes the token
+        shortly before it expires."""
+
+        if self.authenticator is None or _authenticating.get():
+            return
+        if self._auth_task is not None:
+            await asyncio.shield(self._auth_task)
+        elif (
+            self.token is not None
+            and self.token_expires is not None
+            and time.time() >= self.token_expires - self.token_refresh_margin
+        ):
+            await self.reauthenticate(self.token)
+
+    async def get(
+        self,
+        endpoint,
+        data=None,
+        params=None,
+        retry=None,
+        coalesce=None,
+        cache=None,
+        priority=None,
+        stream=False,
+    ):
+        """Sends a GET request. A fresh cached response is returned without a request
+        being sent. If an identical GET is already in flight this waits for it and returns
+        the same parsed response instead of sending another request.
+
+        NOTE: Coalesced callers share the returned object, copy it before mutating.
+
+        Args:
+            coalesce (bool, optional): Overrides coalesce_requests for this call. Defaults to None.
+            cache (bool, optional): False skips the response cache for this call. Defaults to None.
+            priority (str, optional): Scheduler lane, interactive, normal or bulk. Defaults to
+                the lane set with request_priority(), normal if none is set.
+            stream (bool, optional): Return a JSONArrayStream yielding the elements of a JSON
+                array response as they download instead of the parsed body, so huge listings
+                are never held in memory whole. Streamed GETs are not coalesced, cached or
+                hedged and after_response hooks get the response before its body is read.
+                The request keeps its scheduler slot until the stream is closed.
+                Defaults to False.
+        """
+
+        if stream:
+            return await self._request(
+                "GET", endpoint, data, params, retry, priority=priority, stream=True
+            )
+
+        key = self._request_key("GET", endpoint, data, params)
+
+        cache_key = None
+        if (
+            self.cache is not None
+            and cache is not False
+            and self._cache_ttl(endpoint) is not None
+        ):
+            # keyed by server and account too, a SQLiteResponseCache may be shared by
+            # several APIs and processes whose users Odin authorises differently
+            cache_key = (self.base_url, self.account, token_subject(self.token), *key)
+            body = await self.cache.aget(cache_key)
+            if body is not None:
+                self.logger.debug("Cache hit, method: GET, endpoint: %s", endpoint)
+                return self.codec.loads(body)
+
+        if coalesce is None:
+            coalesce = self.coalesce_requests and self._repeatable(endpoint)
+        if not coalesce:
+            return await self._request(
+                "GET", endpoint, data, params, retry, cache_key, priority
             )
 
-            Requester.__instance = self
+        task = self._in_flight_gets.get(key)
+        if task is not None:
+            self.coalesced_requests += 1
+            self.logger.debug(
+                "Coalesced with in flight request, method: GET, endpoint: %s", endpoint
+            )
+        else:
+            # own task so a cancelled caller does not cancel the request for the others
+            task = asyncio.ensure_future(
+                self._request("GET", endpoint, data, params, retry, cache_key, priority)
+            )
+            self._in_flight_gets[key] = task
+            task.add_done_callback(lambda done: self._get_done(key, done))
 
-    async def get(self, endpoint, data=None, params=None):
-        return await self._request(self.client.get, endpoint, data, params)
+        return await asyncio.shield(task)
 
-    async def post(self, endpoint, data=None):
-        return await self._request(self.client.post, endpoint, data)
+    async def post(self, endpoint, data=None, params=None, retry=None, priority=None):
+        return await self._write("POST", endpoint, data, params, retry, priority)
 
-    async def put(self, endpoint, data=None):
-        return await self._request(self.client.put, endpoint, data)
+    async def put(self, endpoint, data=None, params=None, retry=None, priority=None):
+        return await self._write("PUT", endpoint, data, params, retry, priority)
 
-    async def delete(self, endpoint, data=None, params=None):
-        return await self._request(self.client.delete, endpoint, data, params)
+    async def delete(self, endpoint, data=None, params=None, retry=None, priority=None):
+        return await self._write("DELETE", endpoint, data, params, retry, priority)
 
-    async def _request(self, method, endpoint, data=None, params=None):
-        """Handles an API request with or without rate limiting."""
+    async def _write(
+        self, method, endpoint, data=None, params=None, retry=None, priority=None
+    ):
+        """Sends a PUT/ POST/ DELETE, invalidating cached responses on the same path."""
 
-        self.logger.info(
-            f"Initiating API request, method: {method.__name__.upper()}, endpoint: {endpoint}"
-        )
+        if self.cache is None:
+            return await self._request(
+                method, endpoint, data, params, retry, priority=priority
+            )
 
-        if self.rate_limit:
-            return await self._rate_limited_request(method, endpoint, data, params)
+        await self.cache.ainvalidate(endpoint)
+        try:
+            return await self._request(
+                method, endpoint, data, params, retry, priority=priority
+            )
+        finally:
+            # again once written in case a GET cached the old state meanwhile
+            await self.cache.ainvalidate(endpoint)
+
+    def _cache_ttl(self, endpoint):
+        """Seconds a GET response from endpoint is cached for, None if it is not."""
+        if never_cached(endpoint):
+            return None
+        policy = self.routes.policy_for("GET", endpoint)
+        if policy is not None and policy.cache_ttl is not None:
+            return policy.cache_ttl or None
+        return self.cache.ttl_for(endpoint)
+
+    def _repeatable(self, endpoint):
+        """False if endpoint's policy marks its GETs not idempotent, they are then
+        never coalesced or hedged."""
+        policy = self.routes.policy_for("GET", endpoint)
+        return policy is None or policy.idempotent is not False
+
+    def _get_done(self, key, task):
+        if self._in_flight_gets.get(key) is task:
+            del self._in_flight_gets[key]
+        # mark the exception retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
 
-        # Logging request details
-        request_payload = json.dumps(data) if data is not None else None
-        self.logger.debug(
-            f"Sending request, method: {method.__name__.upper()},"
-            f"endpoint: {self.base_url + endpoint}, params: {params}, data: {sanitise_data(data) if data else 'None'}"
+    @staticmethod
+    def _request_key(method, endpoint, data=None, params=None):
+        """Key identifying identical requests, params are order independent."""
+        return (
+            method,
+            endpoint.rstrip("?"),
+            json.dumps(params or {}, sort_keys=True, default=str),
+            json.dumps(data, sort_keys=True, default=str) if data is not None else None,
         )
 
-        kwargs = {"url": self.base_url + endpoint, "headers": self.headers}
+    async def _request(
+        self,
+        method,
+        endpoint,
+        data=None,
+        params=None,
+        retry=None,
+        cache_key=None,
+        priority=None,
+        stream=False,
+    ):
+        """Handles an API request, retrying failures as set in the retry policy.
 
-        if data is not None:
-            kwargs["content"] = json.dumps(data)
-        if params:
-            kwargs["params"] = params
+        Args:
+            method (str): HTTP method e.g. GET
+            endpoint (str): Endpoint appended to base_url.
+            data (dict, optional): JSON body. Defaults to None.
+            params (dict, optional): Query parameters. Defaults to None.
+            retry (RetryPolicy | bool, optional): Overrides the requester retry policy for this
+                call, False disables retrying. Defaults to None.
+            cache_key (tuple, optional): Key a successful response is cached under. Defaults to None.
+            priority (str, optional): Scheduler lane. Defaults to None.
+            stream (bool, optional): Return a JSONArrayStream of the response body. Defaults to False.
+        """
 
-        response = await method(**kwargs)
+        if retry is None or retry is True:
+            retry = self.retry_policy
 
-        return await self._handle_response(response, method.__name__, endpoint)
+        idempotent = None
+        policy = self.routes.policy_for(method, endpoint)
+        if policy is not None:
+            idempotent = policy.idempotent
+            if priority is None and policy.priority and current_priority() == "normal":
+                priority = policy.priority
 
-    @sleep_and_retry
-    @limits(calls=5, period=1)
-    async def _rate_limited_request(self, method, endpoint, data=None, params=None):
-        """Handles an API request with rate limiting."""
+        self.logger.info(
+            "Initiating API request, method: %s, endpoint: %s", method, endpoint
+        )
 
-        self.logger.warning(
-            f"Rate limit active. Request may be delayed, method: {method.__name__.upper()}, endpoint: {endpoint}"
+        span_context = (
+            self.tracer.span(
+                f"{method} {endpoint.rstrip('?')}", method=method, endpoint=endpoint
+            )
+            if self.tracer is not None
+            else contextlib.nullcontext()
         )
+        with span_context as span:
+            attempt = 0
+            replayed = False
+            while True:
+                try:
+                    token, response, held = await self._attempt(
+                        method, endpoint, data, params, priority, stream
+                    )
+                except httpx.TransportError as error:
+                    if not retry or not retry.should_retry_error(
+                        method, error, attempt, idempotent
+                    ):
+                        raise
+                    delay = retry.backoff(attempt)
+                    self.logger.warning(
+                        "Request failed, retrying in %.3fs (%d/%d), method: %s, endpoint: %s, error: %r",
+                        delay,
+                        attempt + 1,
+                        retry.max_retries,
+                        method,
+                        endpoint,
+                        error,
+                    )
+                else:
+                    if (
+                        response.status_code == 401
+                        and not replayed
+                        and token is not None
+                        and self.authenticator is not None
+                        and not _authenticating.get()
+                    ):
+                        self.logger.warning(
+                            "Token rejected, re-authenticating and replaying, method: %s, endpoint: %s",
+                            method,
+                            endpoint,
+                        )
+                        replayed = True
+                        if stream:
+                            await held.aclose()
+                        await self.reauthenticate(token)
+                        continue
+                    if not retry or not retry.should_retry_response(
+                        method, response, attempt, idempotent
+                    ):
+                        if span is not None:
+                            span.set_attribute("status_code", response.status_code)
+                            span.set_attribute("attempts", attempt + 1)
+                        if stream:
+                            return await self._open_stream(
+                                response, method, endpoint, held
+                            )
+                        result = await self._handle_response(response, method, endpoint)
+                        if cache_key is not None:
+                            await self.cache.aset(
+                                cache_key,
+                                endpoint,
+                                response.content,
+                                ttl=self._cache_ttl(endpoint),
+                            )
+                        return result
+                    delay = retry.backoff(attempt, response)
+                    if stream:
+                        await held.aclose()
+                    self.logger.warning(
+                        "Request failed, retrying in %.3fs (%d/%d), method: %s, endpoint: %s, status_code: %d",
+                        delay,
+                        attempt + 1,
+                        retry.max_retries,
+                        method,
+                        endpoint,
+                        response.status_code,
+                    )
+
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _attempt(
+        self, method, endpoint, data=None, params=None, priority=None, stream=False
+    ):
+        """Sends the request once through the circuit breaker and scheduler.
+
+        With stream the scheduler slot is held and the circuit breaker only told the
+        outcome once the body is read, both when the returned AsyncExitStack is closed.
+        Closing it closes the response too.
+
+        Returns:
+            Tuple: Token the request was sent with, the response and, with stream, the
+                AsyncExitStack holding the slot, otherwise None.
+        """
+
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            # fail fast before queueing behind other requests
+            breaker.before_request(endpoint)
+
+        held = contextlib.AsyncExitStack()
+        try:
+            await self._wait_for_token()
+            token = self.token
+            rate_limited = 0.0
 
-        request_payload = json.dumps(data) if data is not None else None
-        self.logger.debug(
-            f"Sending rate-limited request, method: {method.__name__.upper()},"
-            f"endpoint: {self.base_url + endpoint}, params: {params}, data: {sanitise_data(data) if data else 'None'}"
+            async def admit():
+                nonlocal rate_limited
+                rate_limited = await self._acquire_rate_limit(method, endpoint)
+
+            # slot is released while backing off so other requests can use it
+            queued = await held.enter_async_context(
+                self.scheduler.slot(
+                    endpoint, priority, admit if self.rate_limit else None
+                )
+            )
+            if queued:
+                self.logger.debug(
+                    "Request queued %.3fs by scheduler, method: %s, endpoint: %s",
+                    queued,
+                    method,
+                    endpoint,
+                )
+            if self.metrics is not None:
+                # queued includes the rate limit wait, recorded on its own
+                self.metrics.record_wait("scheduler", max(0.0, queued - rate_limited))
+            if (
+                method == "GET"
+                and not stream
+                and self.hedge_policy is not None
+                and self.hedge_policy.applies_to(endpoint)
+                and self._repeatable(endpoint)
+            ):
+                response = await self._send_hedged(endpoint, data, params, priority)
+            else:
+                response = await self._send(method, endpoint, data, params, stream)
+        except httpx.TransportError:
+            await held.aclose()
+            if breaker is not None:
+                breaker.record_failure(endpoint)
+            raise
+        except BaseException:
+            await held.aclose()
+            if breaker is not None:
+                breaker.record_cancelled(endpoint)
+            raise
+
+        if stream:
+            if breaker is not None:
+
+                def outcome(error_type, error, traceback):
+                    if error is None:
+                        self._record_outcome(endpoint, response.status_code)
+                    elif isinstance(error, httpx.TransportError):
+                        breaker.record_failure(endpoint)
+                    else:
+                        breaker.record_cancelled(endpoint)
+
+                held.push(outcome)
+            held.push_async_callback(response.aclose)
+            return token, response, held
+
+        await held.aclose()
+        if breaker is not None:
+            self._record_outcome(endpoint, response.status_code)
+        return token, response, None
+
+    def _record_outcome(self, endpoint, status_code):
+        """Tells the circuit breaker the status of a response."""
+        breaker = self.circuit_breaker
+        before = breaker.state(endpoint)
+        breaker.record_response(endpoint, status_code)
+        if before != OPEN and breaker.state(endpoint) == OPEN:
+            self.logger.error(
+                "Circuit opened, failing fast for %.1fs, endpoint: %s",
+                breaker.recovery_timeout,
+                breaker.circuit_for(endpoint),
+            )
+
+    async def _acquire_rate_limit(self, method, endpoint):
+        """Waits for a rate limit token, run by the scheduler in priority order.
+
+        Returns:
+            Float: Seconds waited.
+        """
+
+        waited = await self.rate_limiter.acquire()
+        if waited:
+            self.logger.warning(
+                "Rate limit active. Request delayed %.3fs, method: %s, endpoint: %s",
+                waited,
+                method,
+                endpoint,
+            )
+        if self.metrics is not None:
+            self.metrics.record_wait("rate_limit", waited)
+        return waited
+
+    async def _send_hedged(self, endpoint, data=None, params=None, priority=None):
+        """Sends a GET, sending a duplicate if it is slower than the hedge policy allows
+        and returning whichever response arrives first. The duplicate holds a scheduler
+        slot of its own, it is not sent if none is free."""
+
+        policy = self.hedge_policy
+        delay = policy.delay(endpoint)
+        primary = asyncio.ensure_future(self._send("GET", endpoint, data, params))
+        if delay is None:
+            return await primary
+
+        pending = {primary}
+        started = {primary: time.monotonic()}
+        async with contextlib.AsyncExitStack() as stack:
+            try:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if done:
+                    return await primary
+
+                free = await stack.enter_async_context(
+                    self.scheduler.try_slot(endpoint, priority)
+                )
+                if not free:
+                    policy.no_slot += 1
+                if not free or not policy.try_hedge():
+                    # the slot is not needed while waiting on the primary
+                    await stack.aclose()
+                    return await primary
+
+                self.logger.debug(
+                    "No response after %.3fs, hedging, method: GET, endpoint: %s",
+                    delay,
+                    endpoint,
+                )
+                hedge = asyncio.ensure_future(self._send_hedge(endpoint, data, params))
+                pending.add(hedge)
+                started[hedge] = time.monotonic()
+                error = None
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task.exception() is None:
+                            if task is not primary:
+                                policy.hedge_wins += 1
+                            return task.result()
+                        if task is primary or error is None:
+                            error = task.exception()
+                raise error
+            finally:
+                now = time.monotonic()
+                for task in pending:
+                    if not task.done():
+                        # the loser's wait so far is a lower bound of its latency
+                        policy.record(endpoint, now - started[task])
+                    task.cancel()
+
+    async def _send_hedge(self, endpoint, data=None, params=None):
+        if self.rate_limit:
+            await self._acquire_rate_limit("GET", endpoint)
+        return await self._send("GET", endpoint, data, params)
+
+    async def _send(self, method, endpoint, data=None, params=None, stream=False):
+        """Sends the request, the scheduler has already applied the rate limit. With
+        stream the response is returned once its headers arrive, body unread."""
+
+        # sanitising copies the body, skip it unless debug logs are wanted
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Sending request, method: %s, endpoint: %s, params: %s, data: %s",
+                method,
+                self.base_url + endpoint,
+                params,
+                sanitise_data(data) if data else None,
+            )
+
+        body = self.codec.dumps(data) if data is not None else None
+        headers = self.headers
+        compressed = body is not None and self.compression.should_compress(
+            endpoint, len(body)
+        )
+        if compressed:
+            headers = {**headers, "Content-Encoding": "gzip"}
+        request = self.client.build_request(
+            method,
+            self.base_url + endpoint,
+            headers=headers,
+            content=self.compression.compress(body) if compressed else body,
+            params=params or None,
         )
+        bytes_out = len(body) if body is not None else 0
+        if self.hooks["before_request"]:
+            await self._run_hooks("before_request", request)
+
+        start = time.monotonic()
+        try:
+            response = await self.client.send(request, stream=stream)
+        except httpx.TransportError as error:
+            elapsed = time.monotonic() - start
+            if self.rate_limit:
+                self.rate_limiter.record(None, elapsed)
+            if self.metrics is not None:
+                self.metrics.record_error(
+                    method, endpoint, elapsed, bytes_out, len(request.content)
+                )
+            if self.hooks["on_error"]:
+                await self._run_hooks("on_error", request, error)
+            raise
 
-        kwargs = {"url": self.base_url + endpoint, "headers": self.headers}
+        elapsed = time.monotonic() - start
+        if self.rate_limit:
+            self.rate_limiter.record(response.status_code, elapsed)
+        if method == "GET" and self.hedge_policy is not None:
+            self.hedge_policy.record(endpoint, elapsed)
+        if self.metrics is not None:
+            self.metrics.record_response(
+                method,
+                endpoint,
+                response.status_code,
+                elapsed,
+                bytes_out,
+                # a streamed body is counted once read, see _open_stream()
+                0 if stream else len(response.content),
+                len(request.content),
+                0 if stream else response.num_bytes_downloaded,
+            )
+        if self.hooks["after_response"]:
+            await self._run_hooks("after_response", request, response, elapsed)
 
-        if data is not None:
-            kwargs["content"] = json.dumps(data)
-        if params:
-            kwargs["params"] = params
+        if compressed and response.status_code == 415:
+            self.logger.warning(
+                "Compressed request body rejected, resending uncompressed, method: %s, endpoint: %s",
+                method,
+                endpoint,
+            )
+            self.compression.reject(endpoint)
+            await response.aclose()
+            return await self._send(method, endpoint, data, params, stream)
+        return response
 
-        response = await method(**kwargs)
+    async def _open_stream(self, response, method, endpoint, held):
+        """Wraps a streamed response in a JSONArrayStream, an error response is read
+        and raised as _handle_response() does. held, the scheduler slot and circuit
+        breaker outcome from _attempt(), is closed once the body is read."""
 
-        return await self._handle_response(response, method.__name__, endpoint)
+        def record(bytes_in, wire_bytes_in):
+            if self.metrics is not None:
+                self.metrics.record_stream(method, endpoint, bytes_in, wire_bytes_in)
+
+        if not 200 <= response.status_code < 300:
+            async with held:
+                await response.aread()
+                record(len(response.content), response.num_bytes_downloaded)
+            return await self._handle_response(response, method, endpoint)
+
+        self.logger.info(
+            "API Call Success, streaming response, method: %s, endpoint: %s, status_code: %d",
+            method,
+            endpoint,
+            response.status_code,
+        )
+        # the slot is held until the body is downloaded so a gather of streamed GETs
+        # still keeps to max_concurrent_requests
+        return JSONArrayStream(
+            response, self.codec.loads, on_close=record, context=held
+        )
 
     async def _handle_response(self, response, method_name, endpoint):
         """Handles response logging and error handling."""
@@ -112,15 +793,24 @@ class Requester:
         # Log response status
         if response.status_code >= 200 and response.status_code < 300:
             self.logger.info(
-                f"API Call Success, method: {method_name.upper()}, endpoint: {endpoint}, status_code: {response.status_code}"
+                "API Call Success, method: %s, endpoint: %s, status_code: %d",
+                method_name,
+                endpoint,
+                response.status_code,
             )
-            self.logger.debug(f"response_data: {sanitise_data(response.json())}")
+            result = self.codec.loads(response.content)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("response_data: %s", sanitise_data(result))
 
-            return response.json()
+            return result
 
         # Log API errors
         else:
             self.logger.error(
-                f"API Error, method: {method_name.upper()}, endpoint: {endpoint}, status_code: {response.status_code}, response_text: {response.text}"
+                "API Error, method: %s, endpoint: %s, status_code: %d, response_text: %s",
+                method_name,
+                endpoint,
+                response.status_code,
+                response.text,
             )
             raise OSApiResponseError(response)
@@ -1,48 +1,32 @@
+from contextlib import nullcontext
 from typing import Dict, Any, Optional
 
 from . import scripts
 from .api import API
+from .utils.scheduler import current_priority, request_priority
 
 
 class Scripter:
     """This object acts as the gateway to all pre-written scripts in /scripts/.
 
 
-    Each api object created creates its own associated Scripter object on api creation.
-    Additionally, this object can be created solely and passed an api, however, this
-    will result in two exact Scripter objects.
+    Create one Scripter per api object, several can run side by side against different
+    Odin servers.
 
     Intended use: odin_api.scripter.{script function}
 
     :param api: api object in package odin_api, this is used in the scripts to achieve objective.
     """
 
-    __instance = None
-
-    @staticmethod
-    def get_instance(api: API = None) -> "Scripter":
-        """
-        Singleton implementation for Scripter object.
-
-        Args:
-            api (API): API object to be used in the scripts.
-
-        Returns:
-            Scripter: Scripter object.
-        """
-        if Scripter.__instance is None:
-            Scripter(api)
-        return Scripter.__instance
+    # quick lookups someone is usually waiting on, sent ahead of bulk traffic unless the
+    # caller already picked a lane with request_priority()
+    interactive_scripts = {"find_alias", "locate_free_extension", "user_association"}
 
     def __init__(
         self,
         api: API,
     ) -> None:
-        if Scripter.__instance is not None:
-            raise Exception("Singleton cannot be instantiated more than once!")
-        else:
-            self.api = api
-            Scripter.__instance = self
+        self.api = api
 
     async def _run_script(
         self, script_name: str, time_saved: int, *args, **kwargs
@@ -63,7 +47,17 @@ class Scripter:
             raise AttributeError(
                 f"Script '{script_name}' not found in 'scripts' module."
             )
-        return await script_function(self.api, *args, **kwargs)
+        lane = current_priority()
+        if lane == "normal" and script_name in self.interactive_scripts:
+            lane = "interactive"
+        tracer = self.api.tracer
+        span = (
+            tracer.span(f"script {script_name}", script=script_name, priority=lane)
+            if tracer is not None
+            else nullcontext()
+        )
+        with request_priority(lane), span:
+            return await script_function(self.api, *args, **kwargs)
 
     async def bulk_password_reset(
         self,
@@ -271,7 +265,9 @@ class Scripter:
         Returns:
             Dict: Formatted output of the user showing all CC, HG, and Pick Up user is assigned to.
         """
-        self._run_script("user_association", 30, service_provider_id, group_id, user_id)
+        return await self._run_script(
+            "user_association", 30, service_provider_id, group_id, user_id
+        )
 
     async def user_registration(
         self, *, service_provider_id: str, group_id: str
@@ -5,22 +5,31 @@ import inspect
 # Get the directory path of this __init__.py file
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Iterate over files in the directory
-for filename in os.listdir(current_dir):
-    # Skip __init__.py, __pycache__, and non-Python files
-    if (
-        filename == "__init__.py"
-        or filename.startswith("__")
-        or not filename.endswith(".py")
-    ):
-        continue
 
-    module_name = filename[:-3]  # remove the .py extension
+def __getattr__(name):
+    # modules are imported the first time their script is run
+    if name.startswith("__") or not os.path.isfile(
+        os.path.join(current_dir, f"{name}.py")
+    ):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    # Dynamically import the module
-    module = importlib.import_module(f".{module_name}", package=__name__)
+    module = importlib.import_module(f".{name}", package=__name__)
 
     # Check if there is a function named 'main' in the module
-    if hasattr(module, "main") and inspect.isfunction(module.main):
-        # Add it to the current package's namespace with the module_name as the attribute name
-        globals()[module_name] = module.main
+    if not (hasattr(module, "main") and inspect.isfunction(module.main)):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Add it to the current package's namespace with the module_name as the attribute name
+    globals()[name] = module.main
+    return module.main
+
+
+def __dir__():
+    return sorted(
+        set(globals())
+        | {
+            filename[:-3]
+            for filename in os.listdir(current_dir)
+            if filename.endswith(".py") and not filename.startswith("__")
+        }
+    )
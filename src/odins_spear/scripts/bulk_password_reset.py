@@ -1,7 +1,9 @@
+import asyncio
+
 from ..exceptions import OSInvalidPasswordType
 
 
-def main(
+async def main(
     api, service_provider_id: str, group_id: str, users: list, password_type: str
 ) -> list:
     # save logger from api
@@ -10,14 +12,18 @@ def main(
     # SIP auth password
     if password_type.lower() == "sip":
         logger.info("Generating new SIP passwords")
-        new_passwords = api.password_generate.get_sip_passwords_generate(len(users))[
-            "passwords"
-        ]
+        new_passwords = (
+            await api.password_generate.get_sip_passwords_generate(len(users))
+        )["passwords"]
         users_and_new_passwords = list(zip(users, new_passwords))
 
         logger.info("Setting new SIP passwords")
-        for user in users_and_new_passwords:
-            api.authentication.put_user_authentication_service(user[0], user[1])
+        await asyncio.gather(
+            *(
+                api.authentication.put_user_authentication_service(user[0], user[1])
+                for user in users_and_new_passwords
+            )
+        )
 
         logger.info("Setting new SIP passwords complete")
         return [
@@ -28,14 +34,20 @@ def main(
     # intigration password
     elif password_type.lower() == "web":
         logger.info("Generating new SIP passwords")
-        new_passwords = api.password_generate.get_passwords_generate(
-            service_provider_id, group_id, len(users)
+        new_passwords = (
+            await api.password_generate.get_passwords_generate(
+                service_provider_id, group_id, len(users)
+            )
         )["passwords"]
         users_and_new_passwords = list(zip(users, new_passwords))
 
         logger.info("Setting new SIP passwords")
-        for user in users_and_new_passwords:
-            api.session.put_user_web_authentication_password(user[0], user[1])
+        await asyncio.gather(
+            *(
+                api.session.put_change_password(user[0], user[1])
+                for user in users_and_new_passwords
+            )
+        )
 
         logger.info("Setting new SIP passwords complete")
         return [
@@ -46,14 +58,20 @@ def main(
     # voicemail/ portal
     elif password_type.lower() == "vm":
         logger.info("Generating new voicemail passcodes")
-        new_passcodes = api.password_generate.get_passcodes_generate(
-            service_provider_id, group_id, len(users)
+        new_passcodes = (
+            await api.password_generate.get_passcodes_generate(
+                service_provider_id, group_id, len(users)
+            )
         )["passcodes"]
         users_and_new_passcodes = list(zip(users, new_passcodes))
 
         logger.info("Setting new voicemail passcodes")
-        for user in users_and_new_passcodes:
-            api.users.put_user_portal_passcode(user[0], user[1])
+        await asyncio.gather(
+            *(
+                api.users.put_user_portal_passcode(user[0], user[1])
+                for user in users_and_new_passcodes
+            )
+        )
 
         logger.info("Setting new voicemail passcodes complete")
         return [
@@ -16,8 +16,6 @@ def locate_alias(alias, aliases: list):
 
 
 async def main(api, service_provider_id: str, group_id: str, alias: str):
-    RETRY_QUEUE = []
-    MAX_RETRIES = 2
     OBJECT_WITH_ALIAS = []
 
     auto_attendants = await api.auto_attendants.get_auto_attendants(
@@ -65,7 +63,7 @@ async def main(api, service_provider_id: str, group_id: str, alias: str):
         *(task[2] for task in all_tasks), return_exceptions=True
     )
 
-    # Zip types + results
+    # Zip types + results, failed fetches have already been retried by the requester
     for (entity_type, service_user_id, _), result in zip(all_tasks, results):
         if isinstance(result, Exception):
             logger.error(f"Failed to fetch {entity_type} - {service_user_id}: {result}")
@@ -79,44 +77,6 @@ async def main(api, service_provider_id: str, group_id: str, alias: str):
         }
         OBJECT_WITH_ALIAS.append(formatted)
 
-    while RETRY_QUEUE:
-        entity_type, service_user_id, retry_count = RETRY_QUEUE.pop(
-            0
-        )  # Get the first item from the queue
-
-        formatted = {}
-        formatted["type"] = entity_type
-        temp_object = ""
-
-        try:
-            if entity_type == "AA":
-                temp_object = await api.auto_attendants.get_auto_attendant(
-                    service_user_id
-                )
-            elif entity_type == "HG":
-                temp_object = await api.hunt_groups.get_group_hunt_group(
-                    service_user_id
-                )
-            else:
-                temp_object = await api.call_centers.get_group_call_center(
-                    service_user_id
-                )
-
-            formatted["name"] = temp_object["serviceInstanceProfile"]["name"]
-            formatted["aliases"] = temp_object["serviceInstanceProfile"]["aliases"]
-
-            OBJECT_WITH_ALIAS.append(formatted)
-
-        except Exception:
-            if retry_count < MAX_RETRIES:
-                RETRY_QUEUE.append(
-                    (entity_type, service_user_id, retry_count + 1)
-                )  # Increment retry count and re-add to the queue
-            else:
-                logger.error(
-                    f"Failed to process {entity_type} - {service_user_id} after {MAX_RETRIES} retries - skipping"
-                )
-
     logger.info("Searching through aa, hg, and cc")
     for broadwork_entity in OBJECT_WITH_ALIAS:
         logger.info(f"Checking bre '{broadwork_entity['name']}'")
@@ -1,4 +1,4 @@
-def main(api, service_provider_id: str, group_id: str):
+async def main(api, service_provider_id: str, group_id: str):
     """Audits a group for chargeable services this will return all feature packs
     assigned and count for all broadwork entities such as users, call centers, hunt groups etc.
     Additionaly this will return all DID/DDI's and their active status.
@@ -14,7 +14,9 @@ def main(api, service_provider_id: str, group_id: str):
 
     # all Services
     logger.info("Fetching all group services")
-    service_report = api.services.get_group_services(group_id, service_provider_id)
+    service_report = await api.services.get_group_services(
+        group_id, service_provider_id
+    )
 
     assigned_user_services = []
     assigned_group_services = []
@@ -35,7 +37,7 @@ def main(api, service_provider_id: str, group_id: str):
             del us["alias"]
 
             logger.info(f"Fetching users assigned {us}")
-            users = api.services.get_group_services_user_assigned(
+            users = await api.services.get_group_services_user_assigned(
                 group_id, service_provider_id, us["serviceName"], "serviceName"
             )
             userIDs = [u["userId"] for u in users["users"]]
@@ -68,7 +70,7 @@ def main(api, service_provider_id: str, group_id: str):
             del sps["alias"]
 
             logger.info(f"Fetching users assigned {us}")
-            users = api.services.get_group_services_user_assigned(
+            users = await api.services.get_group_services_user_assigned(
                 group_id, service_provider_id, sps["servicePackName"], "servicePackName"
             )
             userIDs = [u["userId"] for u in users["users"]]
@@ -78,7 +80,7 @@ def main(api, service_provider_id: str, group_id: str):
 
     # Group DNs
     logger.info("Fetching group dns")
-    dn_report = api.dns.get_group_dns(service_provider_id, group_id)
+    dn_report = await api.dns.get_group_dns(service_provider_id, group_id)
     all_dns = {
         "assigned": {"activated": [], "deactivated": []},
         "unassigned": {"activated": [], "deactivated": []},
@@ -115,12 +117,12 @@ def main(api, service_provider_id: str, group_id: str):
     )
 
     # Group Detail
-    group_detail = api.groups.get_group(service_provider_id, group_id)
+    group_detail = await api.groups.get_group(service_provider_id, group_id)
 
     # Trunking detail
     logger.info("Fetching trunking capacity")
     try:
-        trunk_detail = api.trunk_groups.get_group_trunk_groups_call_capacity(
+        trunk_detail = await api.trunk_groups.get_group_trunk_groups_call_capacity(
             service_provider_id, group_id
         )
         del trunk_detail["serviceProviderId"]
@@ -1,16 +1,21 @@
+import asyncio
+
 from ..exceptions import OSExtensionNotFound, OSRangeFault
 
 
-def retrieve_extensions(api, service_provider_id: str, group_id: str, logger) -> list:
+async def retrieve_extensions(
+    api, service_provider_id: str, group_id: str, logger
+) -> list:
     extensions = []
 
     logger.info("Fetching users, hunt groups, call centers, and auto attendants")
-    dataset = (
-        api.users.get_users(service_provider_id, group_id)
-        + api.hunt_groups.get_group_hunt_groups(service_provider_id, group_id)
-        + api.call_centers.get_group_call_centers(service_provider_id, group_id)
-        + api.auto_attendants.get_auto_attendants(service_provider_id, group_id)
+    results = await asyncio.gather(
+        api.users.get_users(service_provider_id, group_id),
+        api.hunt_groups.get_group_hunt_groups(service_provider_id, group_id),
+        api.call_centers.get_group_call_centers(service_provider_id, group_id),
+        api.auto_attendants.get_auto_attendants(service_provider_id, group_id),
     )
+    dataset = [data for result in results for data in result]
 
     logger.info("Extracting used extensions")
     for data in dataset:
@@ -22,7 +27,7 @@ def retrieve_extensions(api, service_provider_id: str, group_id: str, logger) ->
     return extensions if extensions else None
 
 
-def main(
+async def main(
     api, service_provider_id: str, group_id: str, range_start: int, range_end: int
 ):
     """Retrieves The Lowest Free Extension Available In The Designated Group Passed."""
@@ -35,7 +40,7 @@ def main(
         raise OSRangeFault
 
     # Retrieve List Of Occupied Extensions Within The Group
-    extensions = retrieve_extensions(api, service_provider_id, group_id, logger)
+    extensions = await retrieve_extensions(api, service_provider_id, group_id, logger)
 
     logger.info("Filtering for useable extension")
     for extension in range(range_start, range_end + 1):
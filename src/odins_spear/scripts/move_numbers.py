@@ -1,4 +1,4 @@
-def main(
+async def main(
     api,
     current_service_provider_id: str,
     current_group_id: str,
@@ -13,7 +13,7 @@ def main(
 
     logger.info(f"Removing numbers from {current_group_id}")
     # delete number from group
-    api.dns.delete_group_dns(
+    await api.dns.delete_group_dns(
         current_service_provider_id,
         current_group_id,
         start_of_range_number=start_of_range_number,
@@ -24,7 +24,7 @@ def main(
     if not current_service_provider_id == target_service_provider_id:
         logger.info(f"Removing numbers from {current_service_provider_id}")
         # remove from sp/ent
-        api.dns.delete_service_provider_dns(
+        await api.dns.delete_service_provider_dns(
             current_service_provider_id,
             start_of_range_number=start_of_range_number,
             end_of_range_number=end_of_range_number,
@@ -34,7 +34,7 @@ def main(
             f"Adding number to SP/ Ent: {target_service_provider_id} Group: {target_group_id}"
         )
         # assign to new group
-        api.dns.post_group_dns_assign_bulk(
+        await api.dns.post_group_dns_assign_bulk(
             target_service_provider_id,
             target_group_id,
             start_of_range_number=start_of_range_number,
@@ -45,7 +45,7 @@ def main(
 
         logger.info(f"Adding number to {target_group_id}")
         # assign to new group
-        api.dns.post_group_dns(
+        await api.dns.post_group_dns(
             target_service_provider_id,
             target_group_id,
             start_of_range_number=start_of_range_number,
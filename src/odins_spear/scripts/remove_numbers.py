@@ -1,4 +1,4 @@
-def main(
+async def main(
     api,
     current_service_provider_id: str,
     current_group_id: str,
@@ -11,7 +11,7 @@ def main(
 
     logger.info(f"Removing numbers from {current_group_id}")
     # delete number from group
-    api.dns.delete_group_dns(
+    await api.dns.delete_group_dns(
         current_service_provider_id,
         current_group_id,
         start_of_range_number=start_of_range_number,
@@ -20,7 +20,7 @@ def main(
 
     logger.info(f"Removing numbers from {current_service_provider_id}")
     # remove from sp/ent
-    api.dns.delete_service_provider_dns(
+    await api.dns.delete_service_provider_dns(
         current_service_provider_id,
         start_of_range_number=start_of_range_number,
         end_of_range_number=end_of_range_number,
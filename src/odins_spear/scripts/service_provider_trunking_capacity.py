@@ -1,7 +1,7 @@
 from ..exceptions import OSServiceNotAssigned
 
 
-def main(api: object, service_provider_id: str) -> dict:
+async def main(api: object, service_provider_id: str) -> dict:
     """Returns a breakdown of the Trunking Call Capacity of a Service Provider/ Enterprise (SP/ENT).
     This will show the totals at each level from SP/ ENT to Group to Trunk Groups located in Groups.
     At each level Max Active Calls and Bursting Max Active calls are detailed and then differences at
@@ -17,7 +17,7 @@ def main(api: object, service_provider_id: str) -> dict:
     # OSServiceNotAssigned is returned if the Trunk Group service is not assigend to SP/ ENT
     try:
         service_provider_capacity = (
-            api.trunk_groups.get_service_provider_trunk_group_call_capacity(
+            await api.trunk_groups.get_service_provider_trunk_group_call_capacity(
                 service_provider_id
             )
         )
@@ -35,7 +35,7 @@ def main(api: object, service_provider_id: str) -> dict:
     return_data["groups"] = []
 
     logger.info(f"Fetching complete list of groups in {service_provider_id}")
-    groups_in_service_provider = api.groups.get_groups(service_provider_id)
+    groups_in_service_provider = await api.groups.get_groups(service_provider_id)
 
     # getting groups and group call capacities
     logger.info("Fetching groups trunking capacities")
@@ -46,8 +46,10 @@ def main(api: object, service_provider_id: str) -> dict:
 
         try:
             logger.info(f"Fetching group {group} trunking capacity")
-            group_capacity = api.trunk_groups.get_group_trunk_groups_call_capacity(
-                service_provider_id, group["groupId"]
+            group_capacity = (
+                await api.trunk_groups.get_group_trunk_groups_call_capacity(
+                    service_provider_id, group["groupId"]
+                )
             )
             formatted_group["maxActiveCalls"] = group_capacity["maxActiveCalls"]
             formatted_group["burstingMaxAvailableActiveCalls"] = group_capacity[
@@ -86,11 +88,11 @@ def main(api: object, service_provider_id: str) -> dict:
         group["trunkGroupsBurstingCallCapacityTotal"] = 0
 
         try:
-            group_trunk_groups = api.trunk_groups.get_group_trunk_groups(
+            group_trunk_groups = await api.trunk_groups.get_group_trunk_groups(
                 service_provider_id, group["groupId"]
             )
             for trunk_group in group_trunk_groups:
-                trunk_group_detailed = api.trunk_groups.get_group_trunk_group(
+                trunk_group_detailed = await api.trunk_groups.get_group_trunk_group(
                     service_provider_id, group["groupId"], trunk_group["name"]
                 )
 
@@ -1,4 +1,4 @@
-def main(api, service_provider_id: str, group_id: str, user_id: str):
+async def main(api, service_provider_id: str, group_id: str, user_id: str):
     """identify a user's associations with Call Centers (CC), Hunt Groups (HG),
     and Pick Up Groups.
 
@@ -29,7 +29,7 @@ def main(api, service_provider_id: str, group_id: str, user_id: str):
 
     # fetch user, returns error if not found
     logger.info(f"Fetching user {user_id}")
-    user = api.reports.get_user_report(user_id)
+    user = await api.reports.get_user_report(user_id)
 
     USER_DATA["firstName"] = user["firstName"]
     USER_DATA["lastName"] = user["lastName"]
@@ -40,7 +40,7 @@ def main(api, service_provider_id: str, group_id: str, user_id: str):
     USER_DATA["aliases"] = user["aliases"]
 
     logger.info("Fetching users pick up group")
-    pick_up_group = api.call_pickup.get_call_pickup_group_user(
+    pick_up_group = await api.call_pickup.get_call_pickup_group_user(
         service_provider_id, group_id, user_id
     )
 
@@ -51,7 +51,7 @@ def main(api, service_provider_id: str, group_id: str, user_id: str):
         USER_DATA["pickUpGroup"] = None
 
     logger.info("Fetching hunt groups")
-    hunt_groups = api.hunt_groups.get_group_hunt_group_user(
+    hunt_groups = await api.hunt_groups.get_group_hunt_group_user(
         service_provider_id, group_id, user_id
     )
     for hg in hunt_groups:
@@ -60,7 +60,7 @@ def main(api, service_provider_id: str, group_id: str, user_id: str):
     # if the user does not have a license for CC this call errors
     try:
         logger.info("Fetching users call centers")
-        call_centers = api.call_centers.get_user_call_center(user_id)
+        call_centers = await api.call_centers.get_user_call_center(user_id)
         for cc in call_centers["callCenters"]:
             USER_DATA["callCenters"].append(cc["serviceUserId"])
     except Exception:
@@ -1,11 +1,11 @@
-def main(api, service_provider_id: str, group_id: str):
+async def main(api, service_provider_id: str, group_id: str):
     logger = api.logger
 
     # Dictionary Descripting Total Users Devices
     registrations_out = {}
 
     logger.info(f"Fetching groups {group_id} registrations")
-    group_registration = api.regsitration.get_bulk_user_registration(
+    group_registration = await api.regsitration.get_bulk_user_registration(
         service_provider_id, group_id
     )
 
@@ -1,4 +1,4 @@
-def main(
+async def main(
     api,
     service_provider_id,
     group_id,
@@ -18,7 +18,7 @@ def main(
     }
 
     try:
-        api.users.put_user(
+        await api.users.put_user(
             service_provider_id, group_id, user_id, updates=email_alt_userid
         )
         logger.info("Updated email and alt user ID.")
@@ -28,7 +28,7 @@ def main(
     # Assign feature pack
     try:
         if webex_feature_pack_name:
-            api.services.put_user_services(
+            await api.services.put_user_services(
                 user_id=user_id, service_packs=[webex_feature_pack_name]
             )
         logger.info(f"Added feature {webex_feature_pack_name}")
@@ -39,15 +39,17 @@ def main(
     if enable_integarated_imp:
         enable_IMP = {"Integrated IMP": {"isActive": True}}
         try:
-            api.services.put_user_service_settings(user_id=user_id, settings=enable_IMP)
+            await api.services.put_user_service_settings(
+                user_id=user_id, settings=enable_IMP
+            )
             logger.info("Enabled integrated IMP")
         except Exception as e:
             logger.info(f"Failed to enable Integrated IMP, detail: {e}")
 
     # build device
     device_name = f"{user_id.split('@')[0]}_WBX"
-    device_password = api.password_generate.get_password_generate(
-        service_provider_id, group_id
+    device_password = (
+        await api.password_generate.get_password_generate(service_provider_id, group_id)
     )["password"]
 
     device_payload = {
@@ -60,7 +62,7 @@ def main(
     }
 
     try:
-        api.devices.post_group_device(
+        await api.devices.post_group_device(
             service_provider_id=service_provider_id,
             group_id=group_id,
             device_name=device_name,
@@ -87,7 +89,7 @@ def main(
             },
         }
         try:
-            api.users.put_user(
+            await api.users.put_user(
                 service_provider_id, group_id, user_id, primary_device_configuration
             )
             logger.info("Added device to user as primary")
@@ -95,7 +97,7 @@ def main(
             logger.error(f"failed to add device as primary, detail: {e}")
     else:
         try:
-            api.shared_call_appearance.post_user_shared_call_appearance_endpoint(
+            await api.shared_call_appearance.post_user_shared_call_appearance_endpoint(
                 user_id, user_id.replace("@", "_WBX@"), device_name
             )
             logger.info("Added device as shared call appearance")
@@ -104,10 +106,12 @@ def main(
 
     # Get webex password
     try:
-        password = api.password_generate.get_password_generate(
-            service_provider_id, group_id
+        password = (
+            await api.password_generate.get_password_generate(
+                service_provider_id, group_id
+            )
         )["password"]
-        api.session.put_user_web_authentication_password(user_id, password)
+        await api.session.put_change_password(user_id, password)
         logger.info("Set webex password")
     except Exception as e:
         logger.error(f"Failed to set webex password, Detail {e}")
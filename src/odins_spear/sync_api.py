@@ -0,0 +1,207 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Optional
+
+from .api import API
+from .endpoints.base_endpoint import BaseEndpoint
+from .reporter import Reporter
+from .scripter import Scripter
+
+
+class SyncAPI:
+    """Blocking facade over API for scripts, notebooks and thread pool workers.
+
+    One background thread runs an event loop owning a single API, every call made
+    through the facade is run on that loop and waited for. Calls from several threads
+    run concurrently on the loop and share its connection pool, scheduler and rate
+    limiter, no event loop is started per call.
+
+    Endpoints and API methods are used as on API, minus the await:
+
+    Example:
+        with SyncAPI(base_url, username, password) as api:
+            api.authenticate()
+            users = api.users.get_users(service_provider_id, group_id)
+            alias = api.scripter.find_alias(
+                service_provider_id=service_provider_id, group_id=group_id, alias="0"
+            )
+
+    Args:
+        *args: Passed to API.
+        timeout (float, optional): Seconds to wait for each call before raising
+            TimeoutError, None waits forever. Defaults to None.
+        **kwargs: Passed to API.
+    """
+
+    def __init__(self, *args, timeout: Optional[float] = None, **kwargs) -> None:
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="odins-spear-loop", daemon=True
+        )
+        self._thread.start()
+
+        # built on the loop so everything async inside binds to it
+        async def build():
+            return API(*args, **kwargs)
+
+        self.api = self.run(build())
+        self.scripter = _SyncProxy(self, Scripter(self.api))
+        self.reporter = _SyncProxy(self, Reporter(self.api))
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+        self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        self._loop.close()
+
+    def run(self, awaitable: Awaitable, timeout: Optional[float] = None) -> Any:
+        """Runs a coroutine on the background loop and waits for its result. Context
+        variables e.g. request_priority() or the current trace span are carried over.
+
+        Example:
+            sync_api.run(Scripter(sync_api.api).find_alias(...))
+
+        Args:
+            awaitable (Awaitable): Coroutine to run.
+            timeout (float, optional): Seconds to wait. Defaults to the facade's timeout.
+
+        Raises:
+            RuntimeError: If the facade is closed or called from its own loop.
+            TimeoutError: If the call takes longer than timeout, it is cancelled.
+
+        Returns:
+            Any: The coroutine's result.
+        """
+
+        error = None
+        if threading.current_thread() is self._thread:
+            error = "SyncAPI called from its own event loop, await SyncAPI.api there instead."
+        elif not self._thread.is_alive():
+            error = "SyncAPI is closed."
+        if error:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise RuntimeError(error)
+
+        context = contextvars.copy_context()
+        result = concurrent.futures.Future()
+        tasks = []
+
+        def start():
+            # created inside the caller's context so the task runs with a copy of it
+            task = context.run(asyncio.ensure_future, awaitable, loop=self._loop)
+            tasks.append(task)
+            task.add_done_callback(functools.partial(_copy_outcome, result))
+
+        self._loop.call_soon_threadsafe(start)
+        try:
+            return result.result(timeout if timeout is not None else self.timeout)
+        except concurrent.futures.TimeoutError:
+            self._loop.call_soon_threadsafe(lambda: tasks and tasks[0].cancel())
+            raise TimeoutError("SyncAPI call timed out.") from None
+        except BaseException:
+            # e.g. KeyboardInterrupt, don't leave the call running on the loop
+            if not result.done():
+                self._loop.call_soon_threadsafe(lambda: tasks and tasks[0].cancel())
+            raise
+
+    def _call(self, function, *args, **kwargs) -> Any:
+        result = function(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = self.run(result)
+        if hasattr(result, "__anext__"):
+            # e.g. a JSONArrayStream from stream=True, iterated on the loop
+            return self._iterate(result)
+        return result
+
+    def _iterate(self, iterator):
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if hasattr(iterator, "aclose") and self._thread.is_alive():
+                self.run(iterator.aclose())
+
+    def authenticate(self) -> bool:
+        """Authenticates with the username and password given.
+
+        Raises:
+            OSApiAuthenticationFail: Raised if authentication fails.
+
+        Returns:
+            Bool: True when authentication was successful.
+        """
+        return self.run(self.api._authenticate())
+
+    def close(self) -> None:
+        """Closes the API's connections and stops the loop thread. Safe to call more
+        than once."""
+        if not self._thread.is_alive():
+            return
+        try:
+            self.run(self.api.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+    def __enter__(self) -> "SyncAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached for attributes not set on the facade itself
+        if name in ("api", "_thread", "_loop"):
+            raise AttributeError(name)
+        return _wrap(self, getattr(self.api, name))
+
+    def __repr__(self) -> str:
+        return f"SyncAPI({self.api})"
+
+
+class _SyncProxy:
+    """Runs the methods of an endpoint, Scripter or Reporter on the SyncAPI loop."""
+
+    def __init__(self, sync_api: SyncAPI, target: Any) -> None:
+        self._sync_api = sync_api
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        return _wrap(self._sync_api, getattr(self._target, name))
+
+    def __dir__(self):
+        return dir(self._target)
+
+    def __repr__(self) -> str:
+        return f"SyncProxy({self._target.__class__.__name__})"
+
+
+def _wrap(sync_api: SyncAPI, value: Any) -> Any:
+    if isinstance(value, BaseEndpoint):
+        return _SyncProxy(sync_api, value)
+    if inspect.ismethod(value):
+
+        @functools.wraps(value)
+        def call(*args, **kwargs):
+            return sync_api._call(value, *args, **kwargs)
+
+        return call
+    return value
+
+
+def _copy_outcome(future: concurrent.futures.Future, task: asyncio.Future) -> None:
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
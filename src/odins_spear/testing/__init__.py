@@ -0,0 +1,6 @@
+"""Local stand-ins for Odin to load test, benchmark and develop against offline."""
+
+from .enterprise import SIZES as SIZES
+from .enterprise import SyntheticEnterprise as SyntheticEnterprise
+from .enterprise import generate_enterprise as generate_enterprise
+from .mock_odin import MockOdin as MockOdin
@@ -0,0 +1,367 @@
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# entity counts per group of each preset, "huge" is 100k users and 3000 each of
+# auto attendants, hunt groups and call centers
+SIZES = {
+    "small": {
+        "groups": 2,
+        "users_per_group": 50,
+        "auto_attendants_per_group": 2,
+        "hunt_groups_per_group": 2,
+        "call_centers_per_group": 2,
+        "trunk_groups_per_group": 1,
+    },
+    "medium": {
+        "groups": 10,
+        "users_per_group": 1000,
+        "auto_attendants_per_group": 20,
+        "hunt_groups_per_group": 20,
+        "call_centers_per_group": 20,
+        "trunk_groups_per_group": 2,
+    },
+    "huge": {
+        "groups": 50,
+        "users_per_group": 2000,
+        "auto_attendants_per_group": 60,
+        "hunt_groups_per_group": 60,
+        "call_centers_per_group": 60,
+        "trunk_groups_per_group": 4,
+    },
+}
+
+FIRST_NAMES = (
+    "Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie",
+    "Avery", "Quinn", "Harper", "Rowan", "Elliot", "Hayden", "Reese", "Skyler",
+)  # fmt: skip
+LAST_NAMES = (
+    "Smith", "Jones", "Taylor", "Brown", "Williams", "Wilson", "Johnson", "Davies",
+    "Patel", "Wright", "Walker", "White", "Green", "Hall", "Wood", "Thompson",
+)  # fmt: skip
+USER_SERVICES = (
+    "Anonymous Call Rejection", "Call Forwarding Always", "Call Forwarding Busy",
+    "Call Forwarding No Answer", "Call Forwarding Not Reachable", "Do Not Disturb",
+    "Shared Call Appearance", "Voice Messaging User", "Call Center - Standard",
+    "Authentication", "Third-Party Voice Mail Support", "Intercept User",
+)  # fmt: skip
+GROUP_SERVICES = (
+    "Auto Attendant", "Auto Attendant - Standard", "Call Pickup", "Hunt Group",
+    "Call Capacity Management", "Music On Hold", "Series Completion",
+)  # fmt: skip
+SERVICE_PACKS = ("Basic User", "Standard User", "Premium User")
+FORWARDING = ("always", "busy", "no-answer", "not-reachable")
+
+
+@dataclass(kw_only=True)
+class SyntheticEnterprise:
+    """A generated service provider shaped like Odin's responses, served by MockOdin.
+
+    Entities are kept as the dicts Odin returns from its detail endpoints, keyed by id,
+    members lists the ids of each kind of entity per group.
+
+    Args:
+        service_provider (dict): Service provider detail.
+        groups (dict): Group detail by groupId.
+        users (dict): Extended user by userId.
+        auto_attendants (dict): Auto attendant detail by serviceUserId.
+        hunt_groups (dict): Hunt group detail by serviceUserId.
+        call_centers (dict): Call center detail by serviceUserId.
+        trunk_groups (dict): Trunk group detail by (groupId, name).
+        dns (dict): Numbers of each group by groupId, each {"phoneNumber", "assigned", "activated"}.
+        call_forwarding (dict): Forwarding settings by (userId, type) e.g. (user, "busy").
+        members (dict): Ids per kind per group e.g. members[group_id]["users"].
+    """
+
+    service_provider: dict
+    groups: Dict[str, dict] = field(default_factory=dict)
+    users: Dict[str, dict] = field(default_factory=dict)
+    auto_attendants: Dict[str, dict] = field(default_factory=dict)
+    hunt_groups: Dict[str, dict] = field(default_factory=dict)
+    call_centers: Dict[str, dict] = field(default_factory=dict)
+    trunk_groups: Dict[tuple, dict] = field(default_factory=dict)
+    dns: Dict[str, List[dict]] = field(default_factory=dict)
+    call_forwarding: Dict[tuple, dict] = field(default_factory=dict)
+    members: Dict[str, Dict[str, list]] = field(default_factory=dict)
+
+    @property
+    def service_provider_id(self) -> str:
+        return self.service_provider["serviceProviderId"]
+
+    def group_ids(self) -> List[str]:
+        return list(self.groups)
+
+    def counts(self) -> dict:
+        """Number of each kind of entity generated."""
+        return {
+            "groups": len(self.groups),
+            "users": len(self.users),
+            "auto_attendants": len(self.auto_attendants),
+            "hunt_groups": len(self.hunt_groups),
+            "call_centers": len(self.call_centers),
+            "trunk_groups": len(self.trunk_groups),
+            "dns": sum(len(numbers) for numbers in self.dns.values()),
+        }
+
+    def __repr__(self) -> str:
+        return f"SyntheticEnterprise(service_provider_id={self.service_provider_id!r}, {self.counts()})"
+
+
+def generate_enterprise(
+    size: str = "small",
+    service_provider_id: str = "ent1",
+    seed: int = 0,
+    groups: Optional[int] = None,
+    users_per_group: Optional[int] = None,
+    auto_attendants_per_group: Optional[int] = None,
+    hunt_groups_per_group: Optional[int] = None,
+    call_centers_per_group: Optional[int] = None,
+    trunk_groups_per_group: Optional[int] = None,
+) -> SyntheticEnterprise:
+    """Generates a synthetic enterprise, the same arguments always give the same data.
+
+    Args:
+        size (str, optional): Preset counts, small, medium or huge. Defaults to "small".
+        service_provider_id (str, optional): Enterprise id. Defaults to "ent1".
+        seed (int, optional): Seed of the generator. Defaults to 0.
+        groups (int, optional): Overrides the preset's number of groups. Defaults to None.
+        users_per_group (int, optional): Overrides the preset. Defaults to None.
+        auto_attendants_per_group (int, optional): Overrides the preset. Defaults to None.
+        hunt_groups_per_group (int, optional): Overrides the preset. Defaults to None.
+        call_centers_per_group (int, optional): Overrides the preset. Defaults to None.
+        trunk_groups_per_group (int, optional): Overrides the preset. Defaults to None.
+
+    Raises:
+        ValueError: If the size is unknown.
+
+    Returns:
+        SyntheticEnterprise: The generated enterprise.
+    """
+
+    if size not in SIZES:
+        raise ValueError(f"Unknown size '{size}', expected one of {list(SIZES)}")
+
+    counts = dict(SIZES[size])
+    for name, value in (
+        ("groups", groups),
+        ("users_per_group", users_per_group),
+        ("auto_attendants_per_group", auto_attendants_per_group),
+        ("hunt_groups_per_group", hunt_groups_per_group),
+        ("call_centers_per_group", call_centers_per_group),
+        ("trunk_groups_per_group", trunk_groups_per_group),
+    ):
+        if value is not None:
+            counts[name] = value
+
+    enterprise = SyntheticEnterprise(
+        service_provider={
+            "serviceProviderId": service_provider_id,
+            "serviceProviderName": f"{service_provider_id} Synthetic Enterprise",
+            "isEnterprise": True,
+            "useServiceProviderLanguages": False,
+            "defaultDomain": f"{service_provider_id}.odin.test",
+        }
+    )
+
+    for group_index in range(counts["groups"]):
+        # seeded per group so a group's data does not depend on how many others there are
+        rng = random.Random(f"{seed}:{group_index}")
+        _generate_group(enterprise, group_index, counts, rng)
+
+    return enterprise
+
+
+def _generate_group(
+    enterprise: SyntheticEnterprise, group_index: int, counts: dict, rng: random.Random
+) -> None:
+    service_provider_id = enterprise.service_provider_id
+    group_id = f"{service_provider_id}-grp{group_index + 1:03d}"
+    domain = f"grp{group_index + 1:03d}.{service_provider_id}.odin.test"
+    members = {
+        "users": [],
+        "auto_attendants": [],
+        "hunt_groups": [],
+        "call_centers": [],
+        "trunk_groups": [],
+    }
+    enterprise.members[group_id] = members
+
+    entities = (
+        counts["users_per_group"]
+        + counts["auto_attendants_per_group"]
+        + counts["hunt_groups_per_group"]
+        + counts["call_centers_per_group"]
+    )
+    # each group owns a block of numbers with 10% spare
+    first_number = 4420_0000_0000 + group_index * 100_000
+    numbers = [f"+{first_number + n}" for n in range(entities + entities // 10 + 1)]
+    next_number = iter(numbers)
+    next_extension = iter(range(1000, 100_000))
+    assigned = set()
+
+    def number():
+        phone_number = next(next_number)
+        assigned.add(phone_number)
+        return phone_number
+
+    def profile(name, phone_number, extension):
+        return {
+            "name": name,
+            "callingLineIdLastName": name,
+            "callingLineIdFirstName": name,
+            "phoneNumber": phone_number,
+            "extension": extension,
+            "aliases": [f"{name.lower().replace(' ', '-')}@{domain}"],
+        }
+
+    enterprise.groups[group_id] = {
+        "serviceProviderId": service_provider_id,
+        "groupId": group_id,
+        "groupName": f"Group {group_index + 1}",
+        "defaultDomain": domain,
+        "userLimit": counts["users_per_group"] * 2,
+        "userCount": counts["users_per_group"],
+        "callingLineIdPhoneNumber": numbers[0],
+        "timeZone": "Europe/London",
+    }
+
+    for n in range(counts["users_per_group"]):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        user_id = f"{first_name.lower()}.{last_name.lower()}{n}@{domain}"
+        # most users have a number, everyone has an extension
+        phone_number = number() if rng.random() < 0.8 else None
+        extension = str(next(next_extension))
+        aliases = [f"{first_name.lower()}{n}@{domain}"] if rng.random() < 0.1 else []
+        enterprise.users[user_id] = {
+            "serviceProviderId": service_provider_id,
+            "groupId": group_id,
+            "userId": user_id,
+            "lastName": last_name,
+            "firstName": first_name,
+            "callingLineIdLastName": last_name,
+            "callingLineIdFirstName": first_name,
+            "phoneNumber": phone_number,
+            "extension": extension,
+            "emailAddress": user_id,
+            "department": None,
+            "inTrunkGroup": False,
+            "aliases": aliases,
+            "countryCode": "44",
+            "timeZone": "Europe/London",
+            "userServices": rng.sample(USER_SERVICES, 4),
+            "servicePack": rng.choice(SERVICE_PACKS),
+        }
+        members["users"].append(user_id)
+
+        for forwarding in FORWARDING:
+            active = rng.random() < 0.05
+            enterprise.call_forwarding[(user_id, forwarding)] = {
+                "userId": user_id,
+                "isActive": active,
+                "assigned": active or rng.random() < 0.3,
+                "forwardToPhoneNumber": rng.choice(numbers) if active else None,
+            }
+
+    user_ids = members["users"]
+
+    def agents(count):
+        return [
+            {"userId": user_id, "weight": "0"}
+            for user_id in rng.sample(user_ids, min(count, len(user_ids)))
+        ]
+
+    for n in range(counts["auto_attendants_per_group"]):
+        service_user_id = f"aa{n + 1}@{domain}"
+        menu_keys = [
+            {
+                "key": str(key),
+                "action": "Transfer Without Prompt",
+                "description": f"Option {key}",
+                "phoneNumber": rng.choice(numbers),
+            }
+            for key in range(1, rng.randint(2, 6))
+        ]
+        enterprise.auto_attendants[service_user_id] = {
+            "serviceProviderId": service_provider_id,
+            "groupId": group_id,
+            "serviceUserId": service_user_id,
+            "type": "Standard",
+            "serviceInstanceProfile": profile(
+                f"Auto Attendant {n + 1}", number(), str(next(next_extension))
+            ),
+            "businessHoursMenu": {
+                "enableFirstMenuLevelExtensionDialing": True,
+                "keys": menu_keys,
+            },
+            "afterHoursMenu": {
+                "enableFirstMenuLevelExtensionDialing": False,
+                "keys": menu_keys[:1],
+            },
+            "isActive": True,
+        }
+        members["auto_attendants"].append(service_user_id)
+
+    for n in range(counts["hunt_groups_per_group"]):
+        service_user_id = f"hg{n + 1}@{domain}"
+        enterprise.hunt_groups[service_user_id] = {
+            "serviceProviderId": service_provider_id,
+            "groupId": group_id,
+            "serviceUserId": service_user_id,
+            "serviceInstanceProfile": profile(
+                f"Hunt Group {n + 1}", number(), str(next(next_extension))
+            ),
+            "policy": rng.choice(("Circular", "Regular", "Simultaneous", "Uniform")),
+            "agents": agents(rng.randint(2, 10)),
+            "forwardAfterTimeout": False,
+            "forwardTimeoutSeconds": 10,
+            "noAnswerNumberOfRings": 5,
+            "forwardToPhoneNumber": None,
+            "enableNotReachableForwarding": False,
+            "notReachableForwardToPhoneNumber": None,
+            "isActive": True,
+        }
+        members["hunt_groups"].append(service_user_id)
+
+    for n in range(counts["call_centers_per_group"]):
+        service_user_id = f"cc{n + 1}@{domain}"
+        enterprise.call_centers[service_user_id] = {
+            "serviceProviderId": service_provider_id,
+            "groupId": group_id,
+            "serviceUserId": service_user_id,
+            "type": "Premium",
+            "policy": rng.choice(("Circular", "Regular", "Simultaneous", "Uniform")),
+            "serviceInstanceProfile": profile(
+                f"Call Center {n + 1}", number(), str(next(next_extension))
+            ),
+            "agents": agents(rng.randint(2, 20)),
+            "enableVideo": False,
+            "queueLength": 10,
+            "isActive": True,
+        }
+        members["call_centers"].append(service_user_id)
+
+    for n in range(counts["trunk_groups_per_group"]):
+        name = f"Trunk {n + 1}"
+        max_active_calls = rng.choice((10, 20, 30, 50))
+        enterprise.trunk_groups[(group_id, name)] = {
+            "serviceProviderId": service_provider_id,
+            "groupId": group_id,
+            "name": name,
+            "pilotUserId": f"trunk{n + 1}-pilot@{domain}",
+            "maxActiveCalls": max_active_calls,
+            "enableBursting": True,
+            "burstingMaxActiveCalls": max_active_calls // 2,
+            "department": None,
+            "accessDevice": {"deviceName": f"sbc{n + 1}", "deviceLevel": "Group"},
+        }
+        members["trunk_groups"].append(name)
+
+    enterprise.dns[group_id] = [
+        {
+            "phoneNumber": phone_number,
+            "assigned": phone_number in assigned,
+            "activated": phone_number in assigned or rng.random() < 0.5,
+        }
+        for phone_number in numbers
+    ]
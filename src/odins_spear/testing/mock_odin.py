@@ -0,0 +1,718 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from collections import Counter
+from typing import Optional, Tuple
+
+import httpx
+
+from .enterprise import FORWARDING, GROUP_SERVICES, SERVICE_PACKS, USER_SERVICES
+from .enterprise import SyntheticEnterprise, generate_enterprise
+
+
+class MockOdin:
+    """A local stand-in for the Odin API serving a SyntheticEnterprise.
+
+    Read endpoints used by the scripts and reports answer from the enterprise in Odin's
+    response shapes, other GETs answer 404. Writes are accepted and echo their body
+    without changing the data, so runs are repeatable. Latency, server side rate
+    limiting (429 with Retry-After) and 503s can be simulated.
+
+    Use as a transport, API(..., transport=MockOdin().transport()), or serve it over
+    HTTP as an ASGI app e.g. uvicorn.run(MockOdin(), port=8000).
+
+    Args:
+        enterprise (SyntheticEnterprise, optional): Data served. Defaults to a small
+            generated enterprise.
+        base_path (str, optional): Path prefix of the API. Defaults to "/api/v2".
+        latency (float, optional): Seconds every response takes. Defaults to 0.0.
+        jitter (float, optional): Random extra seconds up to this per response. Defaults to 0.0.
+        latency_per_item (float, optional): Extra seconds per item in a list response, so
+            large listings are slower. Defaults to 0.0.
+        rate_limit (float, optional): Requests per second answered before 429s are
+            returned, None is unlimited. Defaults to None.
+        burst (int, optional): Requests allowed back to back under the rate limit.
+            Defaults to rate_limit.
+        retry_after (int, optional): Retry-After seconds sent with 429s. Defaults to 1.
+        error_rate (float, optional): Share of requests answered with 503. Defaults to 0.0.
+        seed (int, optional): Seed of the jitter and error generator. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        enterprise: Optional[SyntheticEnterprise] = None,
+        base_path: str = "/api/v2",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        latency_per_item: float = 0.0,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        retry_after: int = 1,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.enterprise = enterprise or generate_enterprise()
+        self.base_path = base_path.rstrip("/")
+        self.latency = latency
+        self.jitter = jitter
+        self.latency_per_item = latency_per_item
+        self.rate_limit = rate_limit
+        self.burst = burst if burst is not None else rate_limit
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+
+        self._tokens = self.burst
+        self._refilled = time.monotonic()
+        self.requests = Counter()
+        self.throttled = 0
+        self.errors = 0
+
+        self._routes = {
+            "/auth/token": self._auth_token,
+            "/auth/session": self._auth_session,
+            "/service-providers": self._service_providers,
+            "/groups": self._groups,
+            "/users": self._users,
+            "/groups/auto-attendants": self._auto_attendants,
+            "/groups/hunt-groups": self._hunt_groups,
+            "/groups/hunt-groups/user": self._user_hunt_groups,
+            "/groups/call-pickup/user": self._user_call_pickup,
+            "/groups/call-centers": self._call_centers,
+            "/groups/call-centers/agents": self._call_center_agents,
+            "/groups/call-centers/overflow": self._call_center_setting,
+            "/groups/call-centers/stranded-calls": self._call_center_setting,
+            "/groups/call-centers/stranded-calls-unavailable": self._call_center_setting,
+            "/groups/call-centers/forced-forwarding": self._forced_forwarding,
+            "/groups/call-centers/bounced-calls": self._bounced_calls,
+            "/groups/trunk-groups": self._trunk_groups,
+            "/groups/trunk-groups/call-capacity": self._group_call_capacity,
+            "/service-providers/trunk-groups/call-capacity": self._service_provider_call_capacity,
+            "/groups/dns": self._group_dns,
+            "/groups/services": self._group_services,
+            "/groups/services/assigned": self._group_services_assigned,
+            "/users/services": self._user_services,
+            "/users/reports/users": self._user_report,
+            "/users/call-center": self._user_call_centers,
+            "/users/registration": self._user_registration,
+            "/users/registration/bulk": self._bulk_registration,
+            "/users/call-records/stats": self._call_records_stats,
+        }
+        for forwarding in FORWARDING:
+            self._routes[f"/users/call-forwarding-{forwarding}"] = self._forwarding(
+                forwarding
+            )
+            self._routes[f"/users/call-forwarding-{forwarding}/bulk"] = (
+                self._bulk_forwarding(forwarding)
+            )
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport answering requests from this server without any network."""
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answers one request."""
+        path = request.url.path
+        if path.startswith(self.base_path):
+            path = path[len(self.base_path) :]
+        path = path.rstrip("/") or "/"
+        self.requests[f"{request.method} {path}"] += 1
+
+        if not self._take_token():
+            self.throttled += 1
+            return self._error(
+                429, "Too many requests", {"Retry-After": str(self.retry_after)}
+            )
+
+        status, body = self._dispatch(request, path)
+        items = len(body) if isinstance(body, list) else 1
+        delay = self.latency + items * self.latency_per_item
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            return self._error(503, "Service unavailable")
+        if status != 200:
+            return self._error(status, body)
+        return httpx.Response(200, json=body)
+
+    async def __call__(self, scope, receive, send) -> None:
+        """ASGI entry point so the server can be run by uvicorn, hypercorn etc."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        query = scope.get("query_string", b"").decode()
+        request = httpx.Request(
+            scope["method"],
+            f"http://mock-odin{scope['path']}" + (f"?{query}" if query else ""),
+            content=body,
+        )
+        response = await self.handle(request)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [
+                    (name.encode(), value.encode())
+                    for name, value in response.headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.content})
+
+    def metrics(self) -> dict:
+        """Requests answered per method and path, and how many were throttled or failed."""
+        return {
+            "requests": sum(self.requests.values()),
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "paths": dict(self.requests.most_common()),
+        }
+
+    def _take_token(self) -> bool:
+        if self.rate_limit is None:
+            return True
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._refilled) * self.rate_limit
+        )
+        self._refilled = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _dispatch(self, request: httpx.Request, path: str) -> Tuple[int, object]:
+        if request.method != "GET":
+            if path in ("/auth/token", "/auth/session"):
+                return self._routes[path](request.url.params)
+            # accepted but not applied so every run sees the same data
+            return 200, json.loads(request.content) if request.content else {}
+
+        route = self._routes.get(path)
+        if route is None:
+            return 404, f"{path} is not implemented by MockOdin"
+        return route(request.url.params)
+
+    @staticmethod
+    def _error(
+        status: int, details: str, headers: Optional[dict] = None
+    ) -> httpx.Response:
+        return httpx.Response(
+            status,
+            json={"details": details, "status": status, "error": details},
+            headers=headers,
+        )
+
+    def _group(self, params) -> Optional[dict]:
+        return self.enterprise.groups.get(params.get("groupId"))
+
+    def _group_members(self, params, kind: str) -> Optional[list]:
+        members = self.enterprise.members.get(params.get("groupId"))
+        return members[kind] if members is not None else None
+
+    # AUTH
+
+    def _auth_token(self, params):
+        return 200, {"token": "mock-odin-token"}
+
+    def _auth_session(self, params):
+        return 200, {
+            "token": "mock-odin-token",
+            "userId": "mock-admin",
+            "isAdmin": True,
+        }
+
+    # SERVICE PROVIDERS/ GROUPS
+
+    def _service_providers(self, params):
+        service_provider = self.enterprise.service_provider
+        service_provider_id = params.get("serviceProviderId")
+        if service_provider_id is None:
+            return 200, [service_provider]
+        if service_provider_id != service_provider["serviceProviderId"]:
+            return 404, "Service provider not found"
+        return 200, service_provider
+
+    def _groups(self, params):
+        if "groupId" in params:
+            group = self._group(params)
+            return (200, group) if group else (404, "Group not found")
+        return 200, list(self.enterprise.groups.values())
+
+    # USERS
+
+    def _users(self, params):
+        users = self.enterprise.users
+        if "userId" in params:
+            user = users.get(params["userId"])
+            return (200, user) if user else (404, "User not found")
+
+        if "groupId" in params:
+            members = self._group_members(params, "users") or []
+            matched = [users[user_id] for user_id in members]
+        else:
+            matched = list(users.values())
+
+        for field in ("lastName", "firstName", "extension", "userId", "dn"):
+            if field in params:
+                matched = [
+                    user
+                    for user in matched
+                    if _matches(
+                        user["phoneNumber" if field == "dn" else field], params[field]
+                    )
+                ]
+        if "limit" in params:
+            matched = matched[: int(params["limit"])]
+        if params.get("extended") != "true":
+            matched = [_basic_user(user) for user in matched]
+        return 200, matched
+
+    def _user_services(self, params):
+        user = self.enterprise.users.get(params.get("userId"))
+        if user is None:
+            return 404, "User not found"
+        return 200, {
+            "userId": user["userId"],
+            "userServices": [
+                {"serviceName": name, "assigned": name in user["userServices"]}
+                for name in USER_SERVICES
+            ],
+            "groupServices": [],
+            "servicePackServices": [
+                {"serviceName": pack, "assigned": pack == user["servicePack"]}
+                for pack in SERVICE_PACKS
+            ],
+        }
+
+    def _user_report(self, params):
+        user = self.enterprise.users.get(params.get("userId"))
+        if user is None:
+            return 404, "User not found"
+        return 200, {
+            **_basic_user(user),
+            "aliases": user["aliases"],
+            "userServices": list(user["userServices"]),
+            "servicePacks": [user["servicePack"]],
+        }
+
+    def _user_registration(self, params):
+        user = self.enterprise.users.get(params.get("userId"))
+        if user is None:
+            return 404, "User not found"
+        return 200, {"userId": user["userId"], "registrations": _registrations(user)}
+
+    def _bulk_registration(self, params):
+        members = self._group_members(params, "users")
+        if members is None:
+            return 404, "Group not found"
+        users = self.enterprise.users
+        return 200, [
+            {
+                "userId": user_id,
+                "lastName": users[user_id]["lastName"],
+                "firstName": users[user_id]["firstName"],
+                "extension": users[user_id]["extension"],
+                "phoneNumber": users[user_id]["phoneNumber"],
+                "registrations": _registrations(users[user_id]),
+            }
+            for user_id in members
+        ]
+
+    def _call_records_stats(self, params):
+        user_id = params.get("userIds")
+        if user_id not in self.enterprise.users:
+            return 404, "User not found"
+        # stable per user so reports are repeatable
+        seed = int(hashlib.sha256(user_id.encode()).hexdigest()[:8], 16)
+        rng = random.Random(seed)
+        # Odin answers an empty object for a user who made and took no calls
+        if rng.random() < 0.1:
+            return 200, {}
+        placed_answered, placed_missed = rng.randint(0, 200), rng.randint(0, 20)
+        received_answered, received_missed = rng.randint(0, 200), rng.randint(0, 40)
+        placed = placed_answered + placed_missed
+        received = received_answered + received_missed
+        return 200, {
+            "userId": user_id,
+            "total": placed + received,
+            "totalAnsweredAndMissed": placed + received,
+            "answeredTotal": placed_answered + received_answered,
+            "missedTotal": placed_missed + received_missed,
+            "busyTotal": rng.randint(0, 5),
+            "redirectTotal": rng.randint(0, 5),
+            "receivedTotal": received,
+            "receivedMissed": received_missed,
+            "receivedAnswered": received_answered,
+            "placedTotal": placed,
+            "placedMissed": placed_missed,
+            "placedAnswered": placed_answered,
+        }
+
+    def _forwarding(self, forwarding: str):
+        def route(params):
+            settings = self.enterprise.call_forwarding.get(
+                (params.get("userId"), forwarding)
+            )
+            if settings is None:
+                return 404, "User not found"
+            return 200, {
+                "isActive": settings["isActive"],
+                "forwardToPhoneNumber": settings["forwardToPhoneNumber"],
+                "isRingSplashActive": False,
+            }
+
+        return route
+
+    def _bulk_forwarding(self, forwarding: str):
+        def route(params):
+            members = self._group_members(params, "users")
+            if members is None:
+                return 404, "Group not found"
+            users = self.enterprise.users
+            items = []
+            for user_id in members:
+                settings = self.enterprise.call_forwarding[(user_id, forwarding)]
+                items.append(
+                    {
+                        "user": _basic_user(users[user_id]),
+                        "service": {
+                            "assigned": settings["assigned"],
+                            "active": settings["isActive"],
+                        },
+                        "data": {
+                            "isActive": settings["isActive"],
+                            "forwardToPhoneNumber": settings["forwardToPhoneNumber"],
+                        },
+                    }
+                )
+            return 200, items
+
+        return route
+
+    # SERVICES
+
+    def _services_entities(self, kind: str, params):
+        entities = getattr(self.enterprise, kind)
+        if "serviceUserId" in params:
+            entity = entities.get(params["serviceUserId"])
+            return (200, entity) if entity else (404, "Service instance not found")
+
+        members = self._group_members(params, kind)
+        if members is None:
+            return 404, "Group not found"
+        return 200, [_summary(entities[service_user_id]) for service_user_id in members]
+
+    def _auto_attendants(self, params):
+        return self._services_entities("auto_attendants", params)
+
+    def _hunt_groups(self, params):
+        return self._services_entities("hunt_groups", params)
+
+    def _call_centers(self, params):
+        return self._services_entities("call_centers", params)
+
+    def _user_entities(self, kind: str, params) -> Optional[list]:
+        """Hunt groups or call centers of the user's group the user is an agent of."""
+        user = self.enterprise.users.get(params.get("userId"))
+        if user is None:
+            return None
+        entities = getattr(self.enterprise, kind)
+        return [
+            _summary(entities[service_user_id])
+            for service_user_id in self.enterprise.members[user["groupId"]][kind]
+            if any(
+                agent["userId"] == user["userId"]
+                for agent in entities[service_user_id]["agents"]
+            )
+        ]
+
+    def _user_hunt_groups(self, params):
+        hunt_groups = self._user_entities("hunt_groups", params)
+        return (
+            (200, hunt_groups) if hunt_groups is not None else (404, "User not found")
+        )
+
+    def _user_call_centers(self, params):
+        call_centers = self._user_entities("call_centers", params)
+        if call_centers is None:
+            return 404, "User not found"
+        return 200, {"userId": params["userId"], "callCenters": call_centers}
+
+    def _user_call_pickup(self, params):
+        # the enterprise has no call pickup groups
+        if params.get("userId") not in self.enterprise.users:
+            return 404, "User not found"
+        return 200, []
+
+    def _call_center(self, params) -> Optional[dict]:
+        return self.enterprise.call_centers.get(params.get("serviceUserId"))
+
+    def _call_center_agents(self, params):
+        call_center = self._call_center(params)
+        if call_center is None:
+            return 404, "Call center not found"
+        users = self.enterprise.users
+        return 200, {
+            "serviceUserId": call_center["serviceUserId"],
+            "agents": [
+                _basic_user(users[agent["userId"]]) for agent in call_center["agents"]
+            ],
+        }
+
+    def _call_center_setting(self, params):
+        call_center = self._call_center(params)
+        if call_center is None:
+            return 404, "Call center not found"
+        return 200, {
+            "serviceUserId": call_center["serviceUserId"],
+            "action": "Busy",
+            "transferPhoneNumber": None,
+        }
+
+    def _forced_forwarding(self, params):
+        call_center = self._call_center(params)
+        if call_center is None:
+            return 404, "Call center not found"
+        return 200, {
+            "serviceUserId": call_center["serviceUserId"],
+            "enabled": False,
+            "forwardToPhoneNumber": None,
+        }
+
+    def _bounced_calls(self, params):
+        call_center = self._call_center(params)
+        if call_center is None:
+            return 404, "Call center not found"
+        return 200, {
+            "serviceUserId": call_center["serviceUserId"],
+            "isActive": False,
+            "numberOfRingsBeforeBouncingCall": 5,
+        }
+
+    # TRUNKING
+
+    def _trunk_groups(self, params):
+        group_id = params.get("groupId")
+        if "name" in params:
+            trunk_group = self.enterprise.trunk_groups.get((group_id, params["name"]))
+            return (200, trunk_group) if trunk_group else (404, "Trunk group not found")
+
+        members = self._group_members(params, "trunk_groups")
+        if not members:
+            # Odin fails listing a group without trunk groups
+            return 404, "No trunk groups found"
+        trunk_groups = self.enterprise.trunk_groups
+        return 200, [
+            {"name": name, "pilotUserId": trunk_groups[(group_id, name)]["pilotUserId"]}
+            for name in members
+        ]
+
+    def _group_call_capacity(self, params):
+        members = self._group_members(params, "trunk_groups")
+        if not members:
+            return 404, "Trunk group service not assigned"
+        group_id = params["groupId"]
+        trunk_groups = [
+            self.enterprise.trunk_groups[(group_id, name)] for name in members
+        ]
+        max_active_calls = sum(trunk["maxActiveCalls"] for trunk in trunk_groups)
+        bursting = sum(trunk["burstingMaxActiveCalls"] for trunk in trunk_groups)
+        return 200, {
+            "serviceProviderId": params.get("serviceProviderId"),
+            "groupId": group_id,
+            "maxActiveCalls": max_active_calls,
+            "maxAvailableActiveCalls": max_active_calls * 2,
+            "burstingMaxActiveCalls": bursting,
+            "burstingMaxAvailableActiveCalls": bursting * 2,
+        }
+
+    def _service_provider_call_capacity(self, params):
+        if params.get("serviceProviderId") != self.enterprise.service_provider_id:
+            return 404, "Service provider not found"
+        trunk_groups = self.enterprise.trunk_groups.values()
+        return 200, {
+            "serviceProviderId": self.enterprise.service_provider_id,
+            "maxActiveCalls": sum(trunk["maxActiveCalls"] for trunk in trunk_groups)
+            * 4,
+            "burstingMaxActiveCalls": sum(
+                trunk["burstingMaxActiveCalls"] for trunk in trunk_groups
+            )
+            * 4,
+        }
+
+    # NUMBERS/ SERVICES
+
+    def _group_dns(self, params):
+        numbers = self.enterprise.dns.get(params.get("groupId"))
+        if numbers is None:
+            return 404, "Group not found"
+        return 200, {
+            "serviceProviderId": params.get("serviceProviderId"),
+            "groupId": params["groupId"],
+            "dns": [
+                {
+                    "min": number["phoneNumber"],
+                    "max": None,
+                    "assigned": number["assigned"],
+                    "activated": number["activated"],
+                    "list": [number["phoneNumber"]],
+                }
+                for number in numbers
+            ],
+        }
+
+    def _group_services(self, params):
+        members = self._group_members(params, "users")
+        if members is None:
+            return 404, "Group not found"
+        users = [self.enterprise.users[user_id] for user_id in members]
+        usage = Counter(name for user in users for name in user["userServices"])
+        packs = Counter(user["servicePack"] for user in users)
+        return 200, {
+            "userServices": [
+                {
+                    "serviceName": name,
+                    "authorized": True,
+                    "assigned": usage[name] > 0,
+                    "limited": "Unlimited",
+                    "quantity": -1,
+                    "licensed": True,
+                    "allowed": -1,
+                    "userAssignable": True,
+                    "groupServiceAssignable": False,
+                    "tags": [],
+                    "alias": name,
+                    "usage": usage[name],
+                }
+                for name in USER_SERVICES
+            ],
+            "groupServices": [
+                {
+                    "serviceName": name,
+                    "authorized": True,
+                    "assigned": True,
+                    "limited": "Unlimited",
+                    "quantity": -1,
+                    "licensed": True,
+                    "allowed": -1,
+                    "instanceCount": 1,
+                    "alias": name,
+                    "usage": 1,
+                }
+                for name in GROUP_SERVICES
+            ],
+            "servicePackServices": [
+                {
+                    "servicePackName": pack,
+                    "serviceName": pack,
+                    "authorized": True,
+                    "assigned": packs[pack] > 0,
+                    "limited": "Unlimited",
+                    "quantity": -1,
+                    "allowed": -1,
+                    "alias": pack,
+                    "usage": packs[pack],
+                }
+                for pack in SERVICE_PACKS
+            ],
+        }
+
+    def _group_services_assigned(self, params):
+        members = self._group_members(params, "users")
+        if members is None:
+            return 404, "Group not found"
+        service_name = params.get("serviceName")
+        field = (
+            "servicePack"
+            if params.get("serviceType") == "servicePackName"
+            else "userServices"
+        )
+        users = self.enterprise.users
+        return 200, {
+            "serviceName": service_name,
+            "users": [
+                _basic_user(users[user_id])
+                for user_id in members
+                if service_name == users[user_id][field]
+                or (field == "userServices" and service_name in users[user_id][field])
+            ],
+        }
+
+
+def _basic_user(user: dict) -> dict:
+    """The fields Odin lists for a user unless extended=true is asked for."""
+    return {
+        "serviceProviderId": user["serviceProviderId"],
+        "groupId": user["groupId"],
+        "userId": user["userId"],
+        "lastName": user["lastName"],
+        "firstName": user["firstName"],
+        "phoneNumber": user["phoneNumber"],
+        "extension": user["extension"],
+        "department": user["department"],
+        "emailAddress": user["emailAddress"],
+        "inTrunkGroup": user["inTrunkGroup"],
+    }
+
+
+def _summary(entity: dict) -> dict:
+    """List entry of an auto attendant, hunt group or call center."""
+    profile = entity["serviceInstanceProfile"]
+    return {
+        "serviceUserId": entity["serviceUserId"],
+        "name": profile["name"],
+        "phoneNumber": profile["phoneNumber"],
+        "extension": profile["extension"],
+        "isActive": entity["isActive"],
+        **({"type": entity["type"]} if "type" in entity else {}),
+        **({"policy": entity["policy"]} if "policy" in entity else {}),
+    }
+
+
+def _registrations(user: dict) -> list:
+    # every fourth user is unregistered
+    if int(user["extension"]) % 4 == 0:
+        return []
+    return [
+        {
+            "deviceName": f"{user['userId'].split('@')[0]}-phone",
+            "uri": f"sip:{user['extension']}@10.0.0.1:5060",
+            "expiration": "300",
+            "endpointType": "Primary",
+            "userAgent": "MockPhone/1.0",
+        }
+    ]
+
+
+def _matches(value: Optional[str], pattern: str) -> bool:
+    """Odin's filter values, * is a wildcard at either end."""
+    if value is None:
+        return False
+    value, pattern = value.lower(), pattern.lower()
+    if pattern.startswith("*") and pattern.endswith("*") and len(pattern) > 1:
+        return pattern[1:-1] in value
+    if pattern.startswith("*"):
+        return value.endswith(pattern[1:])
+    if pattern.endswith("*"):
+        return value.startswith(pattern[:-1])
+    return value == pattern
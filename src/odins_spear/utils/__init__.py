@@ -1 +1,16 @@
 from .config_manager import ConfigManager as ConfigManager
+from .cache import ResponseCache as ResponseCache
+from .circuit_breaker import CircuitBreaker as CircuitBreaker
+from .cache import SQLiteResponseCache as SQLiteResponseCache
+from .hedge import HedgePolicy as HedgePolicy
+from .metrics import MetricsCollector as MetricsCollector
+from .retry import RetryPolicy as RetryPolicy
+from .scheduler import request_priority as request_priority
+from .tracing import LoggingSpanExporter as LoggingSpanExporter
+from .tracing import InMemorySpanExporter as InMemorySpanExporter
+from .tracing import Tracer as Tracer
+from .tracing import trace_span as trace_span
+from .cassette import RecordingTransport as RecordingTransport
+from .cassette import ReplayTransport as ReplayTransport
+from .json_stream import JSONArrayStream as JSONArrayStream
+from .compression import CompressionPolicy as CompressionPolicy
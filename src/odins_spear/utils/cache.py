@@ -0,0 +1,449 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+from .helpers import (
+    endpoint_under_prefix,
+    match_endpoint_prefix,
+    normalise_endpoint_prefix,
+)
+
+# GETs answering a new value or the caller's own session on every call, never cached
+# whatever the TTLs e.g. a cached generated password would be set on every user
+NEVER_CACHED = frozenset(
+    {
+        "/auth/session",
+        "/password/generate",
+        "/passwords/generate",
+        "/passcode/generate",
+        "/passcodes/generate",
+        "/sip-password/generate",
+        "/sip-passwords/generate",
+    }
+)
+
+
+def stale_paths(endpoint: str) -> tuple:
+    """Paths a write to endpoint leaves stale besides those below it, the path itself and
+    its collection one level up e.g. /groups/call-centers and /groups for a write to
+    /groups/call-centers. Paths further up e.g. /groups for /groups/call-centers/agents
+    are kept, clearing them would drop every group's responses on any write under them.
+    """
+    endpoint = endpoint.rstrip("?")
+    collection = endpoint.rsplit("/", 1)[0]
+    return (endpoint, collection) if collection else (endpoint,)
+
+
+def never_cached(endpoint: str) -> bool:
+    """Checks if endpoint is in NEVER_CACHED, ignoring a trailing ? or /."""
+    return endpoint.rstrip("?").rstrip("/") in NEVER_CACHED
+
+
+class ResponseCache:
+    """In memory TTL + LRU cache of GET response bodies.
+
+    Only endpoints given a TTL are cached. Raw response bodies are stored and decoded on
+    every hit so callers never share, and can't corrupt, a cached object. Once
+    max_entries or max_bytes is exceeded the least recently used entries are evicted.
+    Endpoints in NEVER_CACHED e.g. /password/generate are never cached, even under
+    default_ttl. A PUT/ POST/ DELETE invalidates every entry on the same resource path,
+    its collection one level up or below it e.g. a PUT to /groups/call-centers/agents
+    invalidates cached /groups/call-centers/agents and /groups/call-centers responses but
+    not /groups.
+
+    Example TTLs for rarely changing resources:
+        {"/service-providers": 600, "/groups": 300, "/groups/services": 300,
+        "/groups/trunk-groups": 300}
+
+    Args:
+        ttls (dict, optional): Seconds to cache per endpoint prefix, longest prefix applies.
+            0 disables caching for a prefix. Defaults to None.
+        default_ttl (float, optional): Seconds to cache GETs not matching ttls, None caches
+            only endpoints in ttls. Defaults to None.
+        max_entries (int, optional): Max responses held. Defaults to 1024.
+        max_bytes (int, optional): Max total size of held response bodies. Defaults to 64MB.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+    ) -> None:
+        self.ttls = {
+            normalise_endpoint_prefix(prefix): ttl
+            for prefix, ttl in (ttls or {}).items()
+        }
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # key: (path, expires, body)
+        self._entries = OrderedDict()
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """Seconds responses from endpoint are cached for, None if they are not cached."""
+        if never_cached(endpoint):
+            return None
+        prefix = match_endpoint_prefix(endpoint, self.ttls)
+        ttl = self.ttls[prefix] if prefix is not None else self.default_ttl
+        return ttl if ttl else None
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Returns the cached body for key, None on a miss or if the entry expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def set(
+        self, key: Hashable, endpoint: str, body: bytes, ttl: Optional[float] = None
+    ) -> None:
+        """Caches body for key if endpoint has a TTL.
+
+        Args:
+            key (Hashable): Request key.
+            endpoint (str): Endpoint the response came from, used for TTL and invalidation.
+            body (bytes): Raw response body.
+            ttl (float, optional): Seconds to cache for in place of the TTL of endpoint,
+                from its EndpointPolicy. Defaults to None.
+        """
+
+        if ttl is None:
+            ttl = self.ttl_for(endpoint)
+        if (
+            ttl is None
+            or never_cached(endpoint)
+            or (self.max_bytes is not None and len(body) > self.max_bytes)
+        ):
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (endpoint.rstrip("?"), time.monotonic() + ttl, body)
+        self.size += len(body)
+
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self.size > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        """Removes entries on the same resource path as endpoint, its collection one level
+        up or below it, see stale_paths().
+
+        Args:
+            endpoint (str): Endpoint written to e.g. /groups/call-centers
+
+        Returns:
+            int: Number of entries removed.
+        """
+
+        endpoint = endpoint.rstrip("?")
+        paths = stale_paths(endpoint)
+        stale = [
+            key
+            for key, (path, _, _) in self._entries.items()
+            if path in paths or endpoint_under_prefix(path, endpoint)
+        ]
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self._entries.clear()
+        self.size = 0
+
+    async def aget(self, key: Hashable) -> Optional[bytes]:
+        """get() for callers on the event loop."""
+        return self.get(key)
+
+    async def aset(
+        self, key: Hashable, endpoint: str, body: bytes, ttl: Optional[float] = None
+    ) -> None:
+        """set() for callers on the event loop."""
+        self.set(key, endpoint, body, ttl)
+
+    async def ainvalidate(self, endpoint: str) -> int:
+        """invalidate() for callers on the event loop."""
+        return self.invalidate(endpoint)
+
+    def metrics(self) -> dict:
+        """Snapshot of cache size and hit/ miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, body = self._entries.pop(key)
+        self.size -= len(body)
+
+    def __repr__(self) -> str:
+        return (
+            f"ResponseCache(ttls={self.ttls}, default_ttl={self.default_ttl}, "
+            f"max_entries={self.max_entries}, max_bytes={self.max_bytes})"
+        )
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Response cache persisted to a SQLite file so separate processes share it.
+
+    Short lived scripts e.g. cron jobs reuse responses an earlier run fetched instead of
+    requesting them again. The database runs in WAL mode so many processes can read
+    while one writes. TTLs, invalidation and the size caps work as ResponseCache, entries
+    are evicted by last access once max_entries or max_bytes is exceeded. Hit/ miss
+    counters are per process. A failing database is treated as a cache miss.
+
+    The Requester runs the database work in a thread (aget, aset, ainvalidate) so a
+    slow disk or another process's lock never stalls the event loop. Last access is
+    only written back once touch_after of an entry's remaining TTL has passed since the
+    previous write, so repeated hits on a hot entry are reads only.
+
+    Args:
+        path (str, optional): Database file, created if missing. Defaults to
+            ~/.cache/odins_spear/responses.sqlite3
+        ttls (dict, optional): Seconds to cache per endpoint prefix. Defaults to None.
+        default_ttl (float, optional): Seconds to cache GETs not matching ttls. Defaults to None.
+        max_entries (int, optional): Max responses held. Defaults to 10000.
+        max_bytes (int, optional): Max total size of held response bodies. Defaults to 256MB.
+        timeout (float, optional): Seconds to wait on another process's lock. Defaults to 5.0.
+        touch_after (float, optional): Share of an entry's remaining TTL that must pass
+            before a hit records its access again, 0 records every hit. Defaults to 0.1.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        max_entries: int = 10000,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        timeout: float = 5.0,
+        touch_after: float = 0.1,
+    ) -> None:
+        super().__init__(ttls, default_ttl, max_entries, max_bytes)
+        self.path = path or os.path.join(
+            os.path.expanduser("~"), ".cache", "odins_spear", "responses.sqlite3"
+        )
+        self.timeout = timeout
+        self.touch_after = touch_after
+        self.errors = 0
+        self._connection = None
+        # one connection is shared by the threads aget/ aset/ ainvalidate run in
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            try:
+                with self._connect() as connection:
+                    row = connection.execute(
+                        "SELECT body, accessed, expires FROM responses "
+                        "WHERE key = ? AND expires > ?",
+                        (self._key(key), now),
+                    ).fetchone()
+                    if row is not None and now - row[1] >= self.touch_after * (
+                        row[2] - row[1]
+                    ):
+                        connection.execute(
+                            "UPDATE responses SET accessed = ? WHERE key = ?",
+                            (now, self._key(key)),
+                        )
+            except sqlite3.Error:
+                self.errors += 1
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def set(
+        self, key: Hashable, endpoint: str, body: bytes, ttl: Optional[float] = None
+    ) -> None:
+        if ttl is None:
+            ttl = self.ttl_for(endpoint)
+        if (
+            ttl is None
+            or never_cached(endpoint)
+            or (self.max_bytes is not None and len(body) > self.max_bytes)
+        ):
+            return
+
+        now = time.time()
+        with self._lock:
+            try:
+                with self._connect() as connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            self._key(key),
+                            endpoint.rstrip("?"),
+                            now + ttl,
+                            now,
+                            len(body),
+                            sqlite3.Binary(body),
+                        ),
+                    )
+                    self._evict(connection, now)
+            except sqlite3.Error:
+                self.errors += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        endpoint = endpoint.rstrip("?")
+        # the path itself and its collection e.g. /groups for /groups/call-centers
+        paths = stale_paths(endpoint)
+        # and every path below it
+        below = (
+            endpoint.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            + "/%"
+        )
+
+        with self._lock:
+            try:
+                with self._connect() as connection:
+                    removed = connection.execute(
+                        f"DELETE FROM responses WHERE path IN ({', '.join('?' * len(paths))}) "
+                        "OR path LIKE ? ESCAPE '\\'",
+                        (*paths, below),
+                    ).rowcount
+            except sqlite3.Error:
+                self.errors += 1
+                return 0
+
+            self.invalidations += removed
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                with self._connect() as connection:
+                    connection.execute("DELETE FROM responses")
+            except sqlite3.Error:
+                self.errors += 1
+
+    async def aget(self, key: Hashable) -> Optional[bytes]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(
+        self, key: Hashable, endpoint: str, body: bytes, ttl: Optional[float] = None
+    ) -> None:
+        await asyncio.to_thread(self.set, key, endpoint, body, ttl)
+
+    async def ainvalidate(self, endpoint: str) -> int:
+        return await asyncio.to_thread(self.invalidate, endpoint)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            try:
+                with self._connect() as connection:
+                    entries, size = connection.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                    ).fetchone()
+            except sqlite3.Error:
+                self.errors += 1
+                entries, size = None, None
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
+
+    def close(self) -> None:
+        """Closes this process's connection to the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, path TEXT NOT NULL, expires REAL NOT NULL, "
+                "accessed REAL NOT NULL, size INTEGER NOT NULL, body BLOB NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_path ON responses (path)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        connection.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+
+        entries, size = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        count = max(entries - self.max_entries, 0)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # oldest entries to drop before the rest fit in max_bytes
+            (over,) = connection.execute(
+                "SELECT COUNT(*) FROM (SELECT size, SUM(size) OVER "
+                "(ORDER BY accessed, key ROWS UNBOUNDED PRECEDING) AS freed "
+                "FROM responses) WHERE freed - size < ?",
+                (size - self.max_bytes,),
+            ).fetchone()
+            count = max(count, over)
+        if count:
+            self.evictions += connection.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed, key LIMIT ?)",
+                (count,),
+            ).rowcount
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(key, default=str)
+
+    def __repr__(self) -> str:
+        return (
+            f"SQLiteResponseCache(path={self.path!r}, ttls={self.ttls}, "
+            f"default_ttl={self.default_ttl}, max_entries={self.max_entries}, "
+            f"max_bytes={self.max_bytes})"
+        )
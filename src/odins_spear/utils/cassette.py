@@ -0,0 +1,260 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Optional, Tuple
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    ReadTimeout,
+    Request,
+    Response,
+)
+
+from ..exceptions import OSCassetteMissError
+from .formatters import sanitise_data
+
+# response headers worth replaying, the rest e.g. dates and cookies only bloat cassettes
+KEPT_HEADERS = ("content-type", "retry-after")
+
+
+def interaction_key(method: str, url, body: bytes) -> Tuple[str, str, Optional[str]]:
+    """Key matching a replayed request to a recorded one. The host is left out so a
+    cassette replays against any base_url, query parameters are order independent and
+    bodies are compared by hash so passwords are never written to the cassette."""
+
+    query = "&".join(sorted(url.query.decode().split("&"))) if url.query else ""
+    path = url.path + (f"?{query}" if query else "")
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else None
+    return method, path, digest
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class RecordingTransport(AsyncBaseTransport):
+    """Sends requests through another transport and appends each request/ response pair
+    to a cassette, a JSON lines file (gzipped if the path ends in .gz).
+
+    Tokens and passwords in response bodies are masked as in the logs and request
+    bodies are only stored as a hash, the cassette is still best kept out of version
+    control when recorded against production. Only KEPT_HEADERS are recorded, callers
+    get every header of the live response.
+
+    The cassette stays open while recording and is written from a thread so the event
+    loop never waits on the disk, aclose() (called by API.aclose()) finishes the file.
+
+    Example:
+        API(..., transport=RecordingTransport("group_audit.jsonl.gz"))
+
+    Args:
+        path (str): Cassette file appended to.
+        transport (AsyncBaseTransport, optional): Transport the requests are sent with.
+            Defaults to a new AsyncHTTPTransport.
+    """
+
+    def __init__(
+        self, path: str, transport: Optional[AsyncBaseTransport] = None
+    ) -> None:
+        self.path = path
+        self.transport = transport or AsyncHTTPTransport()
+        self.recorded = 0
+        self._cassette = None
+        # writes run in threads, one at a time
+        self._lock = threading.Lock()
+
+    async def handle_async_request(self, request: Request) -> Response:
+        body = await request.aread()
+        start = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        try:
+            raw = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        elapsed = time.monotonic() - start
+
+        # decoded for the cassette, the caller gets it encoded as sent and decodes it
+        content = Response(
+            response.status_code, headers=response.headers, content=raw
+        ).read()
+
+        interaction = {
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in KEPT_HEADERS
+                if name in response.headers
+            },
+            "elapsed": round(elapsed, 4),
+        }
+        method, url, digest = interaction_key(request.method, request.url, body)
+        await asyncio.to_thread(
+            self._record,
+            {"method": method, "url": url, "body": digest, **interaction},
+            content,
+        )
+        return Response(
+            response.status_code,
+            headers=response.headers,
+            content=raw,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    def _record(self, interaction: dict, content: bytes) -> None:
+        interaction["content"] = self._mask(content)
+        line = json.dumps(interaction, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._cassette is None:
+                self._cassette = _open(self.path, "a")
+            self._cassette.write(line)
+            self.recorded += 1
+
+    def close(self) -> None:
+        """Finishes and closes the cassette, a later recording appends to it."""
+        with self._lock:
+            if self._cassette is not None:
+                self._cassette.close()
+                self._cassette = None
+
+    @staticmethod
+    def _mask(content: bytes) -> str:
+        text = content.decode("utf-8", errors="replace")
+        try:
+            body = json.loads(text)
+        except ValueError:
+            return text
+        if isinstance(body, dict):
+            return json.dumps(sanitise_data(body), separators=(",", ":"))
+        return text
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+        await asyncio.to_thread(self.close)
+
+    def __repr__(self) -> str:
+        return f"RecordingTransport(path={self.path!r}, recorded={self.recorded})"
+
+
+class ReplayTransport(AsyncBaseTransport):
+    """Answers requests from a cassette recorded by RecordingTransport, no network needed.
+
+    A request recorded more than once is answered with each recording in turn, the last
+    one repeating. Latency and failures are simulated from a seeded random generator so
+    runs are repeatable.
+
+    Example:
+        API(..., transport=ReplayTransport("group_audit.jsonl.gz", error_rate=0.01))
+
+    Args:
+        path (str): Cassette file to replay.
+        latency_scale (float, optional): Multiplier of each recorded response time, 0 answers
+            instantly. Defaults to 1.0.
+        latency (float, optional): Extra seconds added to every response. Defaults to 0.0.
+        jitter (float, optional): Random extra seconds up to this added to every response. Defaults to 0.0.
+        error_rate (float, optional): Share of requests answered with one of error_statuses. Defaults to 0.0.
+        error_statuses (tuple, optional): Statuses injected errors use. Defaults to (503,).
+        timeout_rate (float, optional): Share of requests failing with httpx.ReadTimeout. Defaults to 0.0.
+        match_body (bool, optional): Match request bodies too, not just method and URL. Defaults to True.
+        seed (int, optional): Seed of the latency and error generator. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        latency_scale: float = 1.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Tuple[int, ...] = (503,),
+        timeout_rate: float = 0.0,
+        match_body: bool = True,
+        seed: int = 0,
+    ) -> None:
+        self.path = path
+        self.latency_scale = latency_scale
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.timeout_rate = timeout_rate
+        self.match_body = match_body
+        self.seed = seed
+
+        self._interactions = defaultdict(list)
+        with _open(path, "r") as cassette:
+            for line in cassette:
+                if line.strip():
+                    interaction = json.loads(line)
+                    self._interactions[self._key(interaction)].append(interaction)
+        self.reset()
+
+    def reset(self) -> None:
+        """Starts replaying from the first recording again with the generator re-seeded."""
+        self._random = random.Random(self.seed)
+        self._played = defaultdict(int)
+        self.replayed = 0
+        self.injected_errors = 0
+
+    async def handle_async_request(self, request: Request) -> Response:
+        body = await request.aread()
+        method, url, digest = interaction_key(request.method, request.url, body)
+        key = (method, url, digest if self.match_body else None)
+        recordings = self._interactions.get(key)
+        if not recordings:
+            raise OSCassetteMissError(method, url)
+
+        index = min(self._played[key], len(recordings) - 1)
+        self._played[key] += 1
+        interaction = recordings[index]
+
+        # draw in a fixed order so runs with the same seed behave identically
+        roll = self._random.random()
+        delay = (
+            interaction["elapsed"] * self.latency_scale
+            + self.latency
+            + self._random.uniform(0, self.jitter)
+        )
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        self.replayed += 1
+        if roll < self.timeout_rate:
+            self.injected_errors += 1
+            raise ReadTimeout("Injected timeout", request=request)
+        if roll < self.timeout_rate + self.error_rate:
+            self.injected_errors += 1
+            status = self._random.choice(self.error_statuses)
+            return Response(
+                status,
+                json={"details": "Injected error", "status": status, "error": ""},
+                request=request,
+            )
+
+        return Response(
+            interaction["status"],
+            headers=interaction["headers"],
+            content=interaction["content"].encode(),
+            request=request,
+        )
+
+    def _key(self, interaction: dict) -> tuple:
+        return (
+            interaction["method"],
+            interaction["url"],
+            interaction["body"] if self.match_body else None,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ReplayTransport(path={self.path!r}, interactions={len(self._interactions)}, "
+            f"error_rate={self.error_rate}, timeout_rate={self.timeout_rate})"
+        )
@@ -0,0 +1,164 @@
+import time
+from typing import FrozenSet, List, Optional
+
+from ..exceptions import OSCircuitOpenError
+from .helpers import match_endpoint_prefix, normalise_endpoint_prefix
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops sending requests to an endpoint that keeps failing.
+
+    Each endpoint path has its own circuit. After failure_threshold failures in a row
+    (transport errors, timeouts or a status in failure_statuses) the circuit opens and
+    requests to it fail fast with OSCircuitOpenError instead of waiting on Odin. After
+    recovery_timeout seconds up to half_open_max_calls trial requests are let through,
+    success_threshold successes close the circuit, a failure opens it again.
+
+    Args:
+        failure_threshold (int, optional): Failures in a row that open a circuit. Defaults to 5.
+        recovery_timeout (float, optional): Seconds a circuit stays open before trial requests. Defaults to 30.0.
+        half_open_max_calls (int, optional): Trial requests in flight while half open. Defaults to 1.
+        success_threshold (int, optional): Successful trials needed to close a circuit. Defaults to 1.
+        failure_statuses (frozenset, optional): Status codes counted as failures. Defaults to 500, 502, 503, 504.
+        endpoints (list, optional): Prefixes sharing one circuit e.g. ["/groups/call-centers/*"],
+            other endpoints get a circuit per path. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        failure_statuses: FrozenSet[int] = frozenset({500, 502, 503, 504}),
+        endpoints: Optional[List[str]] = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.failure_statuses = failure_statuses
+        self.endpoints = [
+            normalise_endpoint_prefix(prefix) for prefix in endpoints or []
+        ]
+
+        self.rejected = 0
+        # circuit: {"state", "failures", "successes", "opened_at", "trials", "opened"}
+        self._circuits = {}
+
+    def circuit_for(self, endpoint: str) -> str:
+        """Returns the circuit endpoint belongs to, its prefix or its own path."""
+        return match_endpoint_prefix(endpoint, self.endpoints) or endpoint.rstrip("?")
+
+    def state(self, endpoint: str) -> str:
+        """Current state of the circuit for endpoint: closed, open or half_open."""
+        circuit = self._circuits.get(self.circuit_for(endpoint))
+        return circuit["state"] if circuit else CLOSED
+
+    def before_request(self, endpoint: str) -> None:
+        """Checks a request to endpoint may be sent, taking a trial slot if half open.
+
+        Raises:
+            OSCircuitOpenError: Raised if the circuit is open or its trial slots are taken.
+        """
+
+        name = self.circuit_for(endpoint)
+        circuit = self._circuits.get(name)
+        if circuit is None or circuit["state"] == CLOSED:
+            return
+
+        if circuit["state"] == OPEN:
+            remaining = circuit["opened_at"] + self.recovery_timeout - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise OSCircuitOpenError(name, remaining)
+            circuit["state"] = HALF_OPEN
+            circuit["successes"] = 0
+            circuit["trials"] = 0
+
+        if circuit["trials"] >= self.half_open_max_calls:
+            self.rejected += 1
+            raise OSCircuitOpenError(name, 0.0)
+        circuit["trials"] += 1
+
+    def record_response(self, endpoint: str, status_code: int) -> None:
+        """Records the response to a request let through by before_request()."""
+        if status_code in self.failure_statuses:
+            self.record_failure(endpoint)
+        else:
+            self.record_success(endpoint)
+
+    def record_success(self, endpoint: str) -> None:
+        circuit = self._circuits.get(self.circuit_for(endpoint))
+        if circuit is None:
+            return
+
+        if circuit["state"] == HALF_OPEN:
+            self._end_trial(circuit)
+            circuit["successes"] += 1
+            if circuit["successes"] >= self.success_threshold:
+                circuit["state"] = CLOSED
+                circuit["failures"] = 0
+        else:
+            circuit["failures"] = 0
+
+    def record_failure(self, endpoint: str) -> None:
+        name = self.circuit_for(endpoint)
+        circuit = self._circuits.setdefault(
+            name,
+            {
+                "state": CLOSED,
+                "failures": 0,
+                "successes": 0,
+                "opened_at": 0.0,
+                "trials": 0,
+                "opened": 0,
+            },
+        )
+
+        if circuit["state"] == HALF_OPEN:
+            self._end_trial(circuit)
+            self._open(circuit)
+        elif circuit["state"] == CLOSED:
+            circuit["failures"] += 1
+            if circuit["failures"] >= self.failure_threshold:
+                self._open(circuit)
+
+    def record_cancelled(self, endpoint: str) -> None:
+        """Frees the trial slot of a request cancelled before it was answered."""
+        circuit = self._circuits.get(self.circuit_for(endpoint))
+        if circuit is not None and circuit["state"] == HALF_OPEN:
+            self._end_trial(circuit)
+
+    def metrics(self) -> dict:
+        """Snapshot of requests rejected and the state of every circuit that has failed."""
+        return {
+            "rejected": self.rejected,
+            "circuits": {
+                name: {
+                    "state": circuit["state"],
+                    "failures": circuit["failures"],
+                    "opened": circuit["opened"],
+                }
+                for name, circuit in self._circuits.items()
+            },
+        }
+
+    def _end_trial(self, circuit: dict) -> None:
+        # requests sent before the circuit opened can answer while it is half open
+        circuit["trials"] = max(0, circuit["trials"] - 1)
+
+    def _open(self, circuit: dict) -> None:
+        circuit["state"] = OPEN
+        circuit["opened_at"] = time.monotonic()
+        circuit["opened"] += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"CircuitBreaker(failure_threshold={self.failure_threshold}, "
+            f"recovery_timeout={self.recovery_timeout}, endpoints={self.endpoints})"
+        )
@@ -0,0 +1,69 @@
+import importlib.util
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """Encodes request bodies and decodes response bodies.
+
+    Requester encodes each request body and decodes each response body once with the
+    codec, large payloads e.g. get_users(extended=True) spend most of their CPU here.
+
+    Args:
+        name (str): Backend name e.g. orjson
+        dumps (Callable): Encodes an object to UTF-8 JSON bytes.
+        loads (Callable): Decodes JSON bytes or str to an object.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+
+def get_codec(backend: str = "auto") -> JSONCodec:
+    """Builds a codec for the backend given.
+
+    Args:
+        backend (str, optional): orjson, msgspec, json or auto for the fastest installed,
+            json (stdlib) is always available. Defaults to "auto".
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend is not installed.
+
+    Returns:
+        JSONCodec: Codec using the backend.
+    """
+
+    if backend == "auto":
+        backend = next(
+            name for name in BACKENDS if importlib.util.find_spec(name) is not None
+        )
+
+    if backend == "orjson":
+        import orjson
+
+        def dumps(obj):
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+        return JSONCodec(name="orjson", dumps=dumps, loads=orjson.loads)
+
+    if backend == "msgspec":
+        import msgspec
+
+        return JSONCodec(
+            name="msgspec", dumps=msgspec.json.encode, loads=msgspec.json.decode
+        )
+
+    if backend == "json":
+
+        def dumps(obj):
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+        return JSONCodec(name="json", dumps=dumps, loads=json.loads)
+
+    raise ValueError(f"Unknown JSON backend '{backend}', expected one of {BACKENDS}")
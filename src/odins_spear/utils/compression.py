@@ -0,0 +1,99 @@
+import gzip
+import importlib.util
+from typing import List, Optional
+
+from .helpers import match_endpoint_prefix, normalise_endpoint_prefix
+
+# response encodings httpx decodes and the packages it needs for them
+DECODERS = {
+    "gzip": (),
+    "deflate": (),
+    "br": ("brotli", "brotlicffi"),
+    "zstd": ("zstandard",),
+}
+
+
+def supported_encodings() -> str:
+    """Accept-Encoding listing every response encoding the installed packages decode,
+    brotli and zstd need odins-spear[compression] installed."""
+
+    return ", ".join(
+        encoding
+        for encoding, packages in DECODERS.items()
+        if not packages
+        or any(importlib.util.find_spec(package) is not None for package in packages)
+    )
+
+
+class CompressionPolicy:
+    """Controls compression between Requester and Odin.
+
+    Responses are always negotiated with Accept-Encoding and decoded transparently.
+    Request bodies are only gzipped when enabled, for servers accepting
+    Content-Encoding: gzip. If the server answers 415 the body is resent uncompressed
+    and compression stays off for that endpoint.
+
+    Args:
+        accept_encoding (str, optional): Accept-Encoding sent, "identity" asks for
+            uncompressed responses. Defaults to every encoding installed packages decode.
+        compress_requests (bool, optional): Gzip request bodies. Defaults to False.
+        endpoints (list, optional): Endpoint prefixes whose bodies are compressed e.g.
+            ["/users/bulk", "/groups/dns/assign/bulk"], None compresses every body.
+            Defaults to None.
+        min_size (int, optional): Bodies smaller than this many bytes are sent as is,
+            compressing them costs more than it saves. Defaults to 1024.
+        level (int, optional): Gzip level, 1 (fastest) to 9 (smallest). Defaults to 6.
+    """
+
+    def __init__(
+        self,
+        accept_encoding: Optional[str] = None,
+        compress_requests: bool = False,
+        endpoints: Optional[List[str]] = None,
+        min_size: int = 1024,
+        level: int = 6,
+    ) -> None:
+        if not 1 <= level <= 9:
+            raise ValueError("level must be between 1 and 9.")
+
+        self.accept_encoding = (
+            accept_encoding if accept_encoding is not None else supported_encodings()
+        )
+        self.compress_requests = compress_requests
+        self.endpoints = (
+            [normalise_endpoint_prefix(prefix) for prefix in endpoints]
+            if endpoints is not None
+            else None
+        )
+        self.min_size = min_size
+        self.level = level
+
+        self.compressed = 0
+        self._rejected = set()
+
+    def should_compress(self, endpoint: str, size: int) -> bool:
+        """Checks if a body of size bytes sent to endpoint is gzipped."""
+        if not self.compress_requests or size < self.min_size:
+            return False
+        endpoint = endpoint.rstrip("?")
+        if endpoint in self._rejected:
+            return False
+        return (
+            self.endpoints is None
+            or match_endpoint_prefix(endpoint, self.endpoints) is not None
+        )
+
+    def compress(self, body: bytes) -> bytes:
+        self.compressed += 1
+        # fixed mtime so identical bodies compress identically
+        return gzip.compress(body, compresslevel=self.level, mtime=0)
+
+    def reject(self, endpoint: str) -> None:
+        """Stops compressing bodies sent to endpoint, called when it answers 415."""
+        self._rejected.add(endpoint.rstrip("?"))
+
+    def __repr__(self) -> str:
+        return (
+            f"CompressionPolicy(accept_encoding={self.accept_encoding!r}, "
+            f"compress_requests={self.compress_requests}, min_size={self.min_size})"
+        )
@@ -0,0 +1,99 @@
+import importlib.util
+import logging
+import socket
+from dataclasses import dataclass
+from typing import Optional
+
+from httpx import AsyncBaseTransport, AsyncClient, AsyncHTTPTransport, Limits, Timeout
+
+
+@dataclass(kw_only=True)
+class ConnectionConfig:
+    """Settings for the AsyncClient shared by every request sent to Odin.
+
+    Connections are pooled and kept alive between requests so bulk jobs do not pay for a
+    TCP and TLS handshake per call.
+
+    Args:
+        max_connections (int, optional): Max open connections in the pool. Defaults to 100.
+        max_keepalive_connections (int, optional): Max idle connections kept open. Defaults to 20.
+        keepalive_expiry (float, optional): Seconds an idle connection is kept open. Defaults to 30.0.
+        http2 (bool, optional): Negotiate HTTP/2, needs the 'h2' package. Defaults to False.
+        connect_timeout (float, optional): Seconds to establish a connection. Defaults to 5.0.
+        read_timeout (float, optional): Seconds to wait for response data. Defaults to 30.0.
+        write_timeout (float, optional): Seconds to wait sending request data. Defaults to 30.0.
+        pool_timeout (float, optional): Seconds to wait for a free connection. Defaults to 30.0.
+        tcp_keepalive (bool, optional): Enable TCP keep-alive probes on sockets. Defaults to True.
+        transport (AsyncBaseTransport, optional): Sends requests instead of a pooled
+            transport built from the settings above e.g. a ReplayTransport. Defaults to None.
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 30.0
+    http2: bool = False
+    connect_timeout: Optional[float] = 5.0
+    read_timeout: Optional[float] = 30.0
+    write_timeout: Optional[float] = 30.0
+    pool_timeout: Optional[float] = 30.0
+    tcp_keepalive: bool = True
+    transport: Optional[AsyncBaseTransport] = None
+
+    def build_client(self, logger: Optional[logging.Logger] = None) -> AsyncClient:
+        """Builds a new AsyncClient from the settings. No connections are opened until
+        the first request is sent.
+
+        Args:
+            logger (logging.Logger, optional): Used to warn if HTTP/2 is unavailable. Defaults to None.
+
+        Returns:
+            AsyncClient: Client with a pooled transport.
+        """
+
+        if self.transport is not None:
+            return AsyncClient(transport=self.transport, timeout=self._timeout())
+
+        http2 = self.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            if logger:
+                logger.warning(
+                    "HTTP/2 requested but 'h2' is not installed, falling back to HTTP/1.1. "
+                    "Install with: pip install odins-spear[http2]"
+                )
+            http2 = False
+
+        transport = AsyncHTTPTransport(
+            http2=http2,
+            limits=Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            socket_options=self._socket_options(),
+        )
+
+        return AsyncClient(transport=transport, timeout=self._timeout())
+
+    def _timeout(self) -> Timeout:
+        return Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def _socket_options(self) -> Optional[list]:
+        if not self.tcp_keepalive:
+            return None
+
+        options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        # probe idle connections after 60s, every 10s, drop after 5 missed probes
+        # not every platform exposes these e.g. macOS has no TCP_KEEPIDLE
+        for name, value in (
+            ("TCP_KEEPIDLE", 60),
+            ("TCP_KEEPINTVL", 10),
+            ("TCP_KEEPCNT", 5),
+        ):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
@@ -0,0 +1,129 @@
+from collections import deque
+from typing import List, Optional
+
+from .helpers import match_endpoint_prefix, normalise_endpoint_prefix
+
+
+class HedgePolicy:
+    """Controls when Requester hedges a slow GET with a duplicate request.
+
+    Once a GET has waited longer than the given percentile of recent latencies for its
+    endpoint a second identical request is sent and whichever answers first is used, the
+    other is cancelled. Every GET earns budget hedges and a hedge spends 1, so hedges
+    stay below that share of GETs and extra load on Odin is bounded. The duplicate needs
+    a scheduler slot of its own and is not sent if none is free.
+
+    Args:
+        percentile (float, optional): Percentile of recent latencies after which to hedge. Defaults to 95.0.
+        endpoints (list, optional): Endpoint prefixes to hedge e.g. ["/users/registration/bulk"],
+            None hedges every GET. Defaults to None.
+        budget (float, optional): Hedges allowed per GET sent. Defaults to 0.05.
+        budget_burst (float, optional): Max unspent hedges saved up. Defaults to 10.0.
+        min_samples (int, optional): Latencies recorded for an endpoint before its percentile
+            is trusted. Defaults to 20.
+        window (int, optional): Recent latencies kept per endpoint. Defaults to 200.
+        initial_delay (float, optional): Seconds to wait before hedging until min_samples
+            are recorded, None doesn't hedge until then. Defaults to None.
+        min_delay (float, optional): Never hedge sooner than this many seconds. Defaults to 0.05.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        endpoints: Optional[List[str]] = None,
+        budget: float = 0.05,
+        budget_burst: float = 10.0,
+        min_samples: int = 20,
+        window: int = 200,
+        initial_delay: Optional[float] = None,
+        min_delay: float = 0.05,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100.")
+
+        self.percentile = percentile
+        self.endpoints = (
+            [normalise_endpoint_prefix(prefix) for prefix in endpoints]
+            if endpoints is not None
+            else None
+        )
+        self.budget = budget
+        self.budget_burst = budget_burst
+        self.min_samples = min_samples
+        self.window = window
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+
+        self.credit = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.denied = 0
+        self.no_slot = 0
+        self._latencies = {}
+
+    def applies_to(self, endpoint: str) -> bool:
+        """Checks if GETs to endpoint are hedged."""
+        if self.endpoints is None:
+            return True
+        return match_endpoint_prefix(endpoint, self.endpoints) is not None
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait for a GET to endpoint before hedging, None to not hedge it.
+
+        Each call counts as a GET sent and earns budget towards future hedges.
+        """
+
+        self.requests += 1
+        self.credit = min(self.budget_burst, self.credit + self.budget)
+
+        latencies = self._latencies.get(endpoint.rstrip("?"))
+        if latencies is None or len(latencies) < self.min_samples:
+            return self.initial_delay
+
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Records how long a GET to endpoint took.
+
+        Args:
+            endpoint (str): Endpoint requested.
+            latency (float): Seconds taken to respond, for a cancelled request the
+                seconds it had waited so far.
+        """
+
+        endpoint = endpoint.rstrip("?")
+        if endpoint not in self._latencies:
+            self._latencies[endpoint] = deque(maxlen=self.window)
+        self._latencies[endpoint].append(latency)
+
+    def try_hedge(self) -> bool:
+        """Spends budget on a hedge, False if the budget is used up."""
+        if self.credit < 1:
+            self.denied += 1
+            return False
+        self.credit -= 1
+        self.hedges += 1
+        return True
+
+    def metrics(self) -> dict:
+        """Snapshot of hedges sent and how often they beat the original request."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "denied": self.denied,
+            "no_slot": self.no_slot,
+            "hedge_rate": round(self.hedges / self.requests, 4)
+            if self.requests
+            else 0.0,
+            "credit": round(self.credit, 3),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"HedgePolicy(percentile={self.percentile}, endpoints={self.endpoints}, "
+            f"budget={self.budget}, budget_burst={self.budget_burst})"
+        )
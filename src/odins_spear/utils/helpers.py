@@ -1,4 +1,7 @@
+import base64
+import json
 import re
+from typing import Optional
 
 
 def find_entity_with_number_type(
@@ -31,3 +34,84 @@ def find_entity_with_number_type(
             # issue when entity does not have a number, extenion, or alias assigned
             continue
     return None
+
+
+def normalise_endpoint_prefix(prefix: str) -> str:
+    """Strips a trailing wildcard and slash so '/users/*' and '/users' are the same prefix.
+
+    Args:
+        prefix (str): Endpoint prefix e.g. /groups/call-centers/*
+
+    Returns:
+        str: Normalised prefix e.g. /groups/call-centers
+    """
+    return prefix.rstrip("*").rstrip("/")
+
+
+def endpoint_under_prefix(endpoint: str, prefix: str) -> bool:
+    """Checks if endpoint is the prefix path itself or a path below it.
+
+    Args:
+        endpoint (str): Endpoint e.g. /groups/call-centers/agents
+        prefix (str): Normalised prefix e.g. /groups/call-centers
+
+    Returns:
+        bool: True for /groups/call-centers and /groups/call-centers/agents but not
+        /groups/call-centers-x
+    """
+    return endpoint.startswith(prefix) and endpoint[len(prefix) :][:1] in ("", "/", "?")
+
+
+def match_endpoint_prefix(endpoint: str, prefixes: list) -> Optional[str]:
+    """Finds the longest prefix endpoint falls under.
+
+    Args:
+        endpoint (str): Endpoint e.g. /groups/call-centers/agents
+        prefixes (list): Normalised prefixes to check.
+
+    Returns:
+        str: Longest matching prefix, None if there is no match.
+    """
+    for prefix in sorted(prefixes, key=len, reverse=True):
+        if endpoint_under_prefix(endpoint, prefix):
+            return prefix
+    return None
+
+
+def token_expiry(token: str) -> Optional[float]:
+    """Reads the expiry time from a JWT's 'exp' claim, the signature is not verified.
+
+    Args:
+        token (str): Bearer token returned by Odin.
+
+    Returns:
+        float: Unix time the token expires, None if the token is not a JWT with an expiry.
+    """
+    try:
+        return float(_token_claims(token)["exp"])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def token_subject(token: Optional[str]) -> Optional[str]:
+    """Reads the account a JWT was issued to from its 'sub' claim, the signature is not
+    verified.
+
+    Args:
+        token (str): Bearer token returned by Odin.
+
+    Returns:
+        str: Subject of the token, None if the token is not a JWT with a subject.
+    """
+    try:
+        return str(_token_claims(token)["sub"])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def _token_claims(token: str) -> dict:
+    try:
+        payload = token.split(".")[1]
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (AttributeError, IndexError, ValueError):
+        raise ValueError("Token is not a JWT.")
@@ -0,0 +1,199 @@
+import codecs
+import json
+import json.scanner
+import re
+from typing import Any, AsyncContextManager, Callable, List, Optional
+
+import httpx
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+
+class JSONArrayDecoder:
+    """Incrementally decodes the elements of a JSON array as bytes arrive.
+
+    Each element is decoded by the stdlib's C scanner as soon as the comma or bracket
+    after it arrives, so only the element being received is buffered. A body that is
+    not an array is buffered and decoded whole with loads on close().
+
+    Args:
+        loads (Callable, optional): Decodes a body that is not an array e.g.
+            JSONCodec.loads. Defaults to json.loads.
+    """
+
+    def __init__(self, loads: Callable[[str], Any] = json.loads) -> None:
+        self.loads = loads
+        # chunks can end part way through a multi-byte character
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        # the stdlib's C scanner, decodes one value starting at an index
+        self._scan = json.scanner.make_scanner(json.JSONDecoder())
+        self._buffer = ""
+        self._array = None
+        self._empty = True
+        self._done = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Adds the next bytes of the body.
+
+        Returns:
+            List: Elements completed by the chunk, in order.
+        """
+
+        self._buffer += self._text.decode(chunk)
+        if self._array is None:
+            stripped = self._buffer.lstrip(" \t\r\n")
+            if not stripped:
+                return []
+            self._array = stripped[0] == "["
+            if self._array:
+                self._buffer = stripped[1:]
+        if not self._array or self._done:
+            return []
+
+        items = []
+        buffer = self._buffer
+        pos = 0
+        size = len(buffer)
+        while True:
+            if pos < size and buffer[pos] in " \t\r\n":
+                pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= size:
+                break
+            if self._empty and buffer[pos] == "]":
+                self._done = True
+                pos += 1
+                break
+            try:
+                value, end = self._scan(buffer, pos)
+            except (StopIteration, ValueError):
+                # element not complete yet
+                break
+            # a number can be cut short e.g. 3. of 3.5, only take values followed by
+            # the comma or bracket ending them
+            if end < size and buffer[end] in " \t\r\n":
+                end = _WHITESPACE.match(buffer, end).end()
+            if end >= size or buffer[end] not in ",]":
+                break
+            items.append(value)
+            self._empty = False
+            pos = end + 1
+            if buffer[end] == "]":
+                self._done = True
+                break
+
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self) -> List[Any]:
+        """Ends the body.
+
+        Raises:
+            ValueError: If the body ended part way through the array.
+
+        Returns:
+            List: The decoded body if it was not an array, otherwise empty.
+        """
+
+        self._buffer += self._text.decode(b"", final=True)
+        if self._array:
+            if not self._done:
+                raise ValueError("JSON array ended before its closing bracket")
+            return []
+        if not self._buffer.strip():
+            raise ValueError("Empty JSON body")
+        return [self.loads(self._buffer)]
+
+
+class JSONArrayStream:
+    """Async iterator over the elements of a JSON array response, decoded as the body
+    downloads. Returned by Requester.get(..., stream=True).
+
+    The response is closed once iteration ends, use 'async with' or aclose() when
+    stopping early so the connection is returned to the pool.
+
+    Example:
+        async with await api.users.get_users(ent, extended=True, stream=True) as users:
+            async for user in users:
+                ...
+
+    Args:
+        response (httpx.Response): Response opened with stream=True.
+        loads (Callable): Decodes the body if it is not an array.
+        on_close (Callable, optional): Called with the body bytes decoded and the bytes
+            downloaded, before decompression, once the response is closed. Defaults to None.
+        context (AsyncContextManager, optional): Entered context exited once the response
+            is closed, with the error if reading the body failed e.g. the scheduler slot
+            held while the body downloads. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        loads: Callable[[str], Any],
+        on_close: Optional[Callable[[int, int], None]] = None,
+        context: Optional[AsyncContextManager] = None,
+    ) -> None:
+        self.response = response
+        self.loads = loads
+        self.on_close = on_close
+        self.context = context
+        self.items = 0
+        self.bytes_decoded = 0
+        self._closed = False
+        self._iterator = self._iterate()
+
+    def __aiter__(self) -> "JSONArrayStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self._iterator.__anext__()
+
+    async def _iterate(self):
+        decoder = JSONArrayDecoder(self.loads)
+        try:
+            async for chunk in self.response.aiter_bytes():
+                self.bytes_decoded += len(chunk)
+                for item in decoder.feed(chunk):
+                    self.items += 1
+                    yield item
+            for item in decoder.close():
+                self.items += 1
+                yield item
+        except GeneratorExit:
+            # stopped early by the caller, not a failure
+            raise
+        except BaseException as error:
+            await self._close(error)
+            raise
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the response, safe to call more than once."""
+        await self._close(None)
+
+    async def _close(self, error: Optional[BaseException]) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self.response.aclose()
+            if self.on_close is not None:
+                self.on_close(self.bytes_decoded, self.response.num_bytes_downloaded)
+        finally:
+            if self.context is not None:
+                await self.context.__aexit__(
+                    type(error) if error is not None else None,
+                    error,
+                    error.__traceback__ if error is not None else None,
+                )
+
+    async def __aenter__(self) -> "JSONArrayStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self._iterator.aclose()
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"JSONArrayStream(url={str(self.response.url)!r}, items={self.items})"
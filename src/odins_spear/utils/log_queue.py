@@ -0,0 +1,81 @@
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List
+
+# logger: [QueueHandler, QueueListener, LogQueues running], one queue per logger
+_queues: Dict[logging.Logger, List] = {}
+_lock = threading.Lock()
+
+
+class LogQueue:
+    """Moves a logger's handlers onto a background thread.
+
+    The logger's handlers are swapped for a single QueueHandler, records are put on a
+    queue and written by a QueueListener thread so slow handlers e.g. files or network
+    log shippers never block the event loop. Level checks still happen on the caller so
+    disabled records are never queued.
+
+    Several LogQueues of one logger e.g. a few APIs logging to "OS" share one queue,
+    the handlers are given back once the last of them stops.
+
+    Args:
+        logger (logging.Logger): Logger whose handlers are moved behind the queue.
+    """
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """Starts writing the logger's records from the background thread."""
+        with _lock:
+            if self.running:
+                return
+
+            shared = _queues.get(self.logger)
+            if shared is None:
+                handlers = list(self.logger.handlers)
+                log_queue = queue.SimpleQueue()
+                handler = QueueHandler(log_queue)
+                listener = QueueListener(
+                    log_queue, *handlers, respect_handler_level=True
+                )
+
+                for existing in handlers:
+                    self.logger.removeHandler(existing)
+                self.logger.addHandler(handler)
+                listener.start()
+                shared = _queues[self.logger] = [handler, listener, 0]
+
+            shared[2] += 1
+            self._running = True
+        # flush queued records if the program exits without stop() being called
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Writes any queued records and gives the handlers back to the logger once no
+        other LogQueue of the logger is running."""
+        with _lock:
+            if not self.running:
+                return
+
+            self._running = False
+            shared = _queues[self.logger]
+            shared[2] -= 1
+            if shared[2] == 0:
+                handler, listener, _ = _queues.pop(self.logger)
+                self.logger.removeHandler(handler)
+                listener.stop()
+                for existing in listener.handlers:
+                    self.logger.addHandler(existing)
+        atexit.unregister(self.stop)
+
+    def __repr__(self) -> str:
+        return f"LogQueue(logger={self.logger.name!r}, running={self.running})"
@@ -0,0 +1,311 @@
+import bisect
+import math
+from collections import Counter
+from typing import Optional, Tuple
+
+# seconds, the last bucket catches everything slower
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    math.inf,
+)
+
+# body sizes counted per endpoint, before compression and on the wire
+BYTE_COUNTS = ("bytes_out", "bytes_in", "wire_bytes_out", "wire_bytes_in")
+
+
+class Histogram:
+    """Fixed bucket histogram of durations, quantiles are estimated by interpolating
+    within the bucket they fall in as Prometheus' histogram_quantile() does.
+
+    Args:
+        buckets (tuple, optional): Ascending bucket upper bounds in seconds, ending in
+            math.inf. Defaults to DEFAULT_BUCKETS.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimated value below which q (0-1) of observations fall, None if empty."""
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                if math.isinf(upper):
+                    return lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return None
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": _round(self.quantile(0.5)),
+            "p95": _round(self.quantile(0.95)),
+            "p99": _round(self.quantile(0.99)),
+        }
+
+
+class MetricsCollector:
+    """Collects per endpoint request counts, status codes, bytes sent and received and
+    latency histograms, plus time requests spent queued in the scheduler and waiting on
+    the rate limiter.
+
+    Bytes are counted twice, bytes_* are body sizes before compression and wire_bytes_*
+    what was actually sent or downloaded, the difference is the bandwidth saved.
+
+    Every request sent to Odin is recorded, including retries and hedges. Export with
+    to_dict() or to_prometheus() to find hot or slow endpoints and tune concurrency.
+
+    Args:
+        buckets (tuple, optional): Histogram bucket upper bounds in seconds. Defaults to
+            DEFAULT_BUCKETS.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears everything collected so far."""
+        # (method, endpoint): stats
+        self._endpoints = {}
+        self._waits = {
+            "scheduler": Histogram(self.buckets),
+            "rate_limit": Histogram(self.buckets),
+        }
+
+    def record_response(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: int,
+        latency: float,
+        bytes_out: int,
+        bytes_in: int,
+        wire_bytes_out: Optional[int] = None,
+        wire_bytes_in: Optional[int] = None,
+    ) -> None:
+        """Records a response received from Odin.
+
+        Args:
+            method (str): HTTP method e.g. GET
+            endpoint (str): Endpoint requested.
+            status_code (int): Response status code.
+            latency (float): Seconds from sending the request to receiving the response.
+            bytes_out (int): Request body size before compression.
+            bytes_in (int): Response body size after decompression.
+            wire_bytes_out (int, optional): Request body size as sent. Defaults to bytes_out.
+            wire_bytes_in (int, optional): Response body size as downloaded. Defaults to bytes_in.
+        """
+
+        stats = self._stats(method, endpoint)
+        stats["requests"] += 1
+        stats["statuses"][status_code] += 1
+        self._add_bytes(stats, bytes_out, bytes_in, wire_bytes_out, wire_bytes_in)
+        stats["latency"].observe(latency)
+
+    def record_error(
+        self,
+        method: str,
+        endpoint: str,
+        latency: float,
+        bytes_out: int,
+        wire_bytes_out: Optional[int] = None,
+    ) -> None:
+        """Records a request that failed without a response e.g. a timeout."""
+        stats = self._stats(method, endpoint)
+        stats["requests"] += 1
+        stats["errors"] += 1
+        self._add_bytes(stats, bytes_out, 0, wire_bytes_out, 0)
+        stats["latency"].observe(latency)
+
+    def record_stream(
+        self,
+        method: str,
+        endpoint: str,
+        bytes_in: int,
+        wire_bytes_in: Optional[int] = None,
+    ) -> None:
+        """Adds the body size of a streamed response, known once it has been read as
+        record_response() is called when its headers arrive."""
+        stats = self._stats(method, endpoint)
+        self._add_bytes(stats, 0, bytes_in, 0, wire_bytes_in)
+
+    def record_wait(self, kind: str, seconds: float) -> None:
+        """Records time a request waited before being sent.
+
+        Args:
+            kind (str): scheduler or rate_limit
+            seconds (float): Seconds waited.
+        """
+        self._waits[kind].observe(seconds)
+
+    def to_dict(self) -> dict:
+        """Snapshot of everything collected.
+
+        Returns:
+            Dict: Totals, wait histograms and a breakdown per "METHOD endpoint".
+        """
+
+        endpoints = {
+            f"{method} {endpoint}": {
+                "requests": stats["requests"],
+                "errors": stats["errors"],
+                "statuses": dict(stats["statuses"]),
+                **{key: stats[key] for key in BYTE_COUNTS},
+                "latency": stats["latency"].to_dict(),
+            }
+            for (method, endpoint), stats in sorted(self._endpoints.items())
+        }
+        totals = {
+            key: sum(stats[key] for stats in self._endpoints.values())
+            for key in ("requests", "errors", *BYTE_COUNTS)
+        }
+        return {
+            **totals,
+            "bytes_saved": totals["bytes_out"]
+            + totals["bytes_in"]
+            - totals["wire_bytes_out"]
+            - totals["wire_bytes_in"],
+            "waits": {kind: hist.to_dict() for kind, hist in self._waits.items()},
+            "endpoints": endpoints,
+        }
+
+    def to_prometheus(self, namespace: str = "odins_spear") -> str:
+        """Renders the metrics in the Prometheus text exposition format.
+
+        Args:
+            namespace (str, optional): Prefix of every metric name. Defaults to "odins_spear".
+
+        Returns:
+            str: Metrics text e.g. served from a /metrics endpoint or written for node_exporter.
+        """
+
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.append(f"# HELP {namespace}_{name} {help_text}")
+            lines.append(f"# TYPE {namespace}_{name} {kind}")
+
+        items = sorted(self._endpoints.items())
+
+        metric("requests_total", "counter", "Responses received by status code.")
+        for (method, endpoint), stats in items:
+            for status, count in sorted(stats["statuses"].items()):
+                labels = _labels(method=method, endpoint=endpoint, status=status)
+                lines.append(f"{namespace}_requests_total{{{labels}}} {count}")
+
+        metric("request_errors_total", "counter", "Requests failed without a response.")
+        for (method, endpoint), stats in items:
+            labels = _labels(method=method, endpoint=endpoint)
+            lines.append(
+                f"{namespace}_request_errors_total{{{labels}}} {stats['errors']}"
+            )
+
+        for key in BYTE_COUNTS:
+            sent = "sent" if key.endswith("out") else "received"
+            metric(
+                f"{key}_total",
+                "counter",
+                f"Body bytes {sent} on the wire."
+                if key.startswith("wire")
+                else f"Body bytes {sent}, uncompressed.",
+            )
+            for (method, endpoint), stats in items:
+                labels = _labels(method=method, endpoint=endpoint)
+                lines.append(f"{namespace}_{key}_total{{{labels}}} {stats[key]}")
+
+        metric("request_duration_seconds", "histogram", "Request latency.")
+        for (method, endpoint), stats in items:
+            lines.extend(
+                _histogram_lines(
+                    f"{namespace}_request_duration_seconds",
+                    stats["latency"],
+                    _labels(method=method, endpoint=endpoint),
+                )
+            )
+
+        metric("wait_seconds", "histogram", "Time waiting before a request is sent.")
+        for kind, hist in self._waits.items():
+            lines.extend(
+                _histogram_lines(f"{namespace}_wait_seconds", hist, _labels(kind=kind))
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def _stats(self, method: str, endpoint: str) -> dict:
+        key = (method, endpoint.rstrip("?"))
+        if key not in self._endpoints:
+            self._endpoints[key] = {
+                "requests": 0,
+                "errors": 0,
+                "statuses": Counter(),
+                **dict.fromkeys(BYTE_COUNTS, 0),
+                "latency": Histogram(self.buckets),
+            }
+        return self._endpoints[key]
+
+    @staticmethod
+    def _add_bytes(stats, bytes_out, bytes_in, wire_bytes_out, wire_bytes_in) -> None:
+        stats["bytes_out"] += bytes_out
+        stats["bytes_in"] += bytes_in
+        stats["wire_bytes_out"] += (
+            wire_bytes_out if wire_bytes_out is not None else bytes_out
+        )
+        stats["wire_bytes_in"] += (
+            wire_bytes_in if wire_bytes_in is not None else bytes_in
+        )
+
+    def __repr__(self) -> str:
+        return f"MetricsCollector(endpoints={len(self._endpoints)})"
+
+
+def _histogram_lines(name: str, hist: Histogram, labels: str) -> list:
+    lines = []
+    cumulative = 0
+    for bound, count in zip(hist.buckets, hist.counts):
+        cumulative += count
+        le = "+Inf" if math.isinf(bound) else repr(bound)
+        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {hist.sum}")
+    lines.append(f"{name}_count{{{labels}}} {hist.count}")
+    return lines
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 6) if value is not None else None
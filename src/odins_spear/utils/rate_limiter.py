@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Optional
+
+
+class TokenBucket:
+    """Asyncio native token bucket used to shape the rate requests are sent to Odin.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each request consumes
+    one token, when the bucket is empty callers wait with asyncio.sleep() so the event
+    loop is never blocked. Waiters are served in the order they arrived.
+
+    Args:
+        rate (float): Tokens added to the bucket per second e.g. 5 is 5 requests/second.
+        burst (int): Max tokens the bucket can hold i.e. requests allowed back to back.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: int = 5) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be above 0 and burst must be at least 1.")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = None
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available in the bucket."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self) -> float:
+        """Waits until a token is available and consumes it.
+
+        Returns:
+            Float: Seconds spent waiting for the token.
+        """
+
+        # created lazily so the lock binds to the loop that actually runs the requests
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return time.monotonic() - start
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def update(self, rate: Optional[float] = None, burst: Optional[int] = None) -> None:
+        """Changes the rate and/ or burst of the bucket without dropping waiters.
+
+        Args:
+            rate (float, optional): New tokens per second. Defaults to None.
+            burst (int, optional): New max tokens. Defaults to None.
+        """
+
+        self._refill()
+        if rate is not None:
+            if rate <= 0:
+                raise ValueError("rate must be above 0.")
+            self.rate = rate
+        if burst is not None:
+            if burst < 1:
+                raise ValueError("burst must be at least 1.")
+            self.burst = burst
+            self._tokens = min(self._tokens, burst)
+
+    def record(self, status_code: Optional[int], latency: float) -> None:
+        """Feedback on a completed request, a fixed bucket ignores it.
+
+        Args:
+            status_code (int): Status code returned, None if the request raised an error.
+            latency (float): Seconds the request took.
+        """
+
+    def metrics(self) -> dict:
+        """Snapshot of the current rate and tokens available."""
+        return {"rate": self.rate, "burst": self.burst, "tokens": self.tokens}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rate={self.rate}, burst={self.burst})"
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """Token bucket that tunes its own rate from Odin's responses (AIMD).
+
+    Every `window` healthy responses the rate is raised by `increase_step`. A 429/ 503,
+    a timeout or a p95 latency spike over the window cuts the rate by `decrease_factor`.
+    Cuts are spaced at least `cooldown` seconds apart so a burst of concurrent 429s
+    only backs off once. The rate always stays between min_rate and max_rate.
+
+    Args:
+        rate (float): Starting requests per second.
+        burst (int): Max requests allowed back to back.
+        min_rate (float, optional): Lowest rate allowed. Defaults to 1.0.
+        max_rate (float, optional): Highest rate allowed. Defaults to 50.0.
+        increase_step (float, optional): Requests per second added per healthy window. Defaults to 1.0.
+        decrease_factor (float, optional): Rate is multiplied by this on overload. Defaults to 0.5.
+        window (int, optional): Responses per latency evaluation. Defaults to 20.
+        latency_threshold (float, optional): p95 latency in seconds counted as a spike. If None
+            a spike is a p95 above latency_tolerance x the lowest p95 seen. Defaults to None.
+        latency_tolerance (float, optional): Multiplier used when latency_threshold is None. Defaults to 2.0.
+        cooldown (float, optional): Min seconds between rate cuts. Defaults to 1.0.
+        logger (logging.Logger, optional): Logs rate changes. Defaults to None.
+    """
+
+    backoff_statuses = frozenset({429, 503})
+
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: int = 5,
+        min_rate: float = 1.0,
+        max_rate: float = 50.0,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        window: int = 20,
+        latency_threshold: Optional[float] = None,
+        latency_tolerance: float = 2.0,
+        cooldown: float = 1.0,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        if not 0 < min_rate <= max_rate:
+            raise ValueError("min_rate must be above 0 and no higher than max_rate.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1.")
+
+        super().__init__(min(max(rate, min_rate), max_rate), burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.window = window
+        self.latency_threshold = latency_threshold
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.logger = logger
+
+        self.baseline_p95 = None
+        self.last_p95 = None
+        self.increases = 0
+        self.decreases = 0
+        self._latencies = deque(maxlen=window)
+        self._last_decrease = -math.inf
+
+    def record(self, status_code: Optional[int], latency: float) -> None:
+        """Adjusts the rate from a completed request.
+
+        Args:
+            status_code (int): Status code returned, None if the request raised an error.
+            latency (float): Seconds the request took.
+        """
+
+        if status_code is None or status_code in self.backoff_statuses:
+            self._decrease(f"status_code: {status_code}")
+            return
+
+        self._latencies.append(latency)
+        if len(self._latencies) < self.window:
+            return
+
+        p95 = self._p95()
+        self.last_p95 = p95
+        self._latencies.clear()
+
+        if self.baseline_p95 is None or p95 < self.baseline_p95:
+            self.baseline_p95 = p95
+
+        threshold = self.latency_threshold
+        if threshold is None:
+            threshold = self.baseline_p95 * self.latency_tolerance
+
+        if p95 > threshold:
+            self._decrease(f"p95 latency {p95:.3f}s over {threshold:.3f}s")
+        else:
+            self._increase()
+
+    def metrics(self) -> dict:
+        """Snapshot of the current rate and the signals driving it."""
+        return {
+            **super().metrics(),
+            "min_rate": self.min_rate,
+            "max_rate": self.max_rate,
+            "p95": self.last_p95,
+            "baseline_p95": self.baseline_p95,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+    def _increase(self) -> None:
+        rate = min(self.max_rate, self.rate + self.increase_step)
+        if rate != self.rate:
+            self.update(rate=rate)
+            self.increases += 1
+            self._log(f"Adaptive rate limit raised to {rate:.2f}/s")
+
+    def _decrease(self, reason: str) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+
+        self._last_decrease = now
+        self._latencies.clear()
+        rate = max(self.min_rate, self.rate * self.decrease_factor)
+        if rate != self.rate:
+            self.update(rate=rate)
+            self.decreases += 1
+            self._log(f"Adaptive rate limit lowered to {rate:.2f}/s, reason: {reason}")
+
+    def _p95(self) -> float:
+        latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, math.ceil(0.95 * len(latencies)) - 1)]
+
+    def _log(self, message: str) -> None:
+        if self.logger:
+            self.logger.info(message)
@@ -0,0 +1,136 @@
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+# errors raised before the request reaches Odin, safe to retry whatever the method
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(kw_only=True)
+class RetryPolicy:
+    """Controls how Requester retries failed requests.
+
+    Transport errors and the statuses in retry_statuses are retried with exponential
+    backoff and full jitter, a Retry-After header from Odin takes priority over the
+    backoff. Only idempotent methods are retried once the request may have reached Odin,
+    errors raised while connecting are retried for every method.
+
+    Args:
+        max_retries (int, optional): Retries after the first attempt, 0 disables retrying. Defaults to 3.
+        backoff_factor (float, optional): Base delay in seconds, doubled each retry. Defaults to 0.5.
+        max_backoff (float, optional): Upper bound of a single delay in seconds. Defaults to 30.0.
+        jitter (bool, optional): Randomise delays between 0 and the backoff. Defaults to True.
+        retry_statuses (frozenset, optional): Status codes retried. Defaults to 429, 500, 502, 503, 504.
+        retry_methods (frozenset, optional): Methods retried. Defaults to GET, PUT, DELETE.
+        respect_retry_after (bool, optional): Wait as long as Retry-After asks. Defaults to True.
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = frozenset({"GET", "PUT", "DELETE"})
+    respect_retry_after: bool = True
+
+    def should_retry_response(
+        self,
+        method: str,
+        response: httpx.Response,
+        attempt: int,
+        idempotent: Optional[bool] = None,
+    ) -> bool:
+        """Checks if a response should be retried.
+
+        Args:
+            method (str): HTTP method of the request e.g. GET
+            response (httpx.Response): Response returned by Odin.
+            attempt (int): Retries already made for this request.
+            idempotent (bool, optional): Overrides retry_methods for this request, from
+                its EndpointPolicy. Defaults to None.
+
+        Returns:
+            Bool: True if the request should be sent again.
+        """
+
+        return (
+            attempt < self.max_retries
+            and self._retries_method(method, idempotent)
+            and response.status_code in self.retry_statuses
+        )
+
+    def should_retry_error(
+        self,
+        method: str,
+        error: httpx.TransportError,
+        attempt: int,
+        idempotent: Optional[bool] = None,
+    ) -> bool:
+        """Checks if a transport error should be retried.
+
+        Args:
+            method (str): HTTP method of the request e.g. GET
+            error (httpx.TransportError): Error raised sending the request.
+            attempt (int): Retries already made for this request.
+            idempotent (bool, optional): Overrides retry_methods for this request, from
+                its EndpointPolicy. Defaults to None.
+
+        Returns:
+            Bool: True if the request should be sent again.
+        """
+
+        if attempt >= self.max_retries:
+            return False
+        return self._retries_method(method, idempotent) or isinstance(
+            error, CONNECT_ERRORS
+        )
+
+    def _retries_method(self, method: str, idempotent: Optional[bool]) -> bool:
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.retry_methods
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before the next retry.
+
+        Args:
+            attempt (int): Retries already made for this request.
+            response (httpx.Response, optional): Response being retried, if any. Defaults to None.
+
+        Returns:
+            Float: Seconds to sleep.
+        """
+
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        delay = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header given either as seconds or a HTTP date.
+
+    Args:
+        value (str): Value of the Retry-After header.
+
+    Returns:
+        Float: Seconds to wait, None if the header is missing or invalid.
+    """
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
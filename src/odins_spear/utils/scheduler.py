@@ -0,0 +1,340 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Optional
+
+from .helpers import match_endpoint_prefix, normalise_endpoint_prefix
+
+# lanes and their share of slots while every lane has requests waiting
+DEFAULT_LANE_WEIGHTS = {"interactive": 8, "normal": 4, "bulk": 1}
+
+_request_priority = ContextVar("request_priority", default="normal")
+
+
+@contextmanager
+def request_priority(lane: str):
+    """Sends every request made inside the block, including tasks started inside it,
+    in the lane given.
+
+    Example:
+        with request_priority("bulk"):
+            await asyncio.gather(*(api.users.get_user_by_id(u) for u in users))
+
+    Args:
+        lane (str): interactive, normal or bulk.
+    """
+
+    token = _request_priority.set(lane)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def current_priority() -> str:
+    """Lane requests made from the current context are sent in."""
+    return _request_priority.get()
+
+
+class RequestScheduler:
+    """Caps how many requests are in flight at once, globally and per endpoint prefix.
+
+    Requests over the cap wait in a queue until a slot frees up instead of all opening
+    sockets at the same time, this lets large fan-outs e.g. asyncio.gather() over
+    thousands of calls saturate Odin without overwhelming it or hitting pool timeouts.
+
+    Waiting requests queue in priority lanes and global slots are handed out by smooth
+    weighted round robin, with the default weights interactive lookups get 8 of every 13
+    slots while bulk sweeps still get 1 so they are never starved. Requests given an
+    admit step e.g. the rate limiter run it one at a time before the next slot is handed
+    out, so lanes are honoured under the rate limit too.
+
+    Args:
+        max_in_flight (int, optional): Max requests in flight across all endpoints. None is
+            unlimited. Defaults to 100.
+        endpoint_limits (dict, optional): Max requests in flight per endpoint prefix e.g.
+            {"/users": 20, "/groups/call-centers/*": 5}. A prefix covers the path itself and
+            anything below it, the longest matching prefix applies. Defaults to None.
+        lane_weights (dict, optional): Share of global slots per lane, applied over the
+            defaults so only the lanes changed need giving. Defaults to
+            {"interactive": 8, "normal": 4, "bulk": 1}.
+
+    Raises:
+        ValueError: If max_in_flight is under 1 or a lane weight is not a positive integer.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = 100,
+        endpoint_limits: Optional[Dict[str, int]] = None,
+        lane_weights: Optional[Dict[str, int]] = None,
+    ) -> None:
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        lane_weights = {**DEFAULT_LANE_WEIGHTS, **(lane_weights or {})}
+        for lane, weight in lane_weights.items():
+            if isinstance(weight, bool) or not isinstance(weight, int) or weight < 1:
+                raise ValueError(
+                    f"lane weight of '{lane}' must be a positive integer, got {weight!r}."
+                )
+
+        self.max_in_flight = max_in_flight
+        self.endpoint_limits = {
+            normalise_endpoint_prefix(prefix): limit
+            for prefix, limit in (endpoint_limits or {}).items()
+        }
+        self.lane_weights = lane_weights
+        self._semaphores = {}
+        self._global_in_use = 0
+        self._admitting = False
+        # lane: waiting (future, admit) pairs
+        self._waiting = {lane: deque() for lane in self.lane_weights}
+        self._lane_credit = {lane: 0 for lane in self.lane_weights}
+
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.total_wait = 0.0
+        self._prefix_stats = {
+            prefix: {"in_flight": 0, "queued": 0} for prefix in self.endpoint_limits
+        }
+        self._lane_stats = {
+            lane: {"queued": 0, "completed": 0, "total_wait": 0.0}
+            for lane in self.lane_weights
+        }
+
+    def match_prefix(self, endpoint: str) -> Optional[str]:
+        """Returns the configured prefix endpoint falls under, None if no limit applies."""
+        return match_endpoint_prefix(endpoint, self.endpoint_limits)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        endpoint: str,
+        priority: Optional[str] = None,
+        admit: Optional[Callable[[], Awaitable]] = None,
+    ):
+        """Waits for a free slot for endpoint and holds it until the block exits.
+
+        Args:
+            endpoint (str): Endpoint the request targets e.g. /groups/call-centers
+            priority (str, optional): Lane to queue in. Defaults to the lane set with
+                request_priority(), normal if none is set.
+            admit (Callable, optional): Awaited once the slot is granted, before the next
+                slot is handed out e.g. acquiring a rate limit token. Defaults to None.
+
+        Yields:
+            Float: Seconds spent queued waiting for the slot.
+        """
+
+        lane = priority or current_priority()
+        if lane not in self.lane_weights:
+            raise ValueError(
+                f"Unknown priority '{lane}', expected one of {list(self.lane_weights)}"
+            )
+
+        prefix = self.match_prefix(endpoint)
+        semaphore = None
+        if prefix is not None:
+            semaphore = self._semaphore(prefix, self.endpoint_limits[prefix])
+
+        start = time.monotonic()
+        self._queued(prefix, lane, 1)
+        try:
+            # prefix first so a saturated prefix does not hold global slots while waiting
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                await self._acquire_global(lane, admit)
+            except BaseException:
+                if semaphore is not None:
+                    semaphore.release()
+                raise
+        finally:
+            self._queued(prefix, lane, -1)
+
+        if admit is not None:
+            try:
+                await admit()
+            except BaseException:
+                self._release_global()
+                if semaphore is not None:
+                    semaphore.release()
+                raise
+            finally:
+                self._admitting = False
+                self._dispatch()
+
+        waited = time.monotonic() - start
+        self.total_wait += waited
+        self._lane_stats[lane]["total_wait"] += waited
+        self._in_flight(prefix, 1)
+        try:
+            yield waited
+        finally:
+            self._in_flight(prefix, -1)
+            self.completed += 1
+            self._lane_stats[lane]["completed"] += 1
+            self._release_global()
+            if semaphore is not None:
+                semaphore.release()
+
+    @asynccontextmanager
+    async def try_slot(self, endpoint: str, priority: Optional[str] = None):
+        """Holds a slot for endpoint until the block exits if one is free right now,
+        never queueing e.g. for a hedged duplicate that is only worth sending at once.
+
+        Args:
+            endpoint (str): Endpoint the request targets e.g. /groups/call-centers
+            priority (str, optional): Lane the slot is counted in. Defaults to the lane
+                set with request_priority(), normal if none is set.
+
+        Yields:
+            Bool: True if a slot is held, False if none was free or requests are queued.
+        """
+
+        lane = priority or current_priority()
+        if lane not in self.lane_weights:
+            raise ValueError(
+                f"Unknown priority '{lane}', expected one of {list(self.lane_weights)}"
+            )
+
+        prefix = self.match_prefix(endpoint)
+        semaphore = None
+        if prefix is not None:
+            semaphore = self._semaphore(prefix, self.endpoint_limits[prefix])
+
+        if (
+            self._has_waiters()
+            or not self._can_grant()
+            or (semaphore is not None and semaphore.locked())
+        ):
+            yield False
+            return
+
+        # free, so neither acquire waits
+        if semaphore is not None:
+            await semaphore.acquire()
+        self._grant(None)
+        self._in_flight(prefix, 1)
+        try:
+            yield True
+        finally:
+            self._in_flight(prefix, -1)
+            self.completed += 1
+            self._lane_stats[lane]["completed"] += 1
+            self._release_global()
+            if semaphore is not None:
+                semaphore.release()
+
+    def metrics(self) -> dict:
+        """Snapshot of the queue depth and in flight counts.
+
+        Returns:
+            Dict: Global counts and a breakdown per configured endpoint prefix.
+        """
+
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "total_wait": round(self.total_wait, 6),
+            "lanes": {
+                lane: {
+                    "weight": self.lane_weights[lane],
+                    **stats,
+                    "total_wait": round(stats["total_wait"], 6),
+                }
+                for lane, stats in self._lane_stats.items()
+            },
+            "endpoints": {
+                prefix: {"limit": self.endpoint_limits[prefix], **stats}
+                for prefix, stats in self._prefix_stats.items()
+            },
+        }
+
+    async def _acquire_global(
+        self, lane: str, admit: Optional[Callable[[], Awaitable]]
+    ) -> None:
+        if not self._has_waiters() and self._can_grant():
+            self._grant(admit)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (future, admit)
+        self._waiting[lane].append(waiter)
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # granted just as the caller was cancelled, hand the slot on
+                if admit is not None:
+                    self._admitting = False
+                self._release_global()
+            elif waiter in self._waiting[lane]:
+                self._waiting[lane].remove(waiter)
+            raise
+
+    def _has_waiters(self) -> bool:
+        return any(self._waiting.values())
+
+    def _can_grant(self) -> bool:
+        return not self._admitting and (
+            self.max_in_flight is None or self._global_in_use < self.max_in_flight
+        )
+
+    def _grant(self, admit: Optional[Callable[[], Awaitable]]) -> None:
+        self._global_in_use += 1
+        if admit is not None:
+            self._admitting = True
+
+    def _release_global(self) -> None:
+        self._global_in_use -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hands free slots to waiting requests, lanes picked by smooth weighted round robin."""
+        while self._can_grant() and self._has_waiters():
+            lanes = [lane for lane, waiting in self._waiting.items() if waiting]
+            total = 0
+            for lane in lanes:
+                self._lane_credit[lane] += self.lane_weights[lane]
+                total += self.lane_weights[lane]
+            lane = max(lanes, key=self._lane_credit.__getitem__)
+            self._lane_credit[lane] -= total
+
+            future, admit = self._waiting[lane].popleft()
+            if future.done():
+                # cancelled while queued, removed once its task resumes
+                continue
+            self._grant(admit)
+            future.set_result(None)
+
+    def _semaphore(self, prefix: Optional[str], limit: int) -> asyncio.Semaphore:
+        # created lazily so semaphores bind to the loop that actually runs the requests
+        if prefix not in self._semaphores:
+            self._semaphores[prefix] = asyncio.Semaphore(limit)
+        return self._semaphores[prefix]
+
+    def _queued(self, prefix: Optional[str], lane: str, delta: int) -> None:
+        self.queued += delta
+        self.max_queued = max(self.max_queued, self.queued)
+        self._lane_stats[lane]["queued"] += delta
+        if prefix is not None:
+            self._prefix_stats[prefix]["queued"] += delta
+
+    def _in_flight(self, prefix: Optional[str], delta: int) -> None:
+        self.in_flight += delta
+        if prefix is not None:
+            self._prefix_stats[prefix]["in_flight"] += delta
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestScheduler(max_in_flight={self.max_in_flight}, "
+            f"endpoint_limits={self.endpoint_limits}, lane_weights={self.lane_weights})"
+        )
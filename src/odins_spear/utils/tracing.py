@@ -0,0 +1,191 @@
+import logging
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+_current_span = ContextVar("current_span", default=None)
+_current_tracer = ContextVar("current_tracer", default=None)
+
+
+@dataclass(kw_only=True)
+class Span:
+    """A timed operation e.g. a script run or an endpoint call.
+
+    Args:
+        name (str): What was timed e.g. "script group_audit" or "GET /groups".
+        trace_id (str): Shared by every span of one root span's tree.
+        span_id (str): Unique id of the span.
+        parent_id (str, optional): span_id of the enclosing span, None for a root span.
+        start (float): Wall clock time the span started.
+        duration (float, optional): Seconds the span took, None until it ends.
+        attributes (dict): Details e.g. endpoint and status_code.
+        status (str): ok or error
+        error (str, optional): repr() of the exception that ended the span.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start: float
+    duration: Optional[float] = None
+    attributes: dict = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration": self.duration,
+            "attributes": dict(self.attributes),
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class InMemorySpanExporter:
+    """Keeps finished spans in a list, summary() totals them by name to show which
+    phase or endpoint dominates a run's wall time."""
+
+    def __init__(self) -> None:
+        self.spans = []
+
+    def __call__(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans = []
+
+    def summary(self) -> dict:
+        """Span count, total and max seconds per span name, slowest total first."""
+        totals = {}
+        for span in self.spans:
+            entry = totals.setdefault(span.name, {"count": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += span.duration
+            entry["max"] = max(entry["max"], span.duration)
+        return dict(
+            sorted(totals.items(), key=lambda item: item[1]["total"], reverse=True)
+        )
+
+
+class LoggingSpanExporter:
+    """Logs each finished span.
+
+    Args:
+        logger (logging.Logger): Logger written to.
+        level (int, optional): Level spans are logged at. Defaults to logging.DEBUG.
+    """
+
+    def __init__(self, logger: logging.Logger, level: int = logging.DEBUG) -> None:
+        self.logger = logger
+        self.level = level
+
+    def __call__(self, span: Span) -> None:
+        self.logger.log(
+            self.level,
+            "Span finished, name: %s, duration: %.3fs, status: %s, trace_id: %s, span_id: %s, parent_id: %s, attributes: %s",
+            span.name,
+            span.duration,
+            span.status,
+            span.trace_id,
+            span.span_id,
+            span.parent_id,
+            span.attributes,
+        )
+
+
+class Tracer:
+    """Records spans for script and report runs and the endpoint calls they make.
+
+    The current span is held in a context variable so asyncio tasks started inside a
+    span, e.g. by asyncio.gather(), are its children. Finished spans are passed to the
+    exporter, any callable taking a Span, e.g. a bridge to OpenTelemetry.
+
+    Args:
+        exporter (Callable, optional): Called with every finished span. Defaults to an
+            InMemorySpanExporter.
+    """
+
+    def __init__(self, exporter: Optional[Callable[[Span], None]] = None) -> None:
+        self.exporter = exporter if exporter is not None else InMemorySpanExporter()
+        self.export_errors = 0
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Times the block as a span, a child of the current span if there is one.
+
+        Args:
+            name (str): Span name.
+            **attributes: Initial span attributes.
+
+        Yields:
+            Span: The span, attributes can be added while it is open.
+        """
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            attributes=attributes,
+        )
+        span_token = _current_span.set(span)
+        tracer_token = _current_tracer.set(self)
+        started = time.monotonic()
+        try:
+            yield span
+        except BaseException as error:
+            span.status = "error"
+            span.error = repr(error)
+            raise
+        finally:
+            span.duration = time.monotonic() - started
+            _current_tracer.reset(tracer_token)
+            _current_span.reset(span_token)
+            try:
+                self.exporter(span)
+            except Exception:
+                # a broken exporter must not fail the traced code
+                self.export_errors += 1
+
+    def __repr__(self) -> str:
+        return f"Tracer(exporter={self.exporter!r})"
+
+
+def current_span() -> Optional[Span]:
+    """Span open in the current context, None outside of a trace."""
+    return _current_span.get()
+
+
+@contextmanager
+def trace_span(name: str, **attributes):
+    """Times the block as a child of the current span e.g. a phase of a script, does
+    nothing outside of a trace.
+
+    Example:
+        with trace_span("fetch users"):
+            users = await api.users.get_users(service_provider_id, group_id)
+
+    Yields:
+        Span: The span, None outside of a trace.
+    """
+
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield None
+        return
+    with tracer.span(name, **attributes) as span:
+        yield span
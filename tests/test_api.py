@@ -0,0 +1,140 @@
+import asyncio
+import base64
+import json
+import time
+import unittest
+
+import httpx
+
+from odins_spear import API, Reporter, Scripter
+
+
+def mock_odin(name, calls):
+    """Transport answering every request with the name of the server it reached."""
+
+    async def handler(request):
+        calls.append((name, request.headers["Authorization"]))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"server": name})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestMultipleAPIs(unittest.IsolatedAsyncioTestCase):
+    """
+    Test several API objects each drive their own Odin server from one event loop.
+    """
+
+    def setUp(self):
+        self.calls = []
+        self.apis = []
+        for name in ("odin1", "odin2"):
+            api = API(f"https://{name}.test/api/v2", "user", "password")
+            api._requester.client = mock_odin(name, self.calls)
+            api._update_requester({"token": f"{name}-token"})
+            self.apis.append(api)
+
+    async def asyncTearDown(self):
+        for api in self.apis:
+            await api.aclose()
+
+    async def test_apis_do_not_share_state(self):
+        """Each API has its own requester, endpoints, scripter and reporter"""
+        first, second = self.apis
+
+        self.assertIsNot(first._requester, second._requester)
+        self.assertIs(first.groups._requester, first._requester)
+        self.assertIs(second.groups._requester, second._requester)
+        self.assertIsNot(first._requester.client, second._requester.client)
+        self.assertIsNot(first._requester.rate_limiter, second._requester.rate_limiter)
+        self.assertIs(Scripter(first).api, first)
+        self.assertIs(Scripter(second).api, second)
+        self.assertIs(Reporter(second).api, second)
+
+    async def test_concurrent_requests_reach_own_server(self):
+        """Requests fanned out across APIs go to their own server with their own token"""
+        results = await asyncio.gather(
+            *(api._requester.get("/groups") for api in self.apis for _ in range(3))
+        )
+
+        self.assertEqual(
+            [result["server"] for result in results], ["odin1"] * 3 + ["odin2"] * 3
+        )
+        self.assertEqual(
+            sorted(set(self.calls)),
+            [("odin1", "Bearer odin1-token"), ("odin2", "Bearer odin2-token")],
+        )
+
+
+def jwt(expires):
+    """Unsigned JWT expiring at the unix time given."""
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": expires}).encode()).decode()
+    return f"header.{claims.rstrip('=')}.signature"
+
+
+class TestReauthentication(unittest.IsolatedAsyncioTestCase):
+    """
+    Test expired or rejected tokens are refreshed once for every waiting request.
+    """
+
+    def setUp(self):
+        self.valid_token = jwt(time.time() + 3600)
+        self.auth_calls = []
+        self.tokens_seen = []
+
+        async def handler(request):
+            token = request.headers["Authorization"].removeprefix("Bearer ")
+            if request.url.path.endswith("/auth/token"):
+                self.auth_calls.append(request.method)
+                await asyncio.sleep(0.01)
+                if request.method == "PUT" and token == "revoked":
+                    return httpx.Response(401, json={"error": "expired"})
+                return httpx.Response(200, json={"token": self.valid_token})
+
+            self.tokens_seen.append(token)
+            if token != self.valid_token:
+                return httpx.Response(401, json={"error": "expired"})
+            return httpx.Response(200, json={"ok": True})
+
+        self.api = API("https://odin.test/api/v2", "user", "password")
+        self.api._requester.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+    async def asyncTearDown(self):
+        await self.api.aclose()
+
+    async def test_rejected_token_reauthenticated_once(self):
+        """Concurrent 401s share one login and every request is replayed"""
+        self.api._update_requester({"token": "revoked"})
+
+        results = await asyncio.gather(
+            *(
+                self.api._requester.get("/groups", params={"groupId": str(n)})
+                for n in range(20)
+            )
+        )
+
+        self.assertEqual(results, [{"ok": True}] * 20)
+        # refresh with the revoked token fails so it logs in again
+        self.assertEqual(self.auth_calls, ["PUT", "POST"])
+        self.assertEqual(self.api._requester.reauthentications, 1)
+
+    async def test_token_refreshed_before_expiry(self):
+        """A token inside the refresh margin is refreshed before the request is sent"""
+        self.valid_token = jwt(time.time() + 60)
+        self.api._update_requester({"token": self.valid_token})
+        expiring = self.valid_token
+        self.valid_token = jwt(time.time() + 3600)
+
+        await asyncio.gather(
+            self.api._requester.get("/groups", params={"groupId": "a"}),
+            self.api._requester.get("/groups", params={"groupId": "b"}),
+        )
+
+        self.assertEqual(self.auth_calls, ["PUT"])
+        self.assertNotIn(expiring, self.tokens_seen)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from odins_spear import API
+from odins_spear.testing import MockOdin
+from odins_spear.utils.cache import ResponseCache, SQLiteResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Test the TTL + LRU response cache and its invalidation rules.
+    """
+
+    def test_only_endpoints_with_ttl_cached(self):
+        """Responses are only held for endpoints given a TTL"""
+        cache = ResponseCache(ttls={"/groups": 60, "/groups/dns": 0})
+
+        cache.set("a", "/groups", b"{}")
+        cache.set("b", "/users", b"{}")
+        cache.set("c", "/groups/dns", b"{}")
+
+        self.assertEqual(cache.get("a"), b"{}")
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.metrics()["hits"], 1)
+        self.assertEqual(cache.metrics()["misses"], 2)
+
+    def test_expiry(self):
+        """Entries are dropped once their TTL passes"""
+        cache = ResponseCache(default_ttl=0.01)
+
+        cache.set("a", "/groups", b"{}")
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.metrics()["entries"], 0)
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted past max_entries and max_bytes"""
+        cache = ResponseCache(default_ttl=60, max_entries=2, max_bytes=10)
+
+        cache.set("a", "/groups", b"1234")
+        cache.set("b", "/groups", b"1234")
+        cache.get("a")
+        cache.set("c", "/groups", b"1234")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+
+        cache.set("d", "/groups", b"12345678")
+
+        self.assertEqual(cache.metrics()["bytes"], 8)
+        self.assertEqual(cache.metrics()["evictions"], 3)
+
+    def test_invalidation(self):
+        """Writes invalidate the same path, paths above it and paths below it"""
+        cache = ResponseCache(default_ttl=60)
+        for key, endpoint in (
+            ("groups", "/groups"),
+            ("cc", "/groups/call-centers"),
+            ("agents", "/groups/call-centers/agents"),
+            ("hg", "/groups/hunt-groups"),
+            ("users", "/users?"),
+        ):
+            cache.set(key, endpoint, b"{}")
+
+        self.assertEqual(cache.invalidate("/groups/call-centers"), 3)
+        self.assertIsNotNone(cache.get("hg"))
+        self.assertIsNone(cache.get("groups"))
+
+        self.assertEqual(cache.invalidate("/users"), 1)
+
+    def test_invalidation_stops_at_collection(self):
+        """A write deeper down leaves paths above its collection cached"""
+        cache = ResponseCache(default_ttl=60)
+        for key, endpoint in (
+            ("groups", "/groups"),
+            ("cc", "/groups/call-centers"),
+            ("agents", "/groups/call-centers/agents"),
+        ):
+            cache.set(key, endpoint, b"{}")
+
+        self.assertEqual(cache.invalidate("/groups/call-centers/agents"), 2)
+        self.assertIsNotNone(cache.get("groups"))
+        self.assertIsNone(cache.get("cc"))
+
+
+class TestSQLiteResponseCache(unittest.TestCase):
+    """
+    Test the on disk cache is shared between instances and honours TTLs and caps.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache", "responses.sqlite3")
+
+    def open_cache(self, **kwargs):
+        cache = SQLiteResponseCache(self.path, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_shared_between_instances(self):
+        """A response cached by one process is read by another using the same file"""
+        writer = self.open_cache(ttls={"/groups": 60})
+        reader = self.open_cache(ttls={"/groups": 60})
+
+        writer.set(("GET", "/groups", "{}", None), "/groups", b'{"a": 1}')
+
+        self.assertEqual(reader.get(("GET", "/groups", "{}", None)), b'{"a": 1}')
+        self.assertIsNone(reader.get(("GET", "/users", "{}", None)))
+        self.assertEqual(reader.metrics()["entries"], 1)
+
+    def test_expiry(self):
+        """Entries are not returned once their TTL passes"""
+        cache = self.open_cache(default_ttl=0.01)
+
+        cache.set("a", "/groups", b"{}")
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_least_recently_used_evicted(self):
+        """Oldest accessed entries are dropped once over max_entries or max_bytes"""
+        cache = self.open_cache(
+            default_ttl=60, max_entries=2, max_bytes=10, touch_after=0
+        )
+
+        cache.set("a", "/groups", b"{}")
+        cache.set("b", "/groups", b"{}")
+        cache.get("a")
+        cache.set("c", "/groups", b"{}")
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+        cache.set("d", "/groups", b"123456789")
+        self.assertLessEqual(cache.metrics()["bytes"], 10)
+        self.assertEqual(cache.metrics()["evictions"], 3)
+
+    def test_access_recorded_lazily(self):
+        """A hit only writes its access time once touch_after of the TTL has passed"""
+        cache = self.open_cache(default_ttl=1, touch_after=0.1)
+        cache.set("a", "/groups", b"{}")
+
+        def accessed():
+            with sqlite3.connect(self.path) as connection:
+                return connection.execute("SELECT accessed FROM responses").fetchone()[
+                    0
+                ]
+
+        written = accessed()
+        cache.get("a")
+        self.assertEqual(accessed(), written)
+
+        time.sleep(0.15)
+        cache.get("a")
+        self.assertGreater(accessed(), written)
+
+    def test_async_access(self):
+        """aget/ aset/ ainvalidate run the database work off the event loop"""
+        cache = self.open_cache(default_ttl=60)
+
+        async def main():
+            await asyncio.gather(
+                *(cache.aset(n, "/groups", b"{}") for n in range(20)),
+            )
+            bodies = await asyncio.gather(*(cache.aget(n) for n in range(20)))
+            return bodies, await cache.ainvalidate("/groups")
+
+        bodies, removed = asyncio.run(main())
+        self.assertEqual(bodies, [b"{}"] * 20)
+        self.assertEqual(removed, 20)
+
+    def test_invalidation(self):
+        """Writes invalidate the same path, paths above and paths below it"""
+        cache = self.open_cache(default_ttl=60)
+
+        cache.set("a", "/groups", b"{}")
+        cache.set("b", "/groups/call-centers", b"{}")
+        cache.set("c", "/groups/call-centers/agents", b"{}")
+        cache.set("d", "/groups/dns", b"{}")
+        cache.set("e", "/groups/call_centers/agents", b"{}")
+
+        self.assertEqual(cache.invalidate("/groups/call-centers"), 3)
+        self.assertIsNotNone(cache.get("d"))
+        self.assertIsNotNone(cache.get("e"))
+
+        cache.set("a", "/groups", b"{}")
+        cache.set("b", "/groups/call-centers", b"{}")
+        cache.set("c", "/groups/call-centers/agents", b"{}")
+        self.assertEqual(cache.invalidate("/groups/call-centers/agents"), 2)
+        self.assertIsNotNone(cache.get("a"))
+
+
+class TestSharedCacheAccounts(unittest.IsolatedAsyncioTestCase):
+    """
+    Test APIs logged in as different users never read each other's cached responses.
+    """
+
+    async def test_keyed_by_account(self):
+        """Only an API of the same user reuses a response cached on the same server"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cache = SQLiteResponseCache(
+            os.path.join(directory.name, "responses.sqlite3"), default_ttl=60
+        )
+        self.addCleanup(cache.close)
+        server = MockOdin()
+
+        async def get_groups(username):
+            async with API(
+                "https://odin.test/api/v2",
+                username,
+                "password",
+                transport=server.transport(),
+                response_cache=cache,
+            ) as api:
+                await api.groups.get_groups(server.enterprise.service_provider_id)
+
+        await get_groups("reseller")
+        await get_groups("system-admin")
+        await get_groups("reseller")
+
+        self.assertEqual(server.requests["GET /groups"], 2)
+        self.assertEqual(cache.metrics()["hits"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
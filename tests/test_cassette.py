@@ -0,0 +1,142 @@
+import gzip
+import logging
+import os
+import tempfile
+import unittest
+import zlib
+
+import httpx
+
+from odins_spear.exceptions import OSCassetteMissError
+from odins_spear.requester import Requester
+from odins_spear.utils.cassette import RecordingTransport, ReplayTransport
+from odins_spear.utils.connection import ConnectionConfig
+from odins_spear.utils.retry import RetryPolicy
+
+
+def odin(request):
+    if request.url.path.endswith("/auth/token"):
+        return httpx.Response(200, json={"token": "secret-token-value"})
+    return httpx.Response(
+        200, json={"path": request.url.path, "params": dict(request.url.params)}
+    )
+
+
+def build_requester(transport, **kwargs):
+    return Requester(
+        "https://odin.test/api/v2",
+        False,
+        logging.getLogger("OS.test"),
+        connection=ConnectionConfig(transport=transport),
+        **kwargs,
+    )
+
+
+class TestCassette(unittest.IsolatedAsyncioTestCase):
+    """
+    Test requests recorded to a cassette replay offline.
+    """
+
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cassette.jsonl.gz")
+
+        recorder = build_requester(
+            RecordingTransport(self.path, httpx.MockTransport(odin))
+        )
+        await recorder.post("/auth/token", data={"password": "hunter2"})
+        await recorder.get(
+            "/users", params={"groupId": "g1", "serviceProviderId": "sp"}
+        )
+        await recorder.get("/groups")
+        await recorder.aclose()
+
+    async def asyncTearDown(self):
+        self.directory.cleanup()
+
+    async def test_replay(self):
+        """Recorded responses are replayed, params in any order"""
+        requester = build_requester(ReplayTransport(self.path, latency_scale=0))
+
+        self.assertEqual(
+            await requester.get(
+                "/users", params={"serviceProviderId": "sp", "groupId": "g1"}
+            ),
+            {
+                "path": "/api/v2/users",
+                "params": {"groupId": "g1", "serviceProviderId": "sp"},
+            },
+        )
+        with self.assertRaises(OSCassetteMissError):
+            await requester.get("/users", params={"groupId": "g2"})
+
+    async def test_secrets_not_recorded(self):
+        """Tokens are masked and request bodies only stored as a hash"""
+        transport = ReplayTransport(self.path, latency_scale=0)
+        requester = build_requester(transport)
+
+        self.assertEqual(
+            await requester.post("/auth/token", data={"password": "hunter2"}),
+            {"token": "se...ue"},
+        )
+        self.assertEqual(transport.replayed, 1)
+
+    async def test_error_injection_is_deterministic(self):
+        """The same seed injects the same failures"""
+
+        async def run():
+            transport = ReplayTransport(
+                self.path, latency_scale=0, error_rate=0.3, timeout_rate=0.2, seed=7
+            )
+            requester = build_requester(
+                transport, retry_policy=RetryPolicy(max_retries=0)
+            )
+            outcomes = []
+            for _ in range(20):
+                try:
+                    await requester.get("/groups")
+                    outcomes.append("ok")
+                except Exception as error:
+                    outcomes.append(type(error).__name__)
+            return outcomes
+
+        first = await run()
+        self.assertEqual(first, await run())
+        self.assertIn("ok", first)
+        self.assertIn("ReadTimeout", first)
+        self.assertIn("OSApiResponseError", first)
+
+    async def test_recording(self):
+        """Callers get the live headers and body, the cassette is written as one stream"""
+
+        def compressed(request):
+            return httpx.Response(
+                200,
+                headers={
+                    "Content-Encoding": "gzip",
+                    "Content-Type": "application/json",
+                    "X-Request-Id": "abc",
+                },
+                content=gzip.compress(b'{"groupId": "g1"}'),
+            )
+
+        path = os.path.join(self.directory.name, "live.jsonl.gz")
+        recorder = build_requester(
+            RecordingTransport(path, httpx.MockTransport(compressed))
+        )
+        for _ in range(3):
+            self.assertEqual(await recorder.get("/groups"), {"groupId": "g1"})
+        response = await recorder.client.get("https://odin.test/api/v2/groups")
+        self.assertEqual(response.headers["X-Request-Id"], "abc")
+        await recorder.aclose()
+
+        with open(path, "rb") as file:
+            decompressor = zlib.decompressobj(wbits=31)
+            lines = decompressor.decompress(file.read()).splitlines()
+        self.assertEqual(decompressor.unused_data, b"")
+        self.assertEqual(len(lines), 4)
+        self.assertNotIn(b"x-request-id", lines[0].lower())
+
+
+if __name__ == "__main__":
+    unittest.main()
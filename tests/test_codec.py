@@ -0,0 +1,47 @@
+import importlib.util
+import unittest
+
+from odins_spear.utils.codec import BACKENDS, get_codec
+
+
+class TestJSONCodec(unittest.TestCase):
+    """
+    Test every installed JSON backend round trips request and response bodies.
+    """
+
+    data = {
+        "userId": "jdoe@domain.com",
+        "firstName": "Jöhn",
+        "extended": True,
+        "numbers": [1.5, None],
+    }
+
+    def test_installed_backends_round_trip(self):
+        """Bodies encode to UTF-8 bytes and decode back to the same data"""
+        for backend in BACKENDS:
+            if backend != "json" and importlib.util.find_spec(backend) is None:
+                continue
+            with self.subTest(backend=backend):
+                codec = get_codec(backend)
+                body = codec.dumps(self.data)
+
+                self.assertIsInstance(body, bytes)
+                self.assertEqual(codec.loads(body), self.data)
+                self.assertEqual(codec.loads(body.decode()), codec.loads(body))
+
+    def test_auto_picks_installed_backend(self):
+        """auto falls back to the stdlib when no faster backend is installed"""
+        installed = [
+            name for name in BACKENDS if importlib.util.find_spec(name) is not None
+        ]
+
+        self.assertEqual(get_codec().name, (installed or ["json"])[0])
+
+    def test_unknown_backend(self):
+        """Unknown backends are rejected"""
+        with self.assertRaises(ValueError):
+            get_codec("simplejson")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import gzip
+import json
+import unittest
+
+import httpx
+
+from odins_spear.utils.compression import CompressionPolicy, supported_encodings
+from odins_spear.utils.metrics import MetricsCollector
+
+from .test_requester import build_requester
+
+
+class TestCompressionPolicy(unittest.TestCase):
+    """
+    Test which request bodies are compressed.
+    """
+
+    def test_defaults(self):
+        """Responses are negotiated, request bodies are sent as is"""
+        policy = CompressionPolicy()
+
+        self.assertTrue(supported_encodings().startswith("gzip, deflate"))
+        self.assertEqual(policy.accept_encoding, supported_encodings())
+        self.assertFalse(policy.should_compress("/users/bulk", 10_000))
+
+    def test_endpoints_size_and_rejection(self):
+        """Only large bodies to listed endpoints are compressed until rejected"""
+        policy = CompressionPolicy(
+            compress_requests=True, endpoints=["/users/bulk"], min_size=100
+        )
+
+        self.assertTrue(policy.should_compress("/users/bulk", 100))
+        self.assertFalse(policy.should_compress("/users/bulk", 99))
+        self.assertFalse(policy.should_compress("/groups/dns", 1000))
+
+        policy.reject("/users/bulk")
+        self.assertFalse(policy.should_compress("/users/bulk", 1000))
+
+        with self.assertRaises(ValueError):
+            CompressionPolicy(level=0)
+
+
+class TestRequesterCompression(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the requester negotiates, compresses and counts bytes on the wire.
+    """
+
+    users = [{"userId": f"user{n}@domain.com", "firstName": "Alex"} for n in range(50)]
+
+    async def test_compressed_request_and_response(self):
+        """Large bodies are gzipped and wire bytes counted apart from body bytes"""
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(
+                200,
+                content=gzip.compress(json.dumps(self.users).encode()),
+                headers={"Content-Encoding": "gzip"},
+            )
+
+        metrics = MetricsCollector()
+        requester = build_requester(
+            handler,
+            metrics=metrics,
+            compression=CompressionPolicy(compress_requests=True, min_size=100),
+        )
+
+        self.assertEqual(await requester.put("/users/bulk", self.users), self.users)
+
+        request = received[0]
+        self.assertIn("gzip", request.headers["Accept-Encoding"])
+        self.assertEqual(request.headers["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(request.content)), self.users)
+
+        collected = metrics.to_dict()
+        self.assertEqual(collected["bytes_in"], len(json.dumps(self.users)))
+        self.assertLess(collected["wire_bytes_in"], collected["bytes_in"])
+        self.assertLess(collected["wire_bytes_out"], collected["bytes_out"])
+        self.assertGreater(collected["bytes_saved"], 0)
+
+    async def test_rejected_compression_resent_uncompressed(self):
+        """A 415 is answered by resending the body as is, later bodies are not compressed"""
+        received = []
+
+        def handler(request):
+            received.append(request)
+            if "Content-Encoding" in request.headers:
+                return httpx.Response(
+                    415, json={"details": "", "status": 415, "error": ""}
+                )
+            return httpx.Response(200, json={})
+
+        requester = build_requester(
+            handler, compression=CompressionPolicy(compress_requests=True, min_size=1)
+        )
+
+        await requester.put("/users/bulk", self.users)
+        await requester.put("/users/bulk", self.users)
+
+        self.assertEqual(
+            ["Content-Encoding" in request.headers for request in received],
+            [True, False, False],
+        )
@@ -0,0 +1,52 @@
+import importlib.util
+import unittest
+
+from odins_spear.utils.connection import ConnectionConfig
+
+
+class TestConnectionConfig(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the shared AsyncClient is built with the pooling and timeout settings given.
+    """
+
+    async def test_client_settings(self):
+        """Timeouts and pool limits are applied to the client"""
+        config = ConnectionConfig(
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=60.0,
+            connect_timeout=1.0,
+            read_timeout=2.0,
+        )
+        client = config.build_client()
+
+        self.assertEqual(client.timeout.connect, 1.0)
+        self.assertEqual(client.timeout.read, 2.0)
+
+        pool = client._transport._pool
+        self.assertEqual(pool._max_connections, 10)
+        self.assertEqual(pool._max_keepalive_connections, 5)
+        self.assertEqual(pool._keepalive_expiry, 60.0)
+        self.assertIsNotNone(pool._socket_options)
+
+        await client.aclose()
+        self.assertTrue(client.is_closed)
+
+    async def test_tcp_keepalive_disabled(self):
+        """No socket options are set when TCP keep-alive is off"""
+        client = ConnectionConfig(tcp_keepalive=False).build_client()
+
+        self.assertIsNone(client._transport._pool._socket_options)
+        await client.aclose()
+
+    @unittest.skipIf(importlib.util.find_spec("h2") is not None, "h2 installed")
+    async def test_http2_fallback(self):
+        """HTTP/2 falls back to HTTP/1.1 when h2 is not installed"""
+        client = ConnectionConfig(http2=True).build_client()
+
+        self.assertFalse(client._transport._pool._http2)
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    unittest.main()
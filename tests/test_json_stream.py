@@ -0,0 +1,157 @@
+import asyncio
+import json
+import unittest
+
+import httpx
+
+from odins_spear.exceptions import OSApiResponseError
+from odins_spear.utils.circuit_breaker import OPEN, CircuitBreaker
+from odins_spear.utils.json_stream import JSONArrayDecoder, JSONArrayStream
+from odins_spear.utils.metrics import MetricsCollector
+
+from .test_requester import build_requester
+
+
+class TestJSONArrayDecoder(unittest.TestCase):
+    """
+    Test arrays are split into elements however the body is chunked.
+    """
+
+    data = [
+        {"userId": "a@b.com", "aliases": ["x", "y"], "nested": {"list": [1, [2]]}},
+        'quote " comma , bracket ] brace }',
+        "escaped \\ backslash \\",
+        3.5,
+        None,
+        [],
+        {},
+    ]
+
+    def decode(self, body: bytes, size: int) -> list:
+        decoder = JSONArrayDecoder(json.loads)
+        items = []
+        for start in range(0, len(body), size):
+            items.extend(decoder.feed(body[start : start + size]))
+        items.extend(decoder.close())
+        return items
+
+    def test_any_chunk_size(self):
+        """Elements decode the same fed byte by byte or whole"""
+        body = json.dumps(self.data, indent=2).encode()
+        for size in (1, 2, 7, len(body)):
+            with self.subTest(size=size):
+                self.assertEqual(self.decode(body, size), self.data)
+
+    def test_elements_yielded_before_end(self):
+        """An element is returned as soon as the comma after it arrives"""
+        decoder = JSONArrayDecoder(json.loads)
+
+        self.assertEqual(decoder.feed(b' [{"a": 1}, {"b"'), [{"a": 1}])
+        self.assertEqual(decoder.feed(b": 2}]  "), [{"b": 2}])
+        self.assertEqual(decoder.close(), [])
+
+    def test_empty_and_non_array_bodies(self):
+        """An empty array yields nothing, any other body is yielded whole"""
+        self.assertEqual(self.decode(b"[ ]", 1), [])
+        self.assertEqual(self.decode(b'{"a": [1, 2]}', 3), [{"a": [1, 2]}])
+
+    def test_truncated_array(self):
+        """A body ending inside the array raises"""
+        decoder = JSONArrayDecoder(json.loads)
+        decoder.feed(b'[{"a": 1}, {"b": 2')
+
+        with self.assertRaises(ValueError):
+            decoder.close()
+
+
+class TestRequesterStream(unittest.IsolatedAsyncioTestCase):
+    """
+    Test Requester.get(stream=True) iterates a response as it downloads.
+    """
+
+    users = [{"userId": f"user{n}@domain.com"} for n in range(100)]
+
+    async def test_streams_elements(self):
+        """Elements arrive in order, the response is closed and its bytes counted"""
+        body = json.dumps(self.users).encode()
+
+        async def chunks():
+            for start in range(0, len(body), 64):
+                yield body[start : start + 64]
+
+        def handler(request):
+            return httpx.Response(200, content=chunks())
+
+        metrics = MetricsCollector()
+        requester = build_requester(handler, metrics=metrics)
+
+        stream = await requester.get("/users", stream=True)
+        self.assertIsInstance(stream, JSONArrayStream)
+        self.assertEqual([user async for user in stream], self.users)
+        self.assertTrue(stream.response.is_closed)
+        self.assertEqual(metrics.to_dict()["bytes_in"], len(body))
+
+    async def test_stop_early(self):
+        """Leaving the context manager part way closes the response"""
+
+        def handler(request):
+            return httpx.Response(200, json=self.users)
+
+        requester = build_requester(handler)
+
+        async with await requester.get("/users", stream=True) as stream:
+            async for user in stream:
+                break
+        self.assertEqual(user, self.users[0])
+        self.assertTrue(stream.response.is_closed)
+
+    async def test_slot_held_until_closed(self):
+        """A stream keeps its scheduler slot until closed, later streams queue for it"""
+
+        def handler(request):
+            return httpx.Response(200, json=self.users)
+
+        requester = build_requester(handler, max_concurrent_requests=1)
+
+        first = await requester.get("/users", stream=True)
+        second = asyncio.ensure_future(requester.get("/users", stream=True))
+        await asyncio.sleep(0.01)
+        self.assertFalse(second.done())
+        self.assertEqual(requester.scheduler.metrics()["queued"], 1)
+
+        await first.aclose()
+        async with await asyncio.wait_for(second, 1) as stream:
+            self.assertEqual(len([user async for user in stream]), 100)
+        self.assertEqual(requester.scheduler.metrics()["in_flight"], 0)
+
+    async def test_read_error_opens_circuit(self):
+        """A transport error while the body downloads counts as a circuit failure"""
+
+        async def chunks():
+            yield b'[{"userId": "a"},'
+            raise httpx.ReadError("connection reset")
+
+        def handler(request):
+            return httpx.Response(200, content=chunks())
+
+        breaker = CircuitBreaker(failure_threshold=1)
+        requester = build_requester(handler, circuit_breaker=breaker)
+
+        stream = await requester.get("/users", stream=True)
+        with self.assertRaises(httpx.ReadError):
+            async for _ in stream:
+                pass
+
+        self.assertEqual(breaker.state("/users"), OPEN)
+        self.assertEqual(requester.scheduler.metrics()["in_flight"], 0)
+
+    async def test_error_raised(self):
+        """An error response is raised before anything is iterated"""
+
+        def handler(request):
+            return httpx.Response(404, json={"details": "", "status": 404, "error": ""})
+
+        requester = build_requester(handler)
+
+        with self.assertRaises(OSApiResponseError):
+            await requester.get("/users", stream=True)
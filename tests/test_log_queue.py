@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import threading
+import unittest
+from logging.handlers import QueueHandler
+
+from odins_spear import API
+from odins_spear.utils.log_queue import LogQueue
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record.getMessage(), threading.current_thread()))
+
+
+class TestLogQueue(unittest.TestCase):
+    """
+    Test log records are written from a background thread while the queue runs.
+    """
+
+    def setUp(self):
+        self.logger = logging.getLogger("OS.test.queue")
+        self.logger.setLevel(logging.INFO)
+        self.handler = RecordingHandler()
+        self.logger.addHandler(self.handler)
+        self.addCleanup(self.logger.removeHandler, self.handler)
+
+    def test_records_written_off_caller_thread(self):
+        """Handlers run on the listener thread and get their records back on stop"""
+        log_queue = LogQueue(self.logger)
+        log_queue.start()
+
+        self.assertNotIn(self.handler, self.logger.handlers)
+        self.logger.info("queued %s", "record")
+        self.logger.debug("below level, never queued")
+        log_queue.stop()
+
+        self.assertEqual(len(self.handler.records), 1)
+        message, thread = self.handler.records[0]
+        self.assertEqual(message, "queued record")
+        self.assertIsNot(thread, threading.current_thread())
+        self.assertIn(self.handler, self.logger.handlers)
+        self.assertFalse(any(isinstance(h, QueueHandler) for h in self.logger.handlers))
+
+    def test_shared_logger_stopped_out_of_order(self):
+        """APIs sharing a logger share one queue, nothing is lost or written twice"""
+
+        def api():
+            return API(
+                "https://odin.test/api/v2",
+                "user",
+                "password",
+                logger=self.logger,
+                queue_logging=True,
+            )
+
+        first, second = api(), api()
+        self.assertEqual(len(self.logger.handlers), 1)
+
+        self.logger.info("one")
+        asyncio.run(first.aclose())
+        self.logger.info("two")
+        asyncio.run(second.aclose())
+        self.logger.info("three")
+
+        messages = [message for message, _ in self.handler.records]
+        self.assertEqual(
+            [message for message in messages if message in ("one", "two", "three")],
+            ["one", "two", "three"],
+        )
+        self.assertEqual(self.logger.handlers, [self.handler])
+
+    def test_stop_without_start(self):
+        """Stopping a queue that never started is a no-op"""
+        handlers = list(self.logger.handlers)
+        LogQueue(self.logger).stop()
+
+        self.assertEqual(self.logger.handlers, handlers)
+
+
+if __name__ == "__main__":
+    unittest.main()
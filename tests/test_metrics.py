@@ -0,0 +1,75 @@
+import unittest
+
+from odins_spear.utils.metrics import Histogram, MetricsCollector
+
+
+class TestHistogram(unittest.TestCase):
+    """
+    Test latency percentiles are estimated from the buckets.
+    """
+
+    def test_quantiles_interpolated_within_bucket(self):
+        """p50 of values evenly spread over a bucket lands midway through it"""
+        hist = Histogram(buckets=(0.1, 0.2, float("inf")))
+        for _ in range(10):
+            hist.observe(0.05)
+        for _ in range(10):
+            hist.observe(0.15)
+
+        self.assertAlmostEqual(hist.quantile(0.5), 0.1)
+        self.assertAlmostEqual(hist.quantile(0.75), 0.15)
+        self.assertIsNone(Histogram().quantile(0.5))
+
+
+class TestMetricsCollector(unittest.TestCase):
+    """
+    Test requests are summarised per endpoint and exported.
+    """
+
+    def setUp(self):
+        self.metrics = MetricsCollector()
+        self.metrics.record_response("GET", "/groups?", 200, 0.03, 0, 120)
+        self.metrics.record_response("GET", "/groups", 503, 0.2, 0, 40)
+        self.metrics.record_error("PUT", "/users", 30.0, 64)
+        self.metrics.record_wait("rate_limit", 0.2)
+
+    def test_to_dict(self):
+        """Counts, statuses and bytes are totalled per endpoint"""
+        snapshot = self.metrics.to_dict()
+
+        self.assertEqual(snapshot["requests"], 3)
+        self.assertEqual(snapshot["errors"], 1)
+        self.assertEqual(snapshot["bytes_in"], 160)
+        self.assertEqual(snapshot["bytes_out"], 64)
+        self.assertEqual(
+            snapshot["endpoints"]["GET /groups"]["statuses"], {200: 1, 503: 1}
+        )
+        self.assertEqual(snapshot["endpoints"]["GET /groups"]["latency"]["count"], 2)
+        self.assertEqual(snapshot["waits"]["rate_limit"]["count"], 1)
+        self.assertEqual(snapshot["waits"]["scheduler"]["count"], 0)
+
+    def test_to_prometheus(self):
+        """Exposition text has labelled counters and cumulative buckets"""
+        text = self.metrics.to_prometheus()
+
+        self.assertIn("# TYPE odins_spear_requests_total counter", text)
+        self.assertIn(
+            'odins_spear_requests_total{method="GET",endpoint="/groups",status="503"} 1',
+            text,
+        )
+        self.assertIn(
+            'odins_spear_request_duration_seconds_bucket{method="GET",endpoint="/groups",le="+Inf"} 2',
+            text,
+        )
+        self.assertIn(
+            'odins_spear_request_errors_total{method="PUT",endpoint="/users"} 1', text
+        )
+        self.assertIn('odins_spear_wait_seconds_count{kind="rate_limit"} 1', text)
+
+    def test_reset(self):
+        self.metrics.reset()
+        self.assertEqual(self.metrics.to_dict()["requests"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import asyncio
+import csv
+import os
+import tempfile
+import unittest
+
+import httpx
+
+from odins_spear import API, Reporter, Scripter
+from odins_spear.exceptions import OSApiResponseError
+from odins_spear.testing import MockOdin, generate_enterprise
+
+
+class TestSyntheticEnterprise(unittest.TestCase):
+    """
+    Test enterprises are generated to the sizes asked for.
+    """
+
+    def test_counts_and_repeatable(self):
+        enterprise = generate_enterprise(
+            "small", groups=3, users_per_group=20, call_centers_per_group=4
+        )
+
+        counts = enterprise.counts()
+        self.assertEqual(counts["groups"], 3)
+        self.assertEqual(counts["users"], 60)
+        self.assertEqual(counts["call_centers"], 12)
+        self.assertEqual(
+            generate_enterprise(
+                "small", groups=3, users_per_group=20, call_centers_per_group=4
+            ).users,
+            enterprise.users,
+        )
+
+        with self.assertRaises(ValueError):
+            generate_enterprise("gigantic")
+
+
+class TestMockOdin(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the API and scripts run against the mock server.
+    """
+
+    async def asyncSetUp(self):
+        self.enterprise = generate_enterprise("small")
+        self.server = MockOdin(self.enterprise)
+        self.api = API(
+            "https://odin.test/api/v2",
+            "user",
+            "password",
+            transport=self.server.transport(),
+        )
+        self.group_id = self.enterprise.group_ids()[0]
+
+    async def asyncTearDown(self):
+        await self.api.aclose()
+
+    async def test_endpoints_answer_from_enterprise(self):
+        self.assertTrue(await self.api._authenticate())
+
+        users = await self.api.users.get_users("ent1", self.group_id)
+        self.assertEqual(len(users), 50)
+        self.assertNotIn("aliases", users[0])
+
+        call_centers = await self.api.call_centers.get_group_call_centers(
+            "ent1", self.group_id
+        )
+        detail = await self.api.call_centers.get_group_call_center(
+            call_centers[0]["serviceUserId"]
+        )
+        self.assertEqual(detail["serviceInstanceProfile"]["name"], "Call Center 1")
+
+        with self.assertRaises(OSApiResponseError):
+            await self.api.users.get_user_by_id("nobody@odin.test")
+
+    async def test_script_runs(self):
+        """find_alias locates a generated alias"""
+        alias = self.enterprise.hunt_groups[
+            self.enterprise.members[self.group_id]["hunt_groups"][1]
+        ]["serviceInstanceProfile"]["aliases"][0]
+
+        result = await Scripter(self.api).find_alias(
+            service_provider_id="ent1",
+            group_id=self.group_id,
+            alias=alias.split("@")[0],
+        )
+        self.assertEqual(result["type"], "HG")
+        self.assertGreater(self.server.metrics()["requests"], 0)
+
+    async def test_user_association(self):
+        """user_association gathers the hunt groups and call centers of a user"""
+        hunt_group = self.enterprise.hunt_groups[
+            self.enterprise.members[self.group_id]["hunt_groups"][0]
+        ]
+        user_id = hunt_group["agents"][0]["userId"]
+
+        result = await Scripter(self.api).user_association(
+            service_provider_id="ent1", group_id=self.group_id, user_id=user_id
+        )
+
+        user = self.enterprise.users[user_id]
+        self.assertEqual(result["userId"], user_id)
+        self.assertEqual(result["firstName"], user["firstName"])
+        self.assertEqual(result["featurePacks"], [user["servicePack"]])
+        self.assertIn(hunt_group["serviceUserId"], result["huntGroups"])
+        self.assertIsInstance(result["callCenters"], list)
+        self.assertIsNone(result["pickUpGroup"])
+
+    async def test_report_runs(self):
+        """group_users_call_statistics writes a row per user, users without calls zeroed"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(directory.name)
+
+        self.assertTrue(
+            await Reporter(self.api).group_users_call_statistics(
+                service_provider_id="ent1",
+                group_id=self.group_id,
+                start_date="2024-01-01",
+                end_date="2024-01-31",
+            )
+        )
+
+        with open(
+            os.path.join(
+                "os_reports",
+                f"{self.group_id} User Call Statistics - 2024-01-01 to 2024-01-31.csv",
+            ),
+            newline="",
+        ) as file:
+            rows = list(csv.DictReader(file))
+
+        self.assertEqual(
+            [row["userId"] for row in rows],
+            self.enterprise.members[self.group_id]["users"],
+        )
+        self.assertIn("0", [row["total"] for row in rows])
+        self.assertEqual(
+            self.server.metrics()["paths"]["GET /users/call-records/stats"], 50
+        )
+
+    async def test_scripts_run_concurrently(self):
+        """Scripts await every endpoint so several run side by side on one loop"""
+        scripter = Scripter(self.api)
+
+        audit, capacity, extension = await asyncio.gather(
+            scripter.group_audit(service_provider_id="ent1", group_id=self.group_id),
+            scripter.service_provider_trunking_capacity(service_provider_id="ent1"),
+            scripter.locate_free_extension(
+                service_provider_id="ent1",
+                group_id=self.group_id,
+                range_start=1000,
+                range_end=9999,
+            ),
+        )
+
+        self.assertEqual(audit["groupDetail"]["groupId"], self.group_id)
+        self.assertEqual(len(capacity["groups"]), 2)
+        self.assertIn("extension", extension)
+
+    async def test_rate_limit(self):
+        """Requests over the server rate limit get 429 with Retry-After"""
+        server = MockOdin(self.enterprise, rate_limit=1, burst=2, retry_after=3)
+        async with httpx.AsyncClient(transport=server.transport()) as client:
+            statuses = [
+                (await client.get("https://odin.test/api/v2/groups")).status_code
+                for _ in range(3)
+            ]
+            throttled = await client.get("https://odin.test/api/v2/groups")
+
+        self.assertEqual(statuses, [200, 200, 429])
+        self.assertEqual(throttled.headers["Retry-After"], "3")
+
+    async def test_asgi(self):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.server)
+        ) as client:
+            response = await client.get(
+                "http://mock/api/v2/groups", params={"serviceProviderId": "ent1"}
+            )
+        self.assertEqual(len(response.json()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import time
+import unittest
+
+from odins_spear.utils.rate_limiter import AdaptiveRateLimiter, TokenBucket
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the asyncio token bucket shapes throughput without blocking the event loop.
+    """
+
+    async def test_burst_is_immediate(self):
+        """Requests up to the burst size are not delayed"""
+        bucket = TokenBucket(rate=1, burst=3)
+
+        waits = [await bucket.acquire() for _ in range(3)]
+
+        self.assertTrue(all(wait < 0.05 for wait in waits))
+
+    async def test_rate_is_enforced(self):
+        """Requests over the burst size wait for the bucket to refill"""
+        bucket = TokenBucket(rate=20, burst=1)
+
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+        # first token is free, remaining 4 refill at 20/s
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+
+    async def test_event_loop_not_blocked(self):
+        """Other tasks keep running while requests wait on the bucket"""
+        bucket = TokenBucket(rate=10, burst=1)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(ticker(), *(bucket.acquire() for _ in range(3)))
+
+        self.assertEqual(len(ticks), 5)
+        self.assertLess(ticks[-1] - ticks[0], 0.15)
+
+    def test_invalid_configuration(self):
+        """Rate and burst are validated"""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(burst=0)
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    """
+    Test the adaptive limiter raises its rate additively and cuts it multiplicatively.
+    """
+
+    def test_increase_while_healthy(self):
+        """Each healthy window adds increase_step"""
+        limiter = AdaptiveRateLimiter(rate=5, window=5, max_rate=7, cooldown=0)
+
+        for _ in range(15):
+            limiter.record(200, 0.1)
+
+        self.assertEqual(limiter.rate, 7)
+        self.assertEqual(limiter.increases, 2)
+
+    def test_decrease_on_429(self):
+        """429 halves the rate once per cooldown"""
+        limiter = AdaptiveRateLimiter(rate=40, min_rate=2, cooldown=60)
+
+        limiter.record(429, 0.1)
+        limiter.record(429, 0.1)
+
+        self.assertEqual(limiter.rate, 20)
+
+        limiter.cooldown = 0
+        for _ in range(10):
+            limiter.record(503, 0.1)
+
+        self.assertEqual(limiter.rate, 2)
+
+    def test_decrease_on_latency_spike(self):
+        """p95 latency over tolerance x baseline cuts the rate"""
+        limiter = AdaptiveRateLimiter(rate=10, window=10, cooldown=0)
+
+        for _ in range(10):
+            limiter.record(200, 0.1)
+        self.assertEqual(limiter.rate, 11)
+
+        for _ in range(10):
+            limiter.record(200, 0.5)
+
+        self.assertEqual(limiter.rate, 5.5)
+        self.assertEqual(limiter.metrics()["p95"], 0.5)
+
+    def test_errors_count_as_overload(self):
+        """Requests that raised (None status) cut the rate"""
+        limiter = AdaptiveRateLimiter(rate=10, cooldown=0)
+
+        limiter.record(None, 5.0)
+
+        self.assertEqual(limiter.rate, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import asyncio
+import inspect
+import subprocess
+import sys
+import unittest
+
+import httpx
+
+from odins_spear import API
+from odins_spear.exceptions import OSApiResponseError
+from odins_spear.endpoints.registry import (
+    ENDPOINTS,
+    EndpointPolicy,
+    RouteTable,
+    load_endpoint,
+)
+from odins_spear.utils import ResponseCache, RetryPolicy, request_priority
+
+from .test_requester import build_requester
+
+
+class TestRouteTable(unittest.TestCase):
+    """
+    Test the generated routes match the endpoint classes and policies are looked up.
+    """
+
+    def test_routes_match_endpoint_methods(self):
+        """Every endpoint method has a route and every route a method"""
+        table = RouteTable()
+        routes = {(route.endpoint, route.name) for route in table.routes}
+
+        methods = set()
+        for attribute in ENDPOINTS:
+            for name, _ in inspect.getmembers(
+                load_endpoint(attribute), inspect.iscoroutinefunction
+            ):
+                methods.add((attribute, name))
+
+        self.assertEqual(routes, methods)
+
+    def test_policies(self):
+        """Defaults are kept, overrides are applied and unknown routes rejected"""
+        table = RouteTable(policies={"get /service-providers": {"cache_ttl": 300}})
+
+        self.assertEqual(table.policy_for("GET", "/service-providers?").cache_ttl, 300)
+        self.assertEqual(
+            table.policy_for("GET", "/users/registration/bulk"),
+            EndpointPolicy(priority="bulk"),
+        )
+        self.assertIsNone(table.policy_for("GET", "/groups"))
+        self.assertEqual(
+            table.policy_for("GET", "/password/generate"),
+            EndpointPolicy(cache_ttl=0, idempotent=False),
+        )
+
+        with self.assertRaises(ValueError):
+            RouteTable(policies={"GET /nowhere": {"cache_ttl": 300}})
+
+
+class TestLazyEndpoints(unittest.TestCase):
+    """
+    Test endpoints, scripts and reports are only imported once used.
+    """
+
+    def test_imported_on_first_use(self):
+        """Nothing is imported until an endpoint is used, then it is kept"""
+        code = (
+            "import sys\n"
+            "from odins_spear import API\n"
+            "from odins_spear.endpoints.registry import ENDPOINTS\n"
+            "modules = {f'odins_spear.endpoints.{m}' for m, _ in ENDPOINTS.values()}\n"
+            "api = API('https://odin.test/api/v2', 'user', 'password')\n"
+            "print(sorted(modules & set(sys.modules)), 'pandas' in sys.modules)\n"
+            "print(api.users is api.users, sorted(modules & set(sys.modules)))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.splitlines()
+
+        self.assertEqual(output, ["[] False", "True ['odins_spear.endpoints.users']"])
+
+    def test_api_attributes(self):
+        """Endpoints share the API's requester, unknown attributes still raise"""
+        api = API("https://odin.test/api/v2", "user", "password")
+
+        self.assertIn("call_centers", dir(api))
+        self.assertIs(api.call_centers._requester, api._requester)
+        with self.assertRaises(AttributeError):
+            api.not_an_endpoint
+
+
+class TestRequesterPolicies(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the requester applies each route's cache TTL, idempotency and lane.
+    """
+
+    async def test_idempotent_post_retried(self):
+        """A POST marked idempotent is retried, a GET marked not idempotent is not"""
+        statuses = [503, 200, 503]
+
+        def handler(request):
+            return httpx.Response(
+                statuses.pop(0), json={"details": "", "status": 503, "error": ""}
+            )
+
+        requester = build_requester(
+            handler,
+            retry_policy=RetryPolicy(backoff_factor=0.001, jitter=False),
+            routes=RouteTable(
+                policies={
+                    "POST /groups/dns/unassign/bulk": {"idempotent": True},
+                    "GET /groups": {"idempotent": False},
+                }
+            ),
+        )
+
+        await requester.post("/groups/dns/unassign/bulk", data={})
+        with self.assertRaises(OSApiResponseError):
+            await requester.get("/groups")
+        self.assertEqual(statuses, [])
+
+    async def test_generate_not_coalesced(self):
+        """Concurrent generate GETs are each sent, so callers get their own value"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"password": str(len(requests))})
+
+        requester = build_requester(
+            handler, response_cache=ResponseCache(default_ttl=60)
+        )
+
+        first, second = await asyncio.gather(
+            requester.get("/password/generate"), requester.get("/password/generate")
+        )
+
+        self.assertEqual(len(requests), 2)
+        self.assertNotEqual(first, second)
+        self.assertEqual(requester.coalesced_requests, 0)
+
+    async def test_cache_ttl(self):
+        """A route with a cache TTL is cached without the cache listing it"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=[])
+
+        requester = build_requester(
+            handler,
+            response_cache=ResponseCache(),
+            routes=RouteTable(policies={"GET /service-providers": {"cache_ttl": 60}}),
+        )
+
+        await requester.get("/service-providers")
+        await requester.get("/service-providers")
+        await requester.get("/groups")
+        await requester.get("/groups")
+
+        self.assertEqual(len(requests), 3)
+
+    async def test_priority(self):
+        """A route's lane is used unless the caller picked one"""
+
+        def handler(request):
+            return httpx.Response(200, json=[])
+
+        requester = build_requester(handler)
+
+        await requester.get("/users/registration/bulk")
+        with request_priority("interactive"):
+            await requester.get("/users/registration/bulk")
+
+        lanes = requester.scheduler.metrics()["lanes"]
+        self.assertEqual(lanes["bulk"]["completed"], 1)
+        self.assertEqual(lanes["interactive"]["completed"], 1)
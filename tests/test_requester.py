@@ -0,0 +1,492 @@
+import asyncio
+import logging
+import unittest
+from unittest import mock
+
+import httpx
+
+from odins_spear.exceptions import OSApiResponseError, OSCircuitOpenError
+from odins_spear.requester import Requester
+from odins_spear.utils.cache import ResponseCache
+from odins_spear.utils.circuit_breaker import CircuitBreaker
+from odins_spear.utils.codec import JSONCodec, get_codec
+from odins_spear.utils.hedge import HedgePolicy
+from odins_spear.utils.metrics import MetricsCollector
+from odins_spear.utils.retry import RetryPolicy, parse_retry_after
+
+
+def build_requester(handler, **kwargs):
+    """Builds a requester that sends requests to handler instead of Odin."""
+    requester = Requester(
+        "https://odin.test/api/v2", False, logging.getLogger("OS.test"), **kwargs
+    )
+    requester.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return requester
+
+
+class TestRequesterRetry(unittest.IsolatedAsyncioTestCase):
+    """
+    Test failed requests are retried centrally by the requester.
+    """
+
+    fast_retry = RetryPolicy(max_retries=3, backoff_factor=0.001, jitter=False)
+
+    async def test_retries_server_errors(self):
+        """GET is retried on 503 until it succeeds"""
+        statuses = [503, 502, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={"ok": True})
+
+        requester = build_requester(handler, retry_policy=self.fast_retry)
+
+        self.assertEqual(await requester.get("/groups"), {"ok": True})
+        self.assertEqual(statuses, [])
+
+    async def test_gives_up_after_max_retries(self):
+        """Last error is raised once retries are used up"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"details": "", "status": 500, "error": ""})
+
+        requester = build_requester(handler, retry_policy=self.fast_retry)
+
+        with self.assertRaises(OSApiResponseError):
+            await requester.get("/groups")
+        self.assertEqual(len(calls), 4)
+
+    async def test_post_not_retried(self):
+        """Non-idempotent methods are not retried once sent"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, text="Service Unavailable")
+
+        requester = build_requester(handler, retry_policy=self.fast_retry)
+
+        with self.assertRaises(OSApiResponseError):
+            await requester.post("/groups", data={"groupId": "grp1"})
+        self.assertEqual(len(calls), 1)
+
+    async def test_connect_errors_retried_for_post(self):
+        """Errors raised before the request is sent are retried for every method"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={})
+
+        requester = build_requester(handler, retry_policy=self.fast_retry)
+
+        self.assertEqual(await requester.post("/groups", data={}), {})
+        self.assertEqual(len(calls), 2)
+
+    async def test_retry_disabled_per_call(self):
+        """retry=False sends the request once"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, text="Too Many Requests")
+
+        requester = build_requester(handler, retry_policy=self.fast_retry)
+
+        with self.assertRaises(OSApiResponseError):
+            await requester.get("/groups", retry=False)
+        self.assertEqual(len(calls), 1)
+
+
+class TestRequesterCoalescing(unittest.IsolatedAsyncioTestCase):
+    """
+    Test identical GETs in flight at the same time share one request.
+    """
+
+    def setUp(self):
+        self.calls = []
+
+        async def handler(request):
+            self.calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200, json={"userId": request.url.params.get("userId")}
+            )
+
+        self.requester = build_requester(handler)
+
+    async def test_identical_gets_coalesced(self):
+        """Concurrent identical GETs send one request and share the result"""
+        results = await asyncio.gather(
+            self.requester.get("/users", params={"userId": "a", "extended": True}),
+            self.requester.get("/users?", params={"extended": True, "userId": "a"}),
+            self.requester.get("/users", params={"userId": "a", "extended": True}),
+        )
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(self.requester.coalesced_requests, 2)
+
+    async def test_different_params_not_coalesced(self):
+        """GETs with different params are sent separately"""
+        await asyncio.gather(
+            self.requester.get("/users", params={"userId": "a"}),
+            self.requester.get("/users", params={"userId": "b"}),
+        )
+
+        self.assertEqual(len(self.calls), 2)
+
+    async def test_sequential_gets_not_coalesced(self):
+        """Only requests in flight are shared, later GETs are sent again"""
+        await self.requester.get("/users", params={"userId": "a"})
+        await self.requester.get("/users", params={"userId": "a"})
+
+        self.assertEqual(len(self.calls), 2)
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Cancelling one caller leaves the shared request running"""
+        first = asyncio.ensure_future(
+            self.requester.get("/users", params={"userId": "a"})
+        )
+        second = asyncio.ensure_future(
+            self.requester.get("/users", params={"userId": "a"})
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, {"userId": "a"})
+        self.assertEqual(len(self.calls), 1)
+
+
+class TestRequesterCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Test GET responses are served from the cache until a write invalidates them.
+    """
+
+    async def test_cache_hit_and_invalidation(self):
+        """Repeat reads use the cache, a PUT to the same path forces a new request"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(200, json={"groupId": "grp1"})
+
+        requester = build_requester(
+            handler, response_cache=ResponseCache(ttls={"/groups": 60})
+        )
+
+        first = await requester.get("/groups", params={"groupId": "grp1"})
+        second = await requester.get("/groups", params={"groupId": "grp1"})
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(calls, ["GET"])
+
+        await requester.put("/groups", data={"groupId": "grp1"})
+        await requester.get("/groups", params={"groupId": "grp1"})
+        await requester.get("/groups", params={"groupId": "grp1"}, cache=False)
+
+        self.assertEqual(calls, ["GET", "PUT", "GET", "GET"])
+        self.assertEqual(requester.cache.metrics()["hits"], 1)
+
+    async def test_generated_values_never_cached(self):
+        """Generate and session GETs are sent every time even under default_ttl"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"password": str(len(calls))})
+
+        requester = build_requester(
+            handler, response_cache=ResponseCache(ttls={"/": 60}, default_ttl=60)
+        )
+
+        for endpoint in ("/password/generate", "/passcode/generate", "/auth/session"):
+            first = await requester.get(endpoint)
+            second = await requester.get(endpoint)
+            self.assertNotEqual(first, second)
+
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(requester.cache.metrics()["entries"], 0)
+
+
+class TestRequesterCodec(unittest.IsolatedAsyncioTestCase):
+    """
+    Test request and response bodies go through the codec exactly once.
+    """
+
+    async def test_bodies_encoded_and_decoded_once(self):
+        """A write encodes its body once and decodes the response once"""
+        calls = {"dumps": 0, "loads": 0}
+        stdlib = get_codec("json")
+
+        def dumps(obj):
+            calls["dumps"] += 1
+            return stdlib.dumps(obj)
+
+        def loads(body):
+            calls["loads"] += 1
+            return stdlib.loads(body)
+
+        def handler(request):
+            return httpx.Response(200, content=request.content)
+
+        requester = build_requester(
+            handler, json_codec=JSONCodec(name="counting", dumps=dumps, loads=loads)
+        )
+        requester.logger.setLevel(logging.DEBUG)
+
+        result = await requester.post("/users", data={"userId": "jdoe"})
+
+        self.assertEqual(result, {"userId": "jdoe"})
+        self.assertEqual(calls, {"dumps": 1, "loads": 1})
+
+
+class TestRequesterLogging(unittest.IsolatedAsyncioTestCase):
+    """
+    Test request and response bodies are only sanitised when debug logs are enabled.
+    """
+
+    async def test_bodies_not_sanitised_above_debug(self):
+        """Nothing is sanitised at ERROR, both bodies are at DEBUG"""
+
+        def handler(request):
+            return httpx.Response(200, json={"token": "secret"})
+
+        requester = build_requester(handler)
+
+        with mock.patch(
+            "odins_spear.requester.sanitise_data", wraps=lambda data: data
+        ) as sanitise:
+            requester.logger.setLevel(logging.ERROR)
+            await requester.post("/session", data={"password": "secret"})
+            self.assertEqual(sanitise.call_count, 0)
+
+            requester.logger.setLevel(logging.DEBUG)
+            await requester.post("/session", data={"password": "secret"})
+            self.assertEqual(sanitise.call_count, 2)
+
+
+class TestRequesterHedging(unittest.IsolatedAsyncioTestCase):
+    """
+    Test slow GETs are raced against a duplicate within the hedge budget.
+    """
+
+    def setUp(self):
+        self.calls = 0
+        self.slow_calls = {1}
+
+        async def handler(request):
+            self.calls += 1
+            await asyncio.sleep(0.2 if self.calls in self.slow_calls else 0.001)
+            return httpx.Response(200, json={"call": self.calls})
+
+        self.handler = handler
+
+    async def test_slow_get_hedged(self):
+        """A GET slower than the hedge delay is answered by the duplicate"""
+        policy = HedgePolicy(initial_delay=0.02, min_delay=0.01, budget=1)
+        requester = build_requester(self.handler, hedge_policy=policy)
+
+        result = await asyncio.wait_for(requester.get("/users"), 0.1)
+
+        self.assertEqual(result, {"call": 2})
+        self.assertEqual(policy.metrics()["hedge_wins"], 1)
+
+        # the cancelled primary is recorded too, at least as long as it waited
+        latencies = sorted(policy._latencies["/users"])
+        self.assertEqual(len(latencies), 2)
+        self.assertGreaterEqual(latencies[1], 0.02)
+
+    async def test_hedge_needs_free_slot(self):
+        """No duplicate is sent when the scheduler has no slot free for it"""
+        policy = HedgePolicy(initial_delay=0.02, min_delay=0.01, budget=1)
+        requester = build_requester(
+            self.handler, hedge_policy=policy, max_concurrent_requests=1
+        )
+
+        result = await requester.get("/users")
+
+        self.assertEqual(result, {"call": 1})
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(policy.metrics()["no_slot"], 1)
+        self.assertEqual(policy.metrics()["hedges"], 0)
+
+    async def test_budget_bounds_hedges(self):
+        """No hedge is sent once the budget is spent"""
+        policy = HedgePolicy(initial_delay=0.02, min_delay=0.01, budget=0.5)
+        self.slow_calls = {1, 2}
+        requester = build_requester(self.handler, hedge_policy=policy)
+
+        await requester.get("/users")
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(policy.metrics()["denied"], 1)
+
+    async def test_only_listed_endpoints_hedged(self):
+        """GETs outside the policy endpoints and writes are never hedged"""
+        policy = HedgePolicy(endpoints=["/users/registration/bulk"], initial_delay=0)
+
+        self.assertTrue(policy.applies_to("/users/registration/bulk"))
+        self.assertFalse(policy.applies_to("/users"))
+
+    def test_delay_from_recent_latency(self):
+        """Delay is the percentile of recent latencies once enough are recorded"""
+        policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0)
+        for latency in range(1, 11):
+            policy.record("/groups/dns/details", latency / 10)
+
+        self.assertEqual(policy.delay("/groups/dns/details"), 1.0)
+        self.assertIsNone(policy.delay("/groups"))
+
+
+class TestRequesterCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    """
+    Test requests to a failing endpoint fail fast until a trial request succeeds.
+    """
+
+    def setUp(self):
+        self.calls = []
+        self.healthy = False
+
+        async def handler(request):
+            self.calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            if request.url.path.endswith("/call-centers") and not self.healthy:
+                return httpx.Response(500, text="Internal Server Error")
+            return httpx.Response(200, json={})
+
+        self.breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0.05)
+        self.requester = build_requester(
+            handler,
+            retry_policy=RetryPolicy(max_retries=0),
+            circuit_breaker=self.breaker,
+        )
+
+    async def test_opens_and_fails_fast(self):
+        """Once open requests raise without reaching Odin, other endpoints still work"""
+        for _ in range(3):
+            with self.assertRaises(OSApiResponseError):
+                await self.requester.get("/groups/call-centers")
+
+        with self.assertRaises(OSCircuitOpenError):
+            await self.requester.get("/groups/call-centers")
+        await self.requester.get("/groups/hunt-groups")
+
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(self.breaker.state("/groups/call-centers"), "open")
+        self.assertEqual(self.breaker.metrics()["rejected"], 1)
+
+    async def test_half_open_trial_closes(self):
+        """After the recovery timeout one trial is let through and closes the circuit"""
+        for _ in range(3):
+            with self.assertRaises(OSApiResponseError):
+                await self.requester.get("/groups/call-centers")
+        await asyncio.sleep(0.06)
+        self.healthy = True
+
+        results = await asyncio.gather(
+            self.requester.get("/groups/call-centers", params={"n": 1}),
+            self.requester.get("/groups/call-centers", params={"n": 2}),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(results[0], {})
+        self.assertIsInstance(results[1], OSCircuitOpenError)
+        self.assertEqual(self.breaker.state("/groups/call-centers"), "closed")
+
+
+class TestRequesterHooks(unittest.IsolatedAsyncioTestCase):
+    """
+    Test hooks and metrics see every request sent.
+    """
+
+    async def test_hooks_called(self):
+        """before_request can add headers, after_response and on_error are called"""
+        seen = []
+        failures = [httpx.ConnectError("refused")]
+
+        def handler(request):
+            if failures:
+                raise failures.pop()
+            seen.append(request.headers["X-Correlation-Id"])
+            return httpx.Response(200, json={"ok": True})
+
+        events = []
+
+        def before(request):
+            request.headers["X-Correlation-Id"] = "abc"
+
+        async def after(request, response, elapsed):
+            events.append(("after", response.status_code))
+
+        def broken(request, error):
+            events.append(("error", type(error).__name__))
+            raise RuntimeError("hook bug")
+
+        requester = build_requester(
+            handler,
+            retry_policy=RetryPolicy(max_retries=1, backoff_factor=0.001, jitter=False),
+            hooks={"before_request": [before], "on_error": [broken]},
+        )
+        requester.add_hook("after_response", after)
+
+        with self.assertLogs("OS.test", logging.ERROR):
+            self.assertEqual(await requester.get("/groups"), {"ok": True})
+        self.assertEqual(seen, ["abc"])
+        self.assertEqual(events, [("error", "ConnectError"), ("after", 200)])
+
+        with self.assertRaises(ValueError):
+            requester.add_hook("on_retry", after)
+
+    async def test_metrics_recorded(self):
+        """Responses, bytes and waits are recorded per endpoint"""
+
+        def handler(request):
+            return httpx.Response(200, content=b'{"ok":true}')
+
+        metrics = MetricsCollector()
+        requester = build_requester(handler, metrics=metrics)
+        await requester.put("/users", data={"a": 1})
+        await requester.get("/groups", params={"x": 1})
+
+        snapshot = metrics.to_dict()
+        self.assertEqual(snapshot["endpoints"]["PUT /users"]["bytes_out"], 7)
+        self.assertEqual(snapshot["endpoints"]["GET /groups"]["bytes_in"], 11)
+        self.assertEqual(snapshot["endpoints"]["GET /groups"]["statuses"], {200: 1})
+        self.assertEqual(snapshot["waits"]["scheduler"]["count"], 2)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """
+    Test backoff delays and Retry-After handling.
+    """
+
+    def test_exponential_backoff(self):
+        """Delay doubles each attempt up to max_backoff"""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        self.assertEqual([policy.backoff(n) for n in range(4)], [1, 2, 4, 5])
+
+    def test_jitter_bounds(self):
+        """Jittered delay is between 0 and the backoff"""
+        policy = RetryPolicy(backoff_factor=1)
+
+        for _ in range(20):
+            self.assertTrue(0 <= policy.backoff(2) <= 4)
+
+    def test_retry_after(self):
+        """Retry-After overrides the backoff"""
+        policy = RetryPolicy(max_backoff=10)
+        response = httpx.Response(429, headers={"Retry-After": "3"})
+
+        self.assertEqual(policy.backoff(0, response), 3)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
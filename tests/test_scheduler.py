@@ -0,0 +1,197 @@
+import asyncio
+import unittest
+
+from odins_spear import API
+from odins_spear.utils.scheduler import RequestScheduler, request_priority
+
+
+class TestRequestScheduler(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the scheduler caps requests in flight globally and per endpoint prefix.
+    """
+
+    async def _run(self, scheduler, endpoints):
+        peak = {"global": 0}
+
+        async def request(endpoint):
+            async with scheduler.slot(endpoint):
+                peak["global"] = max(peak["global"], scheduler.in_flight)
+                prefix = scheduler.match_prefix(endpoint)
+                if prefix is not None:
+                    in_flight = scheduler.metrics()["endpoints"][prefix]["in_flight"]
+                    peak[prefix] = max(peak.get(prefix, 0), in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(request(endpoint) for endpoint in endpoints))
+        return peak
+
+    async def test_global_limit(self):
+        """No more than max_in_flight requests run at once"""
+        scheduler = RequestScheduler(max_in_flight=3)
+
+        peak = await self._run(scheduler, ["/users"] * 20)
+
+        self.assertEqual(peak["global"], 3)
+        self.assertEqual(scheduler.completed, 20)
+        self.assertGreater(scheduler.max_queued, 0)
+        self.assertEqual(scheduler.in_flight, 0)
+        self.assertEqual(scheduler.queued, 0)
+
+    async def test_prefix_limit(self):
+        """Longest matching prefix limit applies on top of the global limit"""
+        scheduler = RequestScheduler(
+            max_in_flight=10,
+            endpoint_limits={"/groups": 4, "/groups/call-centers/*": 1},
+        )
+
+        peak = await self._run(
+            scheduler,
+            ["/groups/call-centers"] * 5 + ["/groups/hunt-groups"] * 8 + ["/users"] * 5,
+        )
+
+        self.assertEqual(peak["/groups/call-centers"], 1)
+        self.assertEqual(peak["/groups"], 4)
+        self.assertLessEqual(peak["global"], 10)
+
+    def test_match_prefix(self):
+        """Prefixes match the path and paths below it only"""
+        scheduler = RequestScheduler(endpoint_limits={"/users/*": 1, "/users/ids": 1})
+
+        self.assertEqual(scheduler.match_prefix("/users"), "/users")
+        self.assertEqual(scheduler.match_prefix("/users?"), "/users")
+        self.assertEqual(scheduler.match_prefix("/users/passwords"), "/users")
+        self.assertEqual(scheduler.match_prefix("/users/ids/bulk"), "/users/ids")
+        self.assertIsNone(scheduler.match_prefix("/user-reports"))
+
+    async def test_try_slot(self):
+        """try_slot holds a free slot at once and never queues for a busy one"""
+        scheduler = RequestScheduler(max_in_flight=2, endpoint_limits={"/users": 1})
+
+        async with scheduler.try_slot("/users") as first:
+            async with scheduler.try_slot("/users") as second:
+                self.assertTrue(first)
+                self.assertFalse(second)
+                async with scheduler.try_slot("/groups") as third:
+                    self.assertTrue(third)
+                    self.assertEqual(scheduler.in_flight, 2)
+                    async with scheduler.try_slot("/groups") as fourth:
+                        self.assertFalse(fourth)
+
+        self.assertEqual(scheduler.in_flight, 0)
+        self.assertEqual(scheduler.completed, 2)
+
+    async def test_unlimited(self):
+        """None disables the global cap"""
+        scheduler = RequestScheduler(max_in_flight=None)
+
+        peak = await self._run(scheduler, ["/users"] * 50)
+
+        self.assertEqual(peak["global"], 50)
+
+
+class TestPriorityLanes(unittest.IsolatedAsyncioTestCase):
+    """
+    Test queued requests are granted slots by weighted fair queuing across lanes.
+    """
+
+    async def _order(self, scheduler, lanes, admit=None):
+        """Queues a request per lane behind a held slot, returns the order they ran in."""
+        order = []
+
+        async def request(n, lane):
+            async with scheduler.slot("/users", lane, admit):
+                order.append((n, lane))
+                await asyncio.sleep(0)
+
+        async with scheduler.slot("/users"):
+            tasks = [
+                asyncio.ensure_future(request(n, lane)) for n, lane in enumerate(lanes)
+            ]
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+        return order
+
+    async def test_interactive_overtakes_bulk(self):
+        """Interactive requests queued behind bulk ones are sent first"""
+        scheduler = RequestScheduler(max_in_flight=1)
+
+        order = await self._order(scheduler, ["bulk"] * 10 + ["interactive"] * 3)
+
+        self.assertEqual([lane for _, lane in order[:3]], ["interactive"] * 3)
+        self.assertEqual(scheduler.metrics()["lanes"]["bulk"]["completed"], 10)
+
+    async def test_bulk_not_starved(self):
+        """Bulk still gets its weighted share while interactive is backlogged"""
+        scheduler = RequestScheduler(
+            max_in_flight=1, lane_weights={"interactive": 3, "normal": 2, "bulk": 1}
+        )
+
+        order = await self._order(scheduler, ["interactive"] * 12 + ["bulk"] * 4)
+
+        self.assertEqual([lane for _, lane in order[:8]].count("bulk"), 2)
+
+    async def test_partial_weights(self):
+        """Weights given are applied over the defaults, invalid weights are rejected"""
+        api = API(
+            "https://odin.test/api/v2", "user", "password", priority_weights={"bulk": 2}
+        )
+        scheduler = api._requester.scheduler
+
+        self.assertEqual(
+            scheduler.lane_weights, {"interactive": 8, "normal": 4, "bulk": 2}
+        )
+        async with scheduler.slot("/users", "interactive"):
+            pass
+        self.assertEqual(scheduler.metrics()["lanes"]["interactive"]["completed"], 1)
+        await api.aclose()
+
+        for weight in (0, -1, 1.5, "2", True):
+            with self.assertRaises(ValueError):
+                RequestScheduler(lane_weights={"normal": weight})
+
+    async def test_admit_runs_in_priority_order(self):
+        """Admit steps run one at a time so lanes apply under the rate limit too"""
+        scheduler = RequestScheduler(max_in_flight=None)
+
+        async def admit():
+            await asyncio.sleep(0.001)
+
+        order = await self._order(scheduler, ["bulk"] * 5 + ["interactive"], admit)
+
+        self.assertLessEqual([lane for _, lane in order].index("interactive"), 1, order)
+
+    async def test_request_priority_context(self):
+        """request_priority sets the lane for requests made inside it"""
+        scheduler = RequestScheduler(max_in_flight=1)
+
+        with request_priority("bulk"):
+            async with scheduler.slot("/users"):
+                pass
+
+        self.assertEqual(scheduler.metrics()["lanes"]["bulk"]["completed"], 1)
+        with self.assertRaises(ValueError):
+            async with scheduler.slot("/users", "urgent"):
+                pass
+
+    async def test_cancelled_waiter(self):
+        """Cancelling a queued request leaves the queue usable"""
+        scheduler = RequestScheduler(max_in_flight=1)
+
+        async def request():
+            async with scheduler.slot("/users", "bulk"):
+                await asyncio.sleep(0)
+
+        async with scheduler.slot("/users"):
+            cancelled = asyncio.ensure_future(request())
+            waiting = asyncio.ensure_future(request())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+        await waiting
+
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(scheduler.metrics()["in_flight"], 0)
+        self.assertEqual(scheduler.metrics()["queued"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import concurrent.futures
+import threading
+import unittest
+
+from odins_spear import SyncAPI
+from odins_spear.testing import MockOdin, generate_enterprise
+from odins_spear.utils import request_priority
+from odins_spear.utils.scheduler import current_priority
+
+
+class TestSyncAPI(unittest.TestCase):
+    """
+    Test blocking code drives the async API through one background loop.
+    """
+
+    def setUp(self):
+        self.enterprise = generate_enterprise("small")
+        self.server = MockOdin(self.enterprise, latency=0.01)
+        self.api = SyncAPI(
+            "https://odin.test/api/v2",
+            "user",
+            "password",
+            transport=self.server.transport(),
+        )
+        self.group_id = self.enterprise.group_ids()[0]
+
+    def tearDown(self):
+        self.api.close()
+
+    def test_endpoints_return_results(self):
+        """Endpoints, API attributes and scripts are used without await"""
+        self.assertTrue(self.api.authenticate())
+
+        users = self.api.users.get_users("ent1", self.group_id)
+        group = self.api.groups.get_group("ent1", self.group_id)
+        streamed = list(self.api.users.get_users("ent1", self.group_id, stream=True))
+
+        self.assertEqual(len(users), 50)
+        self.assertEqual(group["groupId"], self.group_id)
+        self.assertEqual(streamed, users)
+        self.assertEqual(self.api.base_url, "https://odin.test/api/v2")
+
+        hunt_group = next(iter(self.enterprise.hunt_groups.values()))
+        alias = hunt_group["serviceInstanceProfile"]["aliases"][0].split("@")[0]
+        result = self.api.scripter.find_alias(
+            service_provider_id="ent1", group_id=self.group_id, alias=alias
+        )
+        self.assertEqual(result["type"], "HG")
+
+    def test_threads_share_one_loop(self):
+        """Calls from a thread pool run concurrently on the same loop and carry context"""
+        loops = set()
+
+        async def record():
+            loops.add(threading.current_thread().name)
+            return current_priority()
+
+        def work(index):
+            with request_priority("bulk"):
+                priority = self.api.run(record())
+            return self.api.groups.get_group("ent1", self.group_id), priority
+
+        with concurrent.futures.ThreadPoolExecutor(10) as pool:
+            results = list(pool.map(work, range(20)))
+
+        self.assertEqual(loops, {"odins-spear-loop"})
+        self.assertEqual({priority for _, priority in results}, {"bulk"})
+        self.assertTrue(all(group["groupId"] == self.group_id for group, _ in results))
+
+    def test_close(self):
+        """Closing stops the loop thread, later calls raise"""
+        self.api.close()
+        self.api.close()
+
+        with self.assertRaises(RuntimeError):
+            self.api.groups.get_group("ent1", self.group_id)
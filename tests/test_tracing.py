@@ -0,0 +1,102 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+
+from odins_spear import API, Scripter, scripts
+from odins_spear.utils.tracing import InMemorySpanExporter, Tracer, trace_span
+
+
+class TestTracer(unittest.TestCase):
+    """
+    Test spans nest and are exported when they end.
+    """
+
+    def test_nested_spans(self):
+        """Inner spans are children sharing the root's trace id"""
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter)
+
+        with tracer.span("root") as root:
+            with trace_span("phase", step=1) as phase:
+                pass
+
+        self.assertEqual([span.name for span in exporter.spans], ["phase", "root"])
+        self.assertIsNone(root.parent_id)
+        self.assertEqual(phase.parent_id, root.span_id)
+        self.assertEqual(phase.trace_id, root.trace_id)
+        self.assertEqual(phase.attributes, {"step": 1})
+        self.assertEqual(list(exporter.summary()), ["root", "phase"])
+
+    def test_error_recorded(self):
+        """A span ended by an exception is marked as an error"""
+        tracer = Tracer()
+
+        with self.assertRaises(KeyError):
+            with tracer.span("root"):
+                raise KeyError("missing")
+
+        span = tracer.exporter.spans[0]
+        self.assertEqual(span.status, "error")
+        self.assertIn("missing", span.error)
+
+    def test_trace_span_outside_trace(self):
+        """trace_span does nothing without an open span"""
+        with trace_span("phase") as span:
+            self.assertIsNone(span)
+
+    def test_broken_exporter_ignored(self):
+        def exporter(span):
+            raise RuntimeError("exporter down")
+
+        tracer = Tracer(exporter)
+        with tracer.span("root"):
+            pass
+        self.assertEqual(tracer.export_errors, 1)
+
+
+class TestScriptTracing(unittest.IsolatedAsyncioTestCase):
+    """
+    Test a script run is a root span with a child span per endpoint call.
+    """
+
+    async def test_script_and_endpoint_spans(self):
+        def handler(request):
+            status = 404 if request.url.path.endswith("/missing") else 200
+            return httpx.Response(status, json={"ok": True})
+
+        tracer = Tracer()
+        api = API("https://odin.test/api/v2", "user", "password", tracer=tracer)
+        api._requester.client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+
+        async def fake_script(api):
+            # calls in concurrent tasks are still children of the script span
+            await asyncio.gather(
+                api._requester.get("/groups"), api._requester.get("/users")
+            )
+            with trace_span("lookup"):
+                try:
+                    await api._requester.get("/missing")
+                except Exception:
+                    pass
+
+        with mock.patch.object(scripts, "fake_script", fake_script, create=True):
+            await Scripter(api)._run_script("fake_script", 0)
+        await api.aclose()
+
+        spans = {span.name: span for span in tracer.exporter.spans}
+        root = spans["script fake_script"]
+        self.assertIsNone(root.parent_id)
+        self.assertEqual(spans["GET /groups"].parent_id, root.span_id)
+        self.assertEqual(spans["GET /users"].parent_id, root.span_id)
+        self.assertEqual(spans["GET /groups"].attributes["status_code"], 200)
+        self.assertEqual(spans["GET /missing"].parent_id, spans["lookup"].span_id)
+        self.assertEqual(spans["GET /missing"].status, "error")
+        self.assertEqual(spans["GET /missing"].attributes["status_code"], 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,8 @@
+import ast
 import json
+import os
 import re
+import sys
 
 
 def parse_postman_collection(file_path, target_section_name):
@@ -175,6 +178,170 @@ def generate_class_code(section, class_name):
     return "\n".join(class_lines)
 
 
+def extract_route_details(item, endpoint_name):
+    """
+    Given a Postman endpoint (item), extract the route registered for it in
+    endpoints/routes.py: method, path, query parameter names and top level body keys.
+    """
+    details = extract_endpoint_details(item)
+    params = ()
+    if "NO PARAMS" not in details["params"]:
+        params = tuple(p.split(":")[0] for p in details["params"].split("&"))
+    try:
+        body = json.loads(details["body"]) if details["body"] else {}
+    except json.JSONDecodeError:
+        body = {}
+
+    return {
+        "endpoint": endpoint_name,
+        "name": f"{details['method'].lower()}_{safe_snake_case(details['name'])}",
+        "method": details["method"],
+        "path": details["endpoint"].rstrip("?"),
+        "params": params,
+        "body": tuple(body) if isinstance(body, dict) else (),
+    }
+
+
+def routes_from_postman_collection(file_path):
+    """Routes of every section in a Postman collection, sections become endpoints."""
+    with open(file_path, "r") as f:
+        collection = json.load(f)
+
+    return [
+        extract_route_details(item, safe_snake_case(section.get("name", "")))
+        for section in collection.get("item", [])
+        for item in section.get("item", [])
+    ]
+
+
+def _dict_keys(function, variable):
+    """String keys set on variable in function, by dict literal or subscript."""
+    keys = []
+    for node in ast.walk(function):
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if (
+                    isinstance(target, ast.Name)
+                    and target.id == variable
+                    and isinstance(node.value, ast.Dict)
+                ):
+                    keys += [
+                        key.value
+                        for key in node.value.keys
+                        if isinstance(key, ast.Constant)
+                    ]
+                elif (
+                    isinstance(target, ast.Subscript)
+                    and isinstance(target.value, ast.Name)
+                    and target.value.id == variable
+                    and isinstance(target.slice, ast.Constant)
+                ):
+                    keys.append(target.slice.value)
+    return tuple(dict.fromkeys(keys))
+
+
+def _route_from_method(function, endpoint_name):
+    path = None
+    call = None
+    for node in ast.walk(function):
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "endpoint"
+            and isinstance(node.value, ast.Constant)
+        ):
+            path = node.value.value
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Attribute)
+            and node.func.value.attr == "_requester"
+        ):
+            call = node
+    if path is None or call is None:
+        return None
+
+    arguments = {keyword.arg: keyword.value for keyword in call.keywords}
+    if len(call.args) > 1:
+        arguments.setdefault("data", call.args[1])
+    params, data = arguments.get("params"), arguments.get("data")
+
+    return {
+        "endpoint": endpoint_name,
+        "name": function.name,
+        "method": call.func.attr.upper(),
+        "path": path.rstrip("?"),
+        "params": _dict_keys(function, params.id)
+        if isinstance(params, ast.Name)
+        else (),
+        "body": _dict_keys(function, data.id) if isinstance(data, ast.Name) else (),
+    }
+
+
+def routes_from_endpoint_modules(endpoints_dir, endpoints):
+    """
+    Routes of the endpoint classes already in endpoints_dir, read from their source.
+    endpoints maps each API attribute to its (module, class) as in registry.ENDPOINTS.
+    """
+    routes = []
+    for endpoint_name, (module_name, class_name) in endpoints.items():
+        with open(os.path.join(endpoints_dir, f"{module_name}.py"), "r") as f:
+            tree = ast.parse(f.read())
+        for node in tree.body:
+            if not (isinstance(node, ast.ClassDef) and node.name == class_name):
+                continue
+            for function in node.body:
+                if isinstance(function, ast.AsyncFunctionDef):
+                    route = _route_from_method(function, endpoint_name)
+                    if route is not None:
+                        routes.append(route)
+    return routes
+
+
+def generate_routes_code(routes):
+    """Build endpoints/routes.py listing every route."""
+
+    def literal(value):
+        if isinstance(value, tuple):
+            return (
+                "(" + "".join(f"{literal(item)}, " for item in value).rstrip(" ") + ")"
+            )
+        return json.dumps(value)
+
+    lines = [
+        "# Generated by utils/generate_endpoint.py, do not edit. Per route policies are",
+        "# kept in registry.POLICIES.",
+        "from .registry import Route",
+        "",
+        "# fmt: off",
+        "ROUTES = (",
+    ]
+    for route in routes:
+        fields = ("endpoint", "name", "method", "path", "params", "body")
+        lines.append(f"    Route({', '.join(literal(route[f]) for f in fields)}),")
+    lines += [")", "# fmt: on", ""]
+    return "\n".join(lines)
+
+
+def write_routes(source=None):
+    """
+    Regenerate src/odins_spear/endpoints/routes.py from a Postman collection, or from
+    the endpoint modules when no collection is given.
+    """
+    endpoints_dir = "./src/odins_spear/endpoints"
+    if source:
+        routes = routes_from_postman_collection(source)
+    else:
+        sys.path.insert(0, "./src")
+        from odins_spear.endpoints.registry import ENDPOINTS
+
+        routes = routes_from_endpoint_modules(endpoints_dir, ENDPOINTS)
+
+    with open(os.path.join(endpoints_dir, "routes.py"), "w") as file:
+        file.write(generate_routes_code(routes))
+    print(f"{len(routes)} routes written")
+
+
 class testingArgs:
     section = "Administatrators"
     class_name = "Administrators"
@@ -213,4 +380,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # python utils/generate_endpoint.py routes [collection.json]
+    if len(sys.argv) > 1 and sys.argv[1] == "routes":
+        write_routes(sys.argv[2] if len(sys.argv) > 2 else None)
+    else:
+        main()